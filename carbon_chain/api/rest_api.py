@@ -17,7 +17,7 @@ Endpoints:
 """
 
 from typing import Optional, List, Dict, Any
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Header, status
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 import time
@@ -859,8 +859,7 @@ async def get_multisig_balance(
         
         service = MultiSigService(blockchain, state.config)
         wallet = service.load_wallet(wallet_name)
-        balance = service.get_balance(wallet)
-        utxos = service.get_utxos(wallet)
+        balance, utxos = blockchain.get_address_state(wallet.get_address())
         
         return {
             "wallet_name": wallet_name,
@@ -922,6 +921,8 @@ async def sign_multisig_psbt(
 class CreateStealthWalletRequest(BaseModel):
     """Stealth wallet creation request"""
     wallet_name: str
+    password: Optional[str] = None
+    insecure_plaintext: bool = False
 
 
 class CreateStealthPaymentRequest(BaseModel):
@@ -940,7 +941,11 @@ async def create_stealth_wallet(
         from carbon_chain.services.stealth_service import StealthService
         
         service = StealthService(blockchain, state.config)
-        wallet = service.create_stealth_wallet(request.wallet_name)
+        wallet = service.create_stealth_wallet(
+            request.wallet_name,
+            request.password,
+            request.insecure_plaintext
+        )
         
         return {
             "wallet_name": request.wallet_name,
@@ -980,6 +985,8 @@ async def list_stealth_wallets(blockchain: Blockchain = Depends(get_blockchain))
 @app.get("/stealth/{wallet_name}/payments")
 async def get_stealth_payments(
     wallet_name: str,
+    insecure_plaintext: bool = False,
+    x_wallet_password: Optional[str] = Header(None),
     blockchain: Blockchain = Depends(get_blockchain)
 ):
     """Get received stealth payments"""
@@ -987,16 +994,15 @@ async def get_stealth_payments(
         from carbon_chain.services.stealth_service import StealthService
         
         service = StealthService(blockchain, state.config)
-        wallet = service.load_wallet(wallet_name)
-        
-        payments = service.get_received_payments(wallet)
+        wallet = service.load_wallet(wallet_name, x_wallet_password, insecure_plaintext)
         
-        total = sum(p["amount"] for p in payments)
+        columns = service.get_received_columns(wallet)
+        total = columns.total_amount()
         
         return {
             "wallet_name": wallet_name,
-            "payments": payments,
-            "count": len(payments),
+            "payments": columns.to_dicts(),
+            "count": len(columns),
             "total_amount_satoshi": total,
             "total_amount_coin": satoshi_to_coin(total)
         }
@@ -1166,6 +1172,8 @@ async def sign_psbt(
 class CreateStealthWalletRequest(BaseModel):
     """Stealth wallet creation request"""
     wallet_name: Optional[str] = None
+    password: Optional[str] = None
+    insecure_plaintext: bool = False
 
 
 class CreateStealthPaymentRequest(BaseModel):
@@ -1186,7 +1194,11 @@ async def create_stealth_wallet(
         from carbon_chain.services.stealth_service import StealthService
         
         service = StealthService(blockchain, state.config)
-        wallet = service.create_stealth_wallet(request.wallet_name)
+        wallet = service.create_stealth_wallet(
+            request.wallet_name,
+            request.password,
+            request.insecure_plaintext
+        )
         
         return {
             "stealth_address": wallet.get_address(),
@@ -1247,6 +1259,8 @@ async def create_stealth_payment(
 async def scan_stealth_payments(
     wallet_name: str,
     start_height: int = 0,
+    insecure_plaintext: bool = False,
+    x_wallet_password: Optional[str] = Header(None),
     blockchain: Blockchain = Depends(get_blockchain)
 ):
     """Scan blockchain for stealth payments"""
@@ -1254,7 +1268,7 @@ async def scan_stealth_payments(
         from carbon_chain.services.stealth_service import StealthService
         
         service = StealthService(blockchain, state.config)
-        wallet = service.load_wallet(wallet_name)
+        wallet = service.load_wallet(wallet_name, x_wallet_password, insecure_plaintext)
         
         # Scan blockchain
         payments = service.scan_for_payments(wallet, start_height)
@@ -862,24 +862,45 @@ app.add_typer(stealth_app, name="stealth")
 
 @stealth_app.command("create")
 def stealth_create(
-    wallet_name: str = typer.Option(..., "--name", help="Wallet name")
+    wallet_name: str = typer.Option(..., "--name", help="Wallet name"),
+    password: Optional[str] = typer.Option(
+        None,
+        "--password",
+        "-p",
+        help="Wallet password (private keys encrypted at rest)",
+        hide_input=True
+    ),
+    insecure_plaintext: bool = typer.Option(
+        False,
+        "--insecure-plaintext",
+        help="Allow plaintext private keys (not recommended)"
+    )
 ):
     """Create stealth address wallet"""
     if not state.blockchain:
         console.print("[red]Node not initialized.[/red]")
         raise typer.Exit(1)
     
+    # Prompt (input nascosto) invece di password in argv/history
+    if not password and not insecure_plaintext:
+        password = typer.prompt(
+            "Wallet password",
+            hide_input=True,
+            confirmation_prompt=True
+        )
+    
     try:
         from carbon_chain.services.stealth_service import StealthService
         
         service = StealthService(state.blockchain, state.config)
-        wallet = service.create_stealth_wallet(wallet_name)
+        wallet = service.create_stealth_wallet(wallet_name, password, insecure_plaintext)
+        stealth_address = wallet.get_stealth_address()
         
         console.print(Panel.fit(
             f"[green]✅ Stealth wallet created![/green]\n\n"
-            f"Address: [cyan]{wallet.get_address()}[/cyan]\n"
-            f"Scan Key: [dim]{wallet.stealth_address.scan_public_key.hex()[:32]}...[/dim]\n"
-            f"Spend Key: [dim]{wallet.stealth_address.spend_public_key.hex()[:32]}...[/dim]",
+            f"Address: [cyan]{stealth_address.to_meta_address()}[/cyan]\n"
+            f"Scan Key: [dim]{stealth_address.scan_pubkey.hex()[:32]}...[/dim]\n"
+            f"Spend Key: [dim]{stealth_address.spend_pubkey.hex()[:32]}...[/dim]",
             title="Stealth Wallet",
             border_style="green"
         ))
@@ -926,18 +947,37 @@ def stealth_list():
 def stealth_scan(
     wallet_name: str = typer.Option(..., "--name", help="Wallet name"),
     start_height: int = typer.Option(0, "--start", help="Start block height"),
-    end_height: Optional[int] = typer.Option(None, "--end", help="End block height")
+    end_height: Optional[int] = typer.Option(None, "--end", help="End block height"),
+    password: Optional[str] = typer.Option(
+        None,
+        "--password",
+        "-p",
+        help="Wallet password (private keys encrypted at rest)",
+        hide_input=True
+    ),
+    insecure_plaintext: bool = typer.Option(
+        False,
+        "--insecure-plaintext",
+        help="Allow plaintext private keys (not recommended)"
+    )
 ):
     """Scan for stealth payments"""
     if not state.blockchain:
         console.print("[red]Node not initialized.[/red]")
         raise typer.Exit(1)
     
+    # Prompt (input nascosto) invece di password in argv/history
+    if not password and not insecure_plaintext:
+        password = typer.prompt(
+            "Wallet password",
+            hide_input=True
+        )
+    
     try:
         from carbon_chain.services.stealth_service import StealthService
         
         service = StealthService(state.blockchain, state.config)
-        wallet = service.load_wallet(wallet_name)
+        wallet = service.load_wallet(wallet_name, password, insecure_plaintext)
         
         console.print(f"[cyan]Scanning blocks {start_height} to {end_height or 'latest'}...[/cyan]")
         
@@ -977,18 +1017,37 @@ def stealth_scan(
 
 @stealth_app.command("payments")
 def stealth_payments(
-    wallet_name: str = typer.Option(..., "--name", help="Wallet name")
+    wallet_name: str = typer.Option(..., "--name", help="Wallet name"),
+    password: Optional[str] = typer.Option(
+        None,
+        "--password",
+        "-p",
+        help="Wallet password (private keys encrypted at rest)",
+        hide_input=True
+    ),
+    insecure_plaintext: bool = typer.Option(
+        False,
+        "--insecure-plaintext",
+        help="Allow plaintext private keys (not recommended)"
+    )
 ):
     """Show received stealth payments"""
     if not state.blockchain:
         console.print("[red]Node not initialized.[/red]")
         raise typer.Exit(1)
     
+    # Prompt (input nascosto) invece di password in argv/history
+    if not password and not insecure_plaintext:
+        password = typer.prompt(
+            "Wallet password",
+            hide_input=True
+        )
+    
     try:
         from carbon_chain.services.stealth_service import StealthService
         
         service = StealthService(state.blockchain, state.config)
-        wallet = service.load_wallet(wallet_name)
+        wallet = service.load_wallet(wallet_name, password, insecure_plaintext)
         
         payments = service.get_received_payments(wallet)
         
@@ -1113,22 +1172,42 @@ app.add_typer(stealth_app, name="stealth")
 
 @stealth_app.command("create")
 def stealth_create(
-    wallet_name: str = typer.Option(..., "--name", help="Wallet name")
+    wallet_name: str = typer.Option(..., "--name", help="Wallet name"),
+    password: Optional[str] = typer.Option(
+        None,
+        "--password",
+        "-p",
+        help="Wallet password (private keys encrypted at rest)",
+        hide_input=True
+    ),
+    insecure_plaintext: bool = typer.Option(
+        False,
+        "--insecure-plaintext",
+        help="Allow plaintext private keys (not recommended)"
+    )
 ):
     """Create stealth wallet"""
     if not state.blockchain:
         console.print("[red]Node not initialized.[/red]")
         raise typer.Exit(1)
     
+    # Prompt (input nascosto) invece di password in argv/history
+    if not password and not insecure_plaintext:
+        password = typer.prompt(
+            "Wallet password",
+            hide_input=True,
+            confirmation_prompt=True
+        )
+    
     try:
         from carbon_chain.services.stealth_service import StealthService
         
         service = StealthService(state.blockchain, state.config)
-        wallet = service.create_stealth_wallet(wallet_name)
+        wallet = service.create_stealth_wallet(wallet_name, password, insecure_plaintext)
         
         console.print(Panel.fit(
             f"[green]✅ Stealth wallet created![/green]\n\n"
-            f"Address: [cyan]{wallet.get_address()}[/cyan]\n"
+            f"Address: [cyan]{wallet.get_stealth_address().to_meta_address()}[/cyan]\n"
             f"[yellow]⚠️  Share this address for private payments[/yellow]",
             title="Stealth Wallet",
             border_style="green"
@@ -1142,18 +1221,37 @@ def stealth_create(
 @stealth_app.command("scan")
 def stealth_scan(
     wallet_name: str = typer.Option(..., "--name", help="Wallet name"),
-    start_height: int = typer.Option(0, "--start", help="Start height")
+    start_height: int = typer.Option(0, "--start", help="Start height"),
+    password: Optional[str] = typer.Option(
+        None,
+        "--password",
+        "-p",
+        help="Wallet password (private keys encrypted at rest)",
+        hide_input=True
+    ),
+    insecure_plaintext: bool = typer.Option(
+        False,
+        "--insecure-plaintext",
+        help="Allow plaintext private keys (not recommended)"
+    )
 ):
     """Scan for stealth payments"""
     if not state.blockchain:
         console.print("[red]Node not initialized.[/red]")
         raise typer.Exit(1)
     
+    # Prompt (input nascosto) invece di password in argv/history
+    if not password and not insecure_plaintext:
+        password = typer.prompt(
+            "Wallet password",
+            hide_input=True
+        )
+    
     try:
         from carbon_chain.services.stealth_service import StealthService
         
         service = StealthService(state.blockchain, state.config)
-        wallet = service.load_wallet(wallet_name)
+        wallet = service.load_wallet(wallet_name, password, insecure_plaintext)
         
         console.print(f"[cyan]Scanning blockchain from height {start_height}...[/cyan]")
         
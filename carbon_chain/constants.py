@@ -233,6 +233,9 @@ SIGNATURE_CURVE: Final[str] = "secp256k1"
 # Tipo firma (per future upgrade post-quantum)
 SIGNATURE_TYPE: Final[str] = "ecdsa"  # ecdsa | dilithium | hybrid
 
+# Chiave metadata transazione per stealth payments
+STEALTH_METADATA_KEY: Final[str] = "stealth_payment"
+
 # Key derivation (BIP32/44)
 BIP44_COIN_TYPE: Final[int] = 2025  # Registered coin type per CCO2
 BIP44_PATH_MAINNET: Final[str] = "m/44'/2025'/0'/0"
@@ -273,15 +276,15 @@ SUPPORTED_CERT_STANDARDS: Final[list[str]] = [
     "JI",  # Joint Implementation
 ]
 
-# Campi obbligatori certificato
-REQUIRED_CERT_FIELDS: Final[list[str]] = [
+# Campi obbligatori certificato (frozenset: check con set difference)
+REQUIRED_CERT_FIELDS: Final[frozenset[str]] = frozenset({
     "certificate_id",
     "total_kg",
     "location",
     "description",
     "issuer",
     "issue_date",
-]
+})
 
 # Campi opzionali certificato
 OPTIONAL_CERT_FIELDS: Final[list[str]] = [
@@ -317,14 +320,17 @@ PROJECT_TYPES: Final[list[str]] = [
     "circular_economy",  # Economia circolare
 ]
 
-# Campi obbligatori progetto
-REQUIRED_PROJECT_FIELDS: Final[list[str]] = [
+# Stessi tipi come frozenset (membership O(1); PROJECT_TYPES resta ordinata)
+PROJECT_TYPE_SET: Final[frozenset[str]] = frozenset(PROJECT_TYPES)
+
+# Campi obbligatori progetto (frozenset: check con set difference)
+REQUIRED_PROJECT_FIELDS: Final[frozenset[str]] = frozenset({
     "project_id",
     "project_name",
     "location",
     "project_type",
     "organization",
-]
+})
 
 # ============================================================================
 # NETWORKING P2P
@@ -542,6 +548,7 @@ __all__ = [
     # Standards
     "SUPPORTED_CERT_STANDARDS",
     "PROJECT_TYPES",
+    "PROJECT_TYPE_SET",
     
     # Helpers
     "validate_amount",
@@ -185,8 +185,8 @@ class TimelockContract(SmartContract):
             timestamp=int(time.time())
         )
         
-        tx.metadata["contract_id"] = self.contract_id
-        tx.metadata["contract_type"] = "timelock"
+        tx.set_metadata("contract_id", self.contract_id)
+        tx.set_metadata("contract_type", "timelock")
         
         self.status = ContractStatus.EXECUTED
         
@@ -280,7 +280,7 @@ class ConditionalContract(SmartContract):
                 timestamp=int(time.time())
             )
             
-            tx.metadata["contract_id"] = self.contract_id
+            tx.set_metadata("contract_id", self.contract_id)
             
             self.status = ContractStatus.EXECUTED
             
@@ -376,8 +376,8 @@ class EscrowContract(SmartContract):
             timestamp=int(time.time())
         )
         
-        tx.metadata["contract_id"] = self.contract_id
-        tx.metadata["contract_type"] = "escrow"
+        tx.set_metadata("contract_id", self.contract_id)
+        tx.set_metadata("contract_type", "escrow")
         
         self.status = ContractStatus.EXECUTED
         
@@ -12,6 +12,8 @@ from carbon_chain.domain.models import (
     Block,
     BlockHeader,
     UTXOKey,
+    CertificateSpec,
+    ProjectSpec,
 )
 
 # UTXO
@@ -67,6 +69,8 @@ __all__ = [
     "Block",
     "BlockHeader",
     "UTXOKey",
+    "CertificateSpec",
+    "ProjectSpec",
     
     # UTXO
     "UTXOSet",
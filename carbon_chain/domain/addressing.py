@@ -49,6 +49,13 @@ logger = get_logger("addressing")
 # Base58 alphabet (no 0, O, I, l per evitare confusione)
 BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
 
+# Lookup coppie di cifre (58² voci): una divmod bigint ogni 2 caratteri
+_BASE58_PAIR_BASE = 58 * 58
+_BASE58_PAIRS = tuple(
+    BASE58_ALPHABET[i // 58] + BASE58_ALPHABET[i % 58]
+    for i in range(_BASE58_PAIR_BASE)
+)
+
 
 def encode_base58(data: bytes) -> str:
     """
@@ -83,16 +90,22 @@ def encode_base58(data: bytes) -> str:
     # Convert bytes to integer
     num = int.from_bytes(data, byteorder='big')
     
-    # Convert to base58
-    encoded = ''
-    while num > 0:
-        num, remainder = divmod(num, 58)
-        encoded = BASE58_ALPHABET[remainder] + encoded
+    # Convert to base58, due cifre per divmod (dalla meno significativa)
+    parts = []
+    while num >= _BASE58_PAIR_BASE:
+        num, remainder = divmod(num, _BASE58_PAIR_BASE)
+        parts.append(_BASE58_PAIRS[remainder])
     
-    # Add leading '1' for each leading zero byte
-    encoded = '1' * leading_zeros + encoded
+    # Cifre più significative (senza padding '1')
+    if num >= 58:
+        parts.append(_BASE58_PAIRS[num])
+    elif num:
+        parts.append(BASE58_ALPHABET[num])
     
-    return encoded
+    parts.reverse()
+    
+    # Add leading '1' for each leading zero byte
+    return '1' * leading_zeros + ''.join(parts)
 
 
 def decode_base58(encoded: str) -> bytes:
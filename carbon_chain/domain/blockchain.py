@@ -19,6 +19,9 @@ Features:
 from __future__ import annotations
 from typing import Optional, List, Dict, Tuple, Set
 from dataclasses import dataclass
+from array import array
+from bisect import bisect_left
+from operator import itemgetter
 import time
 import threading
 
@@ -45,11 +48,13 @@ from carbon_chain.domain.validation import (
 from carbon_chain.domain.genesis import create_genesis_block
 from carbon_chain.constants import (
     TxType,
+    CertificateState,
     calculate_subsidy,
     satoshi_to_coin,
     HALVING_INTERVAL,
     BLOCK_TIME_TARGET,
     DIFFICULTY_ADJUSTMENT_INTERVAL,
+    STEALTH_METADATA_KEY,
 )
 from carbon_chain.errors import (
     BlockchainError,
@@ -68,6 +73,35 @@ from carbon_chain.config import ChainSettings
 logger = get_logger("blockchain")
 audit_logger = AuditLogger()
 
+# Max address nella cache balance (oltre: cache svuotata)
+BALANCE_CACHE_SIZE = 10_000
+
+
+# ============================================================================
+# PROJECT COLUMNAR VIEW
+# ============================================================================
+
+@dataclass(frozen=True)
+class ProjectColumns:
+    """
+    Vista colonnare (SoA) dei progetti per query aggregate.
+    
+    Colonne parallele nello stesso ordine di inserimento dell'indice
+    progetti: filtri, top-N e aggregazioni scorrono array contigui
+    senza materializzare un dict per progetto.
+    
+    Attributes:
+        project_ids: Project ID
+        kg: Kg compensati (array int64)
+        types: project_type ("unknown" se assente)
+    """
+    project_ids: Tuple[str, ...]
+    kg: array
+    types: Tuple[str, ...]
+    
+    def __len__(self) -> int:
+        return len(self.project_ids)
+
 
 # ============================================================================
 # BLOCKCHAIN CLASS
@@ -135,9 +169,31 @@ class Blockchain:
         # Certificate tracking (cert_id → info)
         self._certificate_index: Dict[str, Dict] = {}
         
+        # Indice secondario certificati (state → {cert_id: None}, ordinato)
+        self._certificate_state_index: Dict[CertificateState, Dict[str, None]] = {}
+        
         # Project tracking (project_id → info)
         self._project_index: Dict[str, Dict] = {}
         
+        # Indice secondario progetti (project_type → {project_id: None}, ordinato)
+        self._project_type_index: Dict[str, Dict[str, None]] = {}
+        
+        # Indice stealth: [(height, [tx con metadata stealth])], ordinato per height
+        self._stealth_tx_index: List[Tuple[int, List[Transaction]]] = []
+        
+        # Indice output per address: address → [(height, tx, output_index)],
+        # ordinato per height
+        self._address_output_index: Dict[str, List[Tuple[int, Transaction, int]]] = {}
+        
+        # Epoch chain state (incrementato a ogni blocco, versione per cache)
+        self.epoch = 0
+        
+        # Cache balance: address → (epoch, balance), valida fino al prossimo blocco
+        self._balance_cache: Dict[str, Tuple[int, int]] = {}
+        
+        # Vista colonnare progetti cached: (epoch, ProjectColumns)
+        self._projects_columnar_cache: Optional[Tuple[int, ProjectColumns]] = None
+        
         # Initialize con genesis block
         self._initialize_with_genesis()
         
@@ -216,20 +272,37 @@ class Blockchain:
                         code="HEIGHT_MISMATCH"
                     )
                 
+                height = block.header.height
+                stealth_txs = []
+                
                 # Applica transazioni a UTXO set
                 for tx in block.transactions:
                     self.utxo_set.apply_transaction(tx)
                     
                     # Update certificate index
                     if tx.is_certificate_assignment():
-                        self._update_certificate_index(tx, block.header.height)
+                        self._update_certificate_index(tx, height)
                     
                     # Update project index
                     if tx.is_compensation():
-                        self._update_project_index(tx, block.header.height)
+                        self._update_project_index(tx, height)
+                    
+                    # Update address index
+                    for output_index, output in enumerate(tx.outputs):
+                        self._address_output_index.setdefault(output.address, []).append(
+                            (height, tx, output_index)
+                        )
+                    
+                    if tx.metadata and STEALTH_METADATA_KEY in tx.metadata:
+                        stealth_txs.append(tx)
+                
+                # Update stealth index (solo blocchi con stealth payments)
+                if stealth_txs:
+                    self._stealth_tx_index.append((height, stealth_txs))
                 
                 # Aggiungi blocco
                 self.blocks.append(block)
+                self._on_new_block(block)
                 
                 # Update supply
                 self.total_supply = self.utxo_set.total_supply()
@@ -256,6 +329,10 @@ class Blockchain:
                     }
                 )
     
+    def _on_new_block(self, block: Block) -> None:
+        """Hook nuovo blocco: invalida cache dei servizi (bump epoch)"""
+        self.epoch += 1
+    
     def get_block(self, height: int) -> Optional[Block]:
         """
         Ottieni blocco per height.
@@ -319,6 +396,72 @@ class Blockchain:
             
             return None
     
+    def get_stealth_transactions(
+        self,
+        start_height: int,
+        end_height: int
+    ) -> List[Tuple[int, List[Transaction]]]:
+        """
+        Transazioni con stealth payment nel range di height.
+        
+        Filtro eseguito in add_block (indice): la scansione salta
+        direttamente ai blocchi con stealth payments, senza iterare
+        blocchi e transazioni.
+        
+        Args:
+            start_height: Prima height (inclusa)
+            end_height: Ultima height (inclusa)
+        
+        Returns:
+            List[Tuple[int, List[Transaction]]]: (height, transazioni stealth)
+                in ordine di height
+        
+        Performance:
+            O(log b + k) - b blocchi con stealth tx, k risultati
+        """
+        with self._lock:
+            index = self._stealth_tx_index
+            start = bisect_left(index, start_height, key=itemgetter(0))
+            end = bisect_left(index, end_height + 1, key=itemgetter(0))
+            return index[start:end]
+    
+    def get_address_outputs(
+        self,
+        address: str,
+        start_height: int = 0
+    ) -> List[Tuple[int, Transaction, int]]:
+        """
+        Output ricevuti da address (indice aggiornato in add_block).
+        
+        Args:
+            address: Address da query
+            start_height: Prima height inclusa (default: tutta la chain)
+        
+        Returns:
+            List[Tuple[int, Transaction, int]]: (height, tx, output_index)
+                in ordine di height
+        
+        Performance:
+            O(log k + r) - k output dell'address, r risultati
+        """
+        with self._lock:
+            entries = self._address_output_index.get(address, [])
+            start = bisect_left(entries, start_height, key=itemgetter(0))
+            return entries[start:]
+    
+    def is_address_used(self, address: str) -> bool:
+        """
+        True se address ha mai ricevuto output (anche se ora a zero).
+        
+        Args:
+            address: Address da query
+        
+        Returns:
+            bool: True se presente nell'indice address
+        """
+        with self._lock:
+            return address in self._address_output_index
+    
     def get_total_supply(self) -> int:
         """
         Alias per get_supply() - compatibilità.
@@ -380,7 +523,9 @@ class Blockchain:
         self,
         miner_address: str,
         transactions: List[Transaction],
-        timeout_seconds: Optional[int] = None
+        timeout_seconds: Optional[int] = None,
+        stop_event: Optional[threading.Event] = None,
+        num_threads: Optional[int] = None
     ) -> Optional[Block]:
         """
         Mina nuovo blocco.
@@ -397,6 +542,8 @@ class Blockchain:
             miner_address: Address per reward
             transactions: Transazioni da includere (no COINBASE)
             timeout_seconds: Timeout mining (None = no limit)
+            stop_event: Se settato, ricerca nonce interrotta
+            num_threads: Worker ricerca nonce (None = config.mining_threads)
         
         Returns:
             Block: Blocco minato, o None se timeout
@@ -406,6 +553,43 @@ class Blockchain:
             >>> block = blockchain.mine_block("miner_addr", [])
             >>> if block:
             ...     blockchain.add_block(block)
+        
+        Thread Safety:
+            Lock tenuto solo per costruire il template; la ricerca nonce
+            gira senza lock (add_block rifiuta il blocco se il tip è
+            cambiato nel frattempo).
+        """
+        header_template, all_transactions = self.create_block_template(
+            miner_address,
+            transactions
+        )
+        
+        return self.mine_block_template(
+            header_template,
+            all_transactions,
+            timeout_seconds=timeout_seconds,
+            stop_event=stop_event,
+            num_threads=num_threads
+        )
+    
+    def create_block_template(
+        self,
+        miner_address: str,
+        transactions: List[Transaction]
+    ) -> Tuple[BlockHeader, List[Transaction]]:
+        """
+        Costruisci template blocco (COINBASE + merkle root + header).
+        
+        Il template resta valido finché tip e mempool non cambiano
+        (vedi Blockchain.epoch e Mempool.cookie): il chiamante può
+        riusarlo aggiornando solo timestamp/nonce.
+        
+        Args:
+            miner_address: Address per reward
+            transactions: Transazioni da includere (no COINBASE)
+        
+        Returns:
+            Tuple: (header template con nonce=0, transazioni con COINBASE)
         """
         with self._lock:
             logger.info(
@@ -475,33 +659,57 @@ class Blockchain:
                 height=self.get_height() + 1
             )
             
-            # 6. Mine header (trova nonce)
-            mined_header = mine_block_header(
-                header_template,
-                timeout_seconds=timeout_seconds
-            )
-            
-            if not mined_header:
-                logger.warning("Mining timeout or failed")
-                return None
-            
-            # 7. Crea blocco finale
-            mined_block = Block(
-                header=mined_header,
-                transactions=all_transactions
-            )
-            
-            logger.info(
-                "✅ Block mined successfully!",
-                extra_data={
-                    "height": mined_block.header.height,
-                    "hash": mined_block.compute_block_hash()[:16] + "...",
-                    "nonce": mined_header.nonce,
-                    "tx_count": len(all_transactions)
-                }
-            )
-            
-            return mined_block
+            return header_template, all_transactions
+    
+    def mine_block_template(
+        self,
+        header_template: BlockHeader,
+        all_transactions: List[Transaction],
+        timeout_seconds: Optional[int] = None,
+        stop_event: Optional[threading.Event] = None,
+        num_threads: Optional[int] = None
+    ) -> Optional[Block]:
+        """
+        Mina template costruito da create_block_template.
+        
+        Args:
+            header_template: Header da minare
+            all_transactions: Transazioni del template (COINBASE prima)
+            timeout_seconds: Timeout mining (None = no limit)
+            stop_event: Se settato, ricerca nonce interrotta
+            num_threads: Worker ricerca nonce (None = config.mining_threads)
+        
+        Returns:
+            Block: Blocco minato, o None se timeout
+        """
+        mined_header = mine_block_header(
+            header_template,
+            timeout_seconds=timeout_seconds,
+            stop_event=stop_event,
+            num_threads=num_threads or self.config.mining_threads
+        )
+        
+        if not mined_header:
+            logger.warning("Mining timeout or failed")
+            return None
+        
+        # 7. Crea blocco finale
+        mined_block = Block(
+            header=mined_header,
+            transactions=all_transactions
+        )
+        
+        logger.info(
+            "✅ Block mined successfully!",
+            extra_data={
+                "height": mined_block.header.height,
+                "hash": mined_block.compute_block_hash()[:16] + "...",
+                "nonce": mined_header.nonce,
+                "tx_count": len(all_transactions)
+            }
+        )
+        
+        return mined_block
     
     def _should_adjust_difficulty(self) -> bool:
         """Check se è ora di adjust difficulty"""
@@ -569,8 +777,61 @@ class Blockchain:
             >>> balance = blockchain.get_balance("addr1")
             >>> balance  # In Satoshi
             0
+        
+        Note:
+            Risultato in cache fino al prossimo blocco (epoch).
+        """
+        # Epoch letto prima del calcolo: entry di un blocco precedente
+        # non viene mai servita come corrente
+        epoch = self.epoch
+        cached = self._balance_cache.get(address)
+        
+        if cached is not None and cached[0] == epoch:
+            return cached[1]
+        
+        balance = self.utxo_set.get_balance(address)
+        self._cache_balance(address, epoch, balance)
+        
+        return balance
+    
+    def get_balances(self, addresses: List[str]) -> Dict[str, int]:
         """
-        return self.utxo_set.get_balance(address)
+        Balance di più address (solo spendibili).
+        
+        Hit dalla cache balance; i miss calcolati con un solo lookup
+        bulk sull'UTXO set.
+        
+        Args:
+            addresses: Address da query
+        
+        Returns:
+            dict: address → balance in Satoshi
+        """
+        epoch = self.epoch
+        balances = {}
+        missing = []
+        
+        for address in addresses:
+            cached = self._balance_cache.get(address)
+            if cached is not None and cached[0] == epoch:
+                balances[address] = cached[1]
+            else:
+                missing.append(address)
+        
+        if missing:
+            for address, utxos in self.utxo_set.get_spendable_utxos_for_addresses(missing).items():
+                balance = sum(output.amount for _, output in utxos)
+                self._cache_balance(address, epoch, balance)
+                balances[address] = balance
+        
+        return balances
+    
+    def _cache_balance(self, address: str, epoch: int, balance: int) -> None:
+        """Salva balance in cache (svuotata oltre BALANCE_CACHE_SIZE)"""
+        if len(self._balance_cache) >= BALANCE_CACHE_SIZE:
+            self._balance_cache.clear()
+        
+        self._balance_cache[address] = (epoch, balance)
     
     def get_balance_detailed(self, address: str) -> Dict[str, int]:
         """
@@ -616,6 +877,24 @@ class Blockchain:
         """
         return self.utxo_set.get_utxos_for_address(address)
     
+    def get_address_state(self, address: str) -> Tuple[int, List[Tuple[UTXOKey, TxOutput]]]:
+        """
+        Balance + UTXO di un address in una sola lettura.
+        
+        Per chiamanti che mostrano entrambi: balance derivato dagli
+        stessi UTXO (solo spendibili), nessun secondo lookup.
+        
+        Args:
+            address: Address da query
+        
+        Returns:
+            Tuple: (balance in Satoshi, lista UTXO)
+        """
+        utxos = self.utxo_set.get_utxos_for_address(address)
+        balance = sum(output.amount for _, output in utxos if output.is_spendable())
+        
+        return balance, utxos
+    
     # ========================================================================
     # QUERY API - SUPPLY
     # ========================================================================
@@ -674,6 +953,7 @@ class Blockchain:
                 continue
             
             cert_id = output.certificate_id
+            previous_state = None
             
             if cert_id not in self._certificate_index:
                 # Nuovo certificato
@@ -687,6 +967,10 @@ class Blockchain:
                     "first_block": block_height,
                     "metadata": output.certificate_metadata or {}
                 }
+            else:
+                previous_state = self.certificate_state(
+                    self._certificate_index[cert_id]
+                )
             
             # Update issued/compensated
             cert_info = self._certificate_index[cert_id]
@@ -694,6 +978,34 @@ class Blockchain:
             
             if output.is_compensated:
                 cert_info["compensated_kg"] += output.amount
+            
+            # Update indice state
+            state = self.certificate_state(cert_info)
+            if state != previous_state:
+                if previous_state is not None:
+                    del self._certificate_state_index[previous_state][cert_id]
+                self._certificate_state_index.setdefault(state, {})[cert_id] = None
+    
+    @staticmethod
+    def certificate_state(cert_info: Dict) -> CertificateState:
+        """
+        Calcola state certificato da issued/compensated.
+        
+        Args:
+            cert_info: Entry indice certificati
+        
+        Returns:
+            CertificateState: ACTIVE, PARTIALLY_COMPENSATED o FULLY_COMPENSATED
+        """
+        issued = cert_info["issued_kg"]
+        compensated = cert_info["compensated_kg"]
+        
+        if compensated >= issued:
+            return CertificateState.FULLY_COMPENSATED
+        elif compensated > 0:
+            return CertificateState.PARTIALLY_COMPENSATED
+        
+        return CertificateState.ACTIVE
     
     def get_certificate_info(self, cert_id: str) -> Optional[Dict]:
         """
@@ -713,14 +1025,29 @@ class Blockchain:
         """
         return self._certificate_index.get(cert_id)
     
-    def list_certificates(self) -> List[Dict]:
+    def list_certificates(
+        self,
+        filter_state: Optional[CertificateState] = None
+    ) -> List[Dict]:
         """
-        Lista tutti i certificati.
+        Lista certificati.
+        
+        Il filtro usa l'indice secondario per state: vengono letti solo
+        i certificati che matchano.
+        
+        Args:
+            filter_state: Filtra per state (None = tutti)
         
         Returns:
             List[dict]: Lista certificati
         """
-        return list(self._certificate_index.values())
+        if filter_state is None:
+            return list(self._certificate_index.values())
+        
+        return [
+            self._certificate_index[cert_id]
+            for cert_id in list(self._certificate_state_index.get(filter_state, ()))
+        ]
     
     # ========================================================================
     # QUERY API - PROJECTS
@@ -744,6 +1071,9 @@ class Blockchain:
                     "first_block": block_height,
                     "metadata": output.compensation_metadata or {}
                 }
+                
+                project_type = self._project_index[project_id]["metadata"].get("project_type")
+                self._project_type_index.setdefault(project_type, {})[project_id] = None
             
             # Update
             proj_info = self._project_index[project_id]
@@ -770,21 +1100,60 @@ class Blockchain:
         
         return None
     
-    def list_projects(self) -> List[Dict]:
+    def list_projects(self, filter_type: Optional[str] = None) -> List[Dict]:
         """
-        Lista tutti i progetti.
+        Lista progetti.
+        
+        Args:
+            filter_type: Filtra per project_type via indice secondario
+                (None = tutti)
         
         Returns:
             List[dict]: Lista progetti
         """
+        if filter_type is None:
+            proj_infos = list(self._project_index.values())
+        else:
+            proj_infos = [
+                self._project_index[project_id]
+                for project_id in list(self._project_type_index.get(filter_type, ()))
+            ]
+        
         projects = []
-        for proj_info in self._project_index.values():
+        for proj_info in proj_infos:
             proj_copy = dict(proj_info)
             proj_copy["certificates_used"] = list(proj_info["certificates_used"])
             projects.append(proj_copy)
         
         return projects
     
+    def projects_columnar(self) -> ProjectColumns:
+        """
+        Vista colonnare progetti, ricostruita solo al cambio di epoch.
+        
+        Returns:
+            ProjectColumns: Colonne project_ids / kg / types
+        """
+        cached = self._projects_columnar_cache
+        if cached is not None and cached[0] == self.epoch:
+            return cached[1]
+        
+        with self._lock:
+            epoch = self.epoch
+            proj_infos = list(self._project_index.values())
+            
+            columns = ProjectColumns(
+                project_ids=tuple(p["project_id"] for p in proj_infos),
+                kg=array('q', [p["total_kg_compensated"] for p in proj_infos]),
+                types=tuple(
+                    p["metadata"].get("project_type", "unknown") for p in proj_infos
+                )
+            )
+            
+            self._projects_columnar_cache = (epoch, columns)
+        
+        return columns
+    
     # ========================================================================
     # CHAIN STATISTICS
     # ========================================================================
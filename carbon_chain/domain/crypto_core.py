@@ -25,13 +25,15 @@ Dependencies:
 import hashlib
 import hmac
 import secrets
-from typing import Optional, Tuple, Protocol
+from typing import List, Optional, Sequence, Tuple, Protocol
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 
 # Cryptography library (production-grade)
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
@@ -47,6 +49,7 @@ from carbon_chain.errors import (
     HashMismatchError
 )
 from carbon_chain.logging_setup import get_logger
+from carbon_chain.constants import SCRYPT_N, SCRYPT_R, SCRYPT_P
 
 
 # ============================================================================
@@ -657,6 +660,12 @@ class CryptoProvider(Protocol):
 # ECDSA PROVIDER (secp256k1)
 # ============================================================================
 
+@lru_cache(maxsize=1024)
+def _load_ecdsa_public_key(public_key: bytes) -> ec.EllipticCurvePublicKey:
+    """Parse PEM public key (cached: stesse chiavi verificate più volte)"""
+    return serialization.load_pem_public_key(public_key, backend=default_backend())
+
+
 class ECDSAProvider:
     """
     Provider ECDSA con curva secp256k1 (compatibile Bitcoin).
@@ -789,10 +798,7 @@ class ECDSAProvider:
         """
         try:
             # Load public key
-            public_key_obj = serialization.load_pem_public_key(
-                public_key,
-                backend=default_backend()
-            )
+            public_key_obj = _load_ecdsa_public_key(public_key)
             
             # Verify
             public_key_obj.verify(
@@ -811,6 +817,45 @@ class ECDSAProvider:
         except Exception as e:
             logger.error(f"ECDSA verification error: {e}")
             return False
+    
+    def verify_batch(
+        self,
+        message: bytes,
+        signatures: Sequence[Tuple[bytes, bytes]]
+    ) -> List[bool]:
+        """
+        Verifica più firme ECDSA sullo stesso messaggio.
+        
+        Il messaggio è hashato una sola volta (Prehashed) invece che per
+        firma; le public key passano dalla cache di parsing.
+        
+        Args:
+            message: Messaggio originale (comune a tutte le firme)
+            signatures: Lista (signature, public_key PEM)
+        
+        Returns:
+            List[bool]: Esito per firma (stesso ordine)
+        """
+        digest_hash = hashes.Hash(self.hash_algo)
+        digest_hash.update(message)
+        digest = digest_hash.finalize()
+        algorithm = ec.ECDSA(Prehashed(self.hash_algo))
+        
+        results = []
+        for signature, public_key in signatures:
+            try:
+                _load_ecdsa_public_key(public_key).verify(signature, digest, algorithm)
+                results.append(True)
+            
+            except CryptoInvalidSignature:
+                logger.debug("ECDSA signature verification failed: invalid signature")
+                results.append(False)
+            
+            except Exception as e:
+                logger.error(f"ECDSA verification error: {e}")
+                results.append(False)
+        
+        return results
 
 
 # ============================================================================
@@ -937,6 +982,50 @@ def generate_random_int(min_value: int, max_value: int) -> int:
 # PROOF OF WORK HASH
 # ============================================================================
 
+# Memoria scrypt PoW: 128 * r * N = 32 MiB (+ margine per OpenSSL)
+_POW_SCRYPT_MAXMEM = 128 * SCRYPT_R * SCRYPT_N + 1024 * 1024
+
+# hashlib.scrypt esiste solo con OpenSSL >= 1.1
+_hashlib_scrypt = getattr(hashlib, "scrypt", None)
+
+
+def pow_hash_scrypt(data: bytes) -> bytes:
+    """
+    Kernel PoW: Scrypt self-salted su header + nonce già concatenati.
+    
+    Usa hashlib.scrypt (OpenSSL, nativo, rilascia il GIL) se disponibile,
+    altrimenti derive_key_scrypt. Entrambi implementano scrypt standard:
+    stesso digest.
+    
+    Args:
+        data: Header serializzato + nonce (8 byte big-endian), bytes-like
+    
+    Returns:
+        bytes: 32-byte hash
+    """
+    if _hashlib_scrypt is not None:
+        return _hashlib_scrypt(
+            data,
+            salt=data,
+            n=SCRYPT_N,
+            r=SCRYPT_R,
+            p=SCRYPT_P,
+            maxmem=_POW_SCRYPT_MAXMEM,
+            dklen=32
+        )
+    
+    data = bytes(data)
+    
+    return derive_key_scrypt(
+        password=data,
+        salt=data,  # Self-salted
+        n=SCRYPT_N,
+        r=SCRYPT_R,
+        p=SCRYPT_P,
+        key_length=32
+    )
+
+
 def compute_pow_hash_scrypt(header_bytes: bytes, nonce: int) -> bytes:
     """
     Compute PoW hash usando Scrypt.
@@ -969,23 +1058,9 @@ def compute_pow_hash_scrypt(header_bytes: bytes, nonce: int) -> bytes:
     nonce_bytes = nonce.to_bytes(8, byteorder='big')
     data = header_bytes + nonce_bytes
     
-    # Scrypt parameters (ASIC-resistant)
-    N = 2**15  # 32768 (memory cost)
-    r = 8      # Block size
-    p = 1      # Parallelization
-    
     try:
         # Use scrypt as KDF (data = password, salt = data stesso)
-        pow_hash = derive_key_scrypt(
-            password=data,
-            salt=data,  # Self-salted
-            n=N,
-            r=r,
-            p=p,
-            key_length=32
-        )
-        
-        return pow_hash
+        return pow_hash_scrypt(data)
     
     except Exception as e:
         logger.error(f"PoW hash computation failed", extra_data={"error": str(e)})
@@ -1027,12 +1102,12 @@ def check_pow_difficulty(digest: bytes, difficulty: int) -> bool:
             code="INVALID_DIFFICULTY"
         )
     
-    # Check primi N byte siano zero
-    for i in range(difficulty):
-        if digest[i] != 0:
-            return False
-    
-    return True
+    # Check primi N byte siano zero (singolo memcmp, nessuna slice)
+    return digest.startswith(POW_ZERO_PREFIXES[difficulty])
+
+
+# Prefissi zero precalcolati per difficulty 0-32 (indice = byte richiesti)
+POW_ZERO_PREFIXES = tuple(bytes(n) for n in range(33))
 
 
 # ============================================================================
@@ -1166,6 +1241,41 @@ def verify_signature(
     provider = get_crypto_provider(algorithm)
     return provider.verify(message, signature, public_key)
 
+
+def verify_signatures_batch(
+    message: bytes,
+    signatures: Sequence[Tuple[bytes, bytes]],
+    algorithm: str = "ecdsa"
+) -> List[bool]:
+    """
+    Verifica batch di firme sullo stesso messaggio (es. firme multisig).
+    
+    Args:
+        message: Messaggio firmato
+        signatures: Lista (signature, public_key)
+        algorithm: Algoritmo
+    
+    Returns:
+        List[bool]: Esito per firma (stesso ordine)
+    
+    Examples:
+        >>> priv, pub = generate_keypair()
+        >>> sig = sign_message(b"tx", priv)
+        >>> verify_signatures_batch(b"tx", [(sig, pub), (sig, pub)])
+        [True, True]
+    """
+    provider = get_crypto_provider(algorithm)
+    
+    # Provider senza batch nativo: verifica una firma alla volta
+    verify_batch = getattr(provider, "verify_batch", None)
+    if verify_batch is None:
+        return [
+            provider.verify(message, signature, public_key)
+            for signature, public_key in signatures
+        ]
+    
+    return verify_batch(message, signatures)
+
 # ============================================================================
 # ALIASES (Per compatibilità)
 # ============================================================================
@@ -1212,6 +1322,7 @@ __all__ = [
     "generate_keypair",
     "sign_message",
     "verify_signature",
+    "verify_signatures_batch",
     
     # Random
     "generate_random_bytes",
@@ -1219,7 +1330,9 @@ __all__ = [
     
     # PoW
     "compute_pow_hash_scrypt",
+    "pow_hash_scrypt",
     "check_pow_difficulty",
+    "POW_ZERO_PREFIXES",
     
     # HMAC
     "compute_hmac_sha256",
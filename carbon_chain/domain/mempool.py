@@ -142,6 +142,9 @@ class Mempool:
         # Current size
         self._current_size = 0
         
+        # Incrementato a ogni add/remove (invalidazione block template)
+        self.cookie = 0
+        
         # Thread safety
         self._lock = threading.RLock()
         
@@ -241,6 +244,7 @@ class Mempool:
             # Aggiungi
             self._entries[txid] = entry
             self._current_size += tx_size
+            self.cookie += 1
             
             # Track UTXO spesi
             for inp in tx.inputs:
@@ -284,6 +288,7 @@ class Mempool:
             
             # Update size
             self._current_size -= entry.size
+            self.cookie += 1
             
             # Remove UTXO tracking
             for inp in entry.transaction.inputs:
@@ -495,6 +500,7 @@ class Mempool:
             self._entries.clear()
             self._spent_utxos.clear()
             self._current_size = 0
+            self.cookie += 1
             
             logger.warning("Mempool cleared")
     
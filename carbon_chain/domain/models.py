@@ -20,9 +20,13 @@ Tutte le strutture sono immutabili (frozen) per thread-safety.
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from functools import cached_property
+from typing import Optional, List, Dict, Any, Mapping
 from datetime import datetime
+from collections import OrderedDict
+import hashlib
 import json
+import threading
 
 # Internal imports
 from carbon_chain.constants import (
@@ -32,14 +36,19 @@ from carbon_chain.constants import (
     satoshi_to_coin,
     format_amount,
     validate_amount,
+    REQUIRED_CERT_FIELDS,
+    REQUIRED_PROJECT_FIELDS,
 )
 from carbon_chain.domain.crypto_core import (
     compute_sha256,
     compute_blake2b,
+    compute_certificate_hash,
 )
 from carbon_chain.errors import (
     ValidationError,
     InvalidTransactionError,
+    CertificateError,
+    CompensationError,
 )
 from carbon_chain.logging_setup import get_logger
 
@@ -50,12 +59,108 @@ from carbon_chain.logging_setup import get_logger
 
 logger = get_logger("models")
 
+# Encoder JSON canonico per TXID (sorted keys, compatto), riusato:
+# json.dumps con kwargs non di default ricrea un encoder a ogni chiamata
+_CANONICAL_JSON_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+
+
+# ============================================================================
+# CERTIFICATE METADATA REGISTRY
+# ============================================================================
+
+# Max certificati nel registry (LRU: i meno usati vengono scartati)
+CERTIFICATE_METADATA_REGISTRY_SIZE = 4096
+
+
+class CertificateMetadataRegistry:
+    """
+    Registry process-wide dei metadata certificato, keyed by certificate_hash.
+    
+    Il certificate_hash è deterministico sul contenuto del certificato, quindi
+    tutti gli output dello stesso certificato possono condividere un'unica
+    istanza dei metadata invece di tenerne una copia ciascuno.
+    
+    Solo interning: non fornisce mai metadata a output che non li hanno
+    (il wire format, e quindi TXID e firma, dipende solo dal dict ricevuto).
+    Limitato a max_size voci in ordine LRU.
+    
+    Thread Safety:
+        - Protected da Lock
+    
+    Examples:
+        >>> registry = CertificateMetadataRegistry()
+        >>> meta = registry.register(b'hash', {"location": "Portugal"})
+        >>> registry.get(b'hash') is meta
+        True
+    """
+    
+    def __init__(self, max_size: int = CERTIFICATE_METADATA_REGISTRY_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def register(
+        self,
+        certificate_hash: bytes,
+        metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Registra metadata e ritorna l'istanza canonica.
+        
+        Se il contenuto differisce da quello già registrato per lo stesso
+        hash, ritorna i metadata passati senza sostituirli (il wire format
+        e quindi il TXID non devono mai cambiare).
+        
+        Args:
+            certificate_hash: Hash certificato
+            metadata: Metadata certificato
+        
+        Returns:
+            dict: Istanza condivisa dei metadata
+        """
+        with self._lock:
+            existing = self._entries.get(certificate_hash)
+            
+            if existing is None:
+                self._entries[certificate_hash] = metadata
+                if len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                return metadata
+            
+            if existing is metadata or existing == metadata:
+                self._entries.move_to_end(certificate_hash)
+                return existing
+            
+            return metadata
+    
+    def get(self, certificate_hash: bytes) -> Optional[Dict[str, Any]]:
+        """Ottieni metadata per hash (None se non registrato)"""
+        with self._lock:
+            return self._entries.get(certificate_hash)
+    
+    def clear(self) -> None:
+        """Svuota registry (per testing)"""
+        with self._lock:
+            self._entries.clear()
+    
+    def __contains__(self, certificate_hash: bytes) -> bool:
+        with self._lock:
+            return certificate_hash in self._entries
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Registry globale
+certificate_metadata_registry = CertificateMetadataRegistry()
+
 
 # ============================================================================
 # TRANSACTION OUTPUT
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class TxOutput:
     """
     Output di transazione (UTXO).
@@ -75,7 +180,8 @@ class TxOutput:
         certificate_id (Optional[str]): ID certificato CO2
         certificate_hash (Optional[bytes]): Hash univoco certificato
         certificate_total_kg (Optional[int]): Capacità totale certificato
-        certificate_metadata (Optional[dict]): Metadata certificato
+        certificate_metadata (Optional[dict]): Metadata certificato (istanza
+            condivisa via certificate_metadata_registry se presente)
         compensation_project_id (Optional[str]): ID progetto compensazione
         compensation_metadata (Optional[dict]): Metadata progetto
     
@@ -160,6 +266,18 @@ class TxOutput:
                     code="INVALID_CERTIFICATE_TOTAL_KG"
                 )
         
+        # Metadata certificato per riferimento (una istanza per certificate_hash).
+        # Solo interning: metadata None restano None (TXID invariato)
+        if self.certificate_hash and self.certificate_metadata is not None:
+            object.__setattr__(
+                self,
+                "certificate_metadata",
+                certificate_metadata_registry.register(
+                    self.certificate_hash,
+                    self.certificate_metadata
+                )
+            )
+        
         # Validazione compensazione
         if self.is_compensated:
             if not self.compensation_project_id:
@@ -336,7 +454,7 @@ class TxOutput:
 # TRANSACTION INPUT
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class TxInput:
     """
     Input di transazione (riferimento UTXO precedente).
@@ -595,18 +713,52 @@ class Transaction:
             >>> txid = tx.compute_txid()
             >>> len(txid)
             64
+        
+        Performance:
+            Memoizzato (vedi txid): la tx è immutabile, l'hash viene
+            calcolato una sola volta per istanza.
         """
+        return self.txid
+    
+    @cached_property
+    def txid(self) -> str:
+        """TXID memoizzato (calcolato al primo accesso)"""
         # Serializza tx senza firme (per determinismo)
         tx_dict = self.to_dict(include_signatures=False)
         
         # Canonical JSON (sorted keys)
-        canonical_json = json.dumps(tx_dict, sort_keys=True, separators=(',', ':'))
+        canonical_json = _CANONICAL_JSON_ENCODER.encode(tx_dict)
         
         # SHA-256 hash
         txid_hash = compute_sha256(canonical_json.encode('utf-8'))
         
         return txid_hash.hex()
     
+    @cached_property
+    def merkle_leaf(self) -> bytes:
+        """Foglia Merkle memoizzata: SHA-256 del TXID (hex)"""
+        return compute_sha256(self.txid.encode('utf-8'))
+    
+    def set_metadata(self, key: str, value: Any) -> None:
+        """
+        Imposta entry metadata e invalida gli hash memoizzati.
+        
+        I metadata entrano nel TXID: scrivere direttamente su
+        tx.metadata dopo un compute_txid() lascerebbe txid e
+        merkle_leaf stale.
+        
+        Args:
+            key: Chiave metadata
+            value: Valore (JSON-serializzabile)
+        """
+        if self.metadata is None:
+            object.__setattr__(self, "metadata", {})
+        
+        self.metadata[key] = value
+        
+        self.__dict__.pop("txid", None)
+        self.__dict__.pop("merkle_leaf", None)
+    
     def total_input_amount(self) -> int:
         """
         Calcola somma amount input (richiede UTXO set per lookup).
@@ -870,15 +1022,20 @@ class BlockHeader:
             >>> len(block_hash)
             64
         """
+        return header.block_hash
+    
+    @cached_property
+    def block_hash(self) -> str:
+        """Block hash memoizzato (header immutabile, calcolato una volta)"""
         # Serializza header in formato canonico
         header_data = (
-            header.version.to_bytes(4, byteorder='big') +
-            bytes.fromhex(header.previous_hash) +
-            header.merkle_root +
-            header.timestamp.to_bytes(8, byteorder='big') +
-            header.difficulty.to_bytes(1, byteorder='big') +
-            header.nonce.to_bytes(8, byteorder='big') +
-            header.height.to_bytes(8, byteorder='big')
+            self.version.to_bytes(4, byteorder='big') +
+            bytes.fromhex(self.previous_hash) +
+            self.merkle_root +
+            self.timestamp.to_bytes(8, byteorder='big') +
+            self.difficulty.to_bytes(1, byteorder='big') +
+            self.nonce.to_bytes(8, byteorder='big') +
+            self.height.to_bytes(8, byteorder='big')
         )
         
         # SHA-256 hash
@@ -1026,30 +1183,20 @@ class Block:
             # Empty block (shouldn't happen, but handle)
             return b'\x00' * 32
         
-        # Level 0: hash TXID di ogni transazione
-        hashes = [
-            compute_sha256(tx.compute_txid().encode('utf-8'))
-            for tx in self.transactions
-        ]
+        # Level 0: hash TXID di ogni transazione (memoizzato per tx)
+        hashes = [tx.merkle_leaf for tx in self.transactions]
         
-        # Costruisci tree bottom-up
+        # Costruisci tree bottom-up: ogni nodo interno = SHA-256 su 64 byte
+        sha256 = hashlib.sha256
         while len(hashes) > 1:
-            next_level = []
-            
-            # Process pairs
-            for i in range(0, len(hashes), 2):
-                if i + 1 < len(hashes):
-                    # Pair exists
-                    combined = hashes[i] + hashes[i + 1]
-                else:
-                    # Odd number: duplicate last
-                    combined = hashes[i] + hashes[i]
-                
-                # Hash combined
-                parent_hash = compute_sha256(combined)
-                next_level.append(parent_hash)
+            # Odd number: duplicate last
+            if len(hashes) % 2:
+                hashes.append(hashes[-1])
             
-            hashes = next_level
+            hashes = [
+                sha256(left + right).digest()
+                for left, right in zip(hashes[0::2], hashes[1::2])
+            ]
         
         # Root
         return hashes[0]
@@ -1174,7 +1321,7 @@ class Block:
 # UTXO KEY
 # ============================================================================
 
-@dataclass(frozen=True, order=True)
+@dataclass(slots=True, frozen=True, order=True)
 class UTXOKey:
     """
     Chiave univoca per identificare UTXO.
@@ -1221,6 +1368,185 @@ class UTXOKey:
         return f"UTXOKey({self.txid[:16]}...:{self.output_index})"
 
 
+# ============================================================================
+# CERTIFICATE / PROJECT SPECS
+# ============================================================================
+
+@dataclass(slots=True, frozen=True)
+class CertificateSpec:
+    """
+    Payload certificato CO2 tipizzato.
+    
+    Alternativa slotted al dict certificate_data: i campi obbligatori sono
+    attributi (niente lookup hash per campo), i campi opzionali restano in
+    extra. Validazione semantica in __post_init__.
+    
+    Attributes:
+        certificate_id (str): ID certificato
+        total_kg (int): Capacità totale kg CO2
+        location (str): Località progetto
+        description (str): Descrizione
+        issuer (str): Ente emettitore
+        issue_date (int): Timestamp emissione
+        extra (Mapping): Campi opzionali (OPTIONAL_CERT_FIELDS, custom)
+    
+    Examples:
+        >>> spec = CertificateSpec.from_dict(cert_data)
+        >>> spec.to_dict() == cert_data
+        True
+    """
+    
+    certificate_id: str
+    total_kg: int
+    location: str
+    description: str
+    issuer: str
+    issue_date: int
+    extra: Mapping[str, Any] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        """Validazione post-init"""
+        if not isinstance(self.total_kg, int) or self.total_kg <= 0:
+            raise CertificateError(
+                "total_kg must be positive integer",
+                code="INVALID_TOTAL_KG"
+            )
+        
+        if not isinstance(self.certificate_id, str) or not self.certificate_id:
+            raise CertificateError(
+                "certificate_id must be non-empty string",
+                code="INVALID_CERT_ID"
+            )
+    
+    def compute_hash(self) -> bytes:
+        """
+        Calcola certificate hash (identico a quello del dict equivalente).
+        
+        Returns:
+            bytes: 32-byte hash deterministico
+        """
+        return compute_certificate_hash(
+            cert_id=self.certificate_id,
+            total_kg=self.total_kg,
+            location=self.location,
+            description=self.description,
+            timestamp=self.issue_date,
+            issuer=self.issuer,
+            extra_data=self.to_dict()
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializza in dict certificate_data"""
+        return {
+            "certificate_id": self.certificate_id,
+            "total_kg": self.total_kg,
+            "location": self.location,
+            "description": self.description,
+            "issuer": self.issuer,
+            "issue_date": self.issue_date,
+            **self.extra,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> CertificateSpec:
+        """
+        Crea spec da dict certificate_data.
+        
+        Raises:
+            CertificateError: Se manca un campo obbligatorio o valori invalidi
+        """
+        missing = REQUIRED_CERT_FIELDS - data.keys()
+        if missing:
+            missing = sorted(missing)
+            raise CertificateError(
+                f"Missing required certificate field: {', '.join(missing)}",
+                code="MISSING_CERT_FIELD",
+                details={"field": missing[0], "fields": missing}
+            )
+        
+        return cls(
+            certificate_id=data["certificate_id"],
+            total_kg=data["total_kg"],
+            location=data["location"],
+            description=data["description"],
+            issuer=data["issuer"],
+            issue_date=data["issue_date"],
+            extra={
+                key: value
+                for key, value in data.items()
+                if key not in REQUIRED_CERT_FIELDS
+            },
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class ProjectSpec:
+    """
+    Payload progetto compensazione tipizzato.
+    
+    Attributes:
+        project_id (str): ID progetto
+        project_name (str): Nome progetto
+        location (str): Località
+        project_type (str): Tipo (vedi PROJECT_TYPES)
+        organization (str): Organizzazione
+        extra (Mapping): Campi opzionali (start_date, ...)
+    
+    Examples:
+        >>> spec = ProjectSpec.from_dict(project_data)
+        >>> spec.project_id
+        'PROJ-REFORESTATION-2025'
+    """
+    
+    project_id: str
+    project_name: str
+    location: str
+    project_type: str
+    organization: str
+    extra: Mapping[str, Any] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializza in dict project_data"""
+        return {
+            "project_id": self.project_id,
+            "project_name": self.project_name,
+            "location": self.location,
+            "project_type": self.project_type,
+            "organization": self.organization,
+            **self.extra,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ProjectSpec:
+        """
+        Crea spec da dict project_data.
+        
+        Raises:
+            CompensationError: Se manca un campo obbligatorio
+        """
+        missing = REQUIRED_PROJECT_FIELDS - data.keys()
+        if missing:
+            missing = sorted(missing)
+            raise CompensationError(
+                f"Missing required project field: {', '.join(missing)}",
+                code="MISSING_PROJECT_FIELD",
+                details={"field": missing[0], "fields": missing}
+            )
+        
+        return cls(
+            project_id=data["project_id"],
+            project_name=data["project_name"],
+            location=data["location"],
+            project_type=data["project_type"],
+            organization=data["organization"],
+            extra={
+                key: value
+                for key, value in data.items()
+                if key not in REQUIRED_PROJECT_FIELDS
+            },
+        )
+
+
 # ============================================================================
 # EXPORT
 # ============================================================================
@@ -1237,4 +1563,12 @@ __all__ = [
     
     # UTXO
     "UTXOKey",
+    
+    # Certificate / project payloads
+    "CertificateSpec",
+    "ProjectSpec",
+    
+    # Certificate metadata
+    "CertificateMetadataRegistry",
+    "certificate_metadata_registry",
 ]
@@ -17,14 +17,19 @@ Performance:
 - Memory-hard (no GPU/ASIC advantage)
 """
 
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
+import itertools
+import struct
+import threading
 import time
 
 # Internal imports
 from carbon_chain.domain.models import BlockHeader
 from carbon_chain.domain.crypto_core import (
     compute_pow_hash_scrypt,
+    pow_hash_scrypt,
     check_pow_difficulty,
+    POW_ZERO_PREFIXES,
 )
 from carbon_chain.errors import (
     PoWError,
@@ -39,6 +44,12 @@ from carbon_chain.logging_setup import get_logger, PerformanceLogger
 
 logger = get_logger("pow")
 
+# Nonce serializzato in coda all'header PoW
+_NONCE_STRUCT = struct.Struct(">Q")
+
+# Nonce per stripe reclamata da ogni worker (ricerca parallela)
+NONCE_STRIPE = 256
+
 
 # ============================================================================
 # DIFFICULTY CALCULATION
@@ -199,10 +210,151 @@ def verify_block_pow(block_header: BlockHeader) -> bool:
 # MINING
 # ============================================================================
 
+def search_nonce(
+    header_bytes: bytes,
+    difficulty: int,
+    start: int = 0,
+    count: int = 2**32,
+    stop_event: Optional[threading.Event] = None,
+    deadline: Optional[float] = None
+) -> Tuple[Optional[int], int]:
+    """
+    Ricerca nonce in [start, start + count).
+    
+    Loop stretto sul kernel scrypt nativo (pow_hash_scrypt): nessun
+    logging né allocazione di header per tentativo, il GIL è rilasciato
+    durante ogni hash. Il prefisso fisso è copiato una volta in un
+    buffer; per tentativo vengono riscritti solo gli 8 byte del nonce.
+    
+    Args:
+        header_bytes: Header serializzato senza nonce
+        difficulty: Byte zero richiesti
+        start: Primo nonce
+        count: Numero nonce da provare
+        stop_event: Se settato, ricerca interrotta
+        deadline: time.monotonic() limite (None = nessuno)
+    
+    Returns:
+        Tuple: (nonce trovato o None, nonce provati)
+    """
+    kernel = pow_hash_scrypt
+    
+    # Valida difficulty una volta, poi confronto prefisso inline per nonce
+    check_pow_difficulty(bytes(32), difficulty)
+    target_prefix = POW_ZERO_PREFIXES[difficulty]
+    
+    # Prefisso header fisso + slot nonce (8 byte big-endian)
+    prefix_len = len(header_bytes)
+    buffer = bytearray(header_bytes)
+    buffer.extend(bytes(8))
+    pack_nonce = _NONCE_STRUCT.pack_into
+    
+    for nonce in range(start, start + count):
+        if stop_event is not None and stop_event.is_set():
+            return None, nonce - start
+        
+        if deadline is not None and time.monotonic() > deadline:
+            return None, nonce - start
+        
+        pack_nonce(buffer, prefix_len, nonce)
+        digest = kernel(buffer)
+        
+        if digest.startswith(target_prefix):
+            return nonce, nonce - start + 1
+    
+    return None, count
+
+
+def search_nonce_parallel(
+    header_bytes: bytes,
+    difficulty: int,
+    num_threads: int,
+    count: int = 2**32,
+    stop_event: Optional[threading.Event] = None,
+    deadline: Optional[float] = None,
+    stripe: int = NONCE_STRIPE
+) -> Tuple[Optional[int], int]:
+    """
+    Ricerca nonce multi-core su [0, count).
+    
+    Ogni worker reclama stripe disgiunte di nonce da un contatore
+    condiviso e le scansiona con search_nonce; il kernel scrypt rilascia
+    il GIL, quindi i thread girano in parallelo sui core. Il primo hit
+    ferma tutti i worker.
+    
+    Args:
+        header_bytes: Header serializzato senza nonce
+        difficulty: Byte zero richiesti
+        num_threads: Numero worker
+        count: Spazio nonce totale
+        stop_event: Se settato, ricerca interrotta
+        deadline: time.monotonic() limite (None = nessuno)
+        stripe: Nonce per stripe
+    
+    Returns:
+        Tuple: (nonce trovato o None, nonce provati)
+    """
+    # Stop già richiesto: nessun worker avviato
+    if stop_event is not None and stop_event.is_set():
+        return None, 0
+    
+    halt = threading.Event()
+    stripes = itertools.count(0, stripe)
+    result_lock = threading.Lock()
+    found: List[int] = []
+    tried_total = [0]
+    
+    def worker() -> None:
+        while not halt.is_set():
+            with result_lock:
+                stripe_start = next(stripes)
+            
+            if stripe_start >= count:
+                return
+            
+            nonce, tried = search_nonce(
+                header_bytes,
+                difficulty,
+                start=stripe_start,
+                count=min(stripe, count - stripe_start),
+                stop_event=halt,
+                deadline=deadline
+            )
+            
+            with result_lock:
+                tried_total[0] += tried
+                if nonce is not None:
+                    found.append(nonce)
+                    halt.set()
+            
+            if deadline is not None and time.monotonic() > deadline:
+                return
+    
+    workers = [
+        threading.Thread(target=worker, name=f"pow-worker-{i}", daemon=True)
+        for i in range(num_threads)
+    ]
+    for thread in workers:
+        thread.start()
+    
+    # Propaga stop esterno ai worker
+    while True:
+        alive = [thread for thread in workers if thread.is_alive()]
+        if not alive:
+            break
+        if stop_event is not None and stop_event.is_set():
+            halt.set()
+        alive[0].join(timeout=0.1)
+    
+    return (min(found) if found else None), tried_total[0]
+
+
 def mine_block_header(
     header: BlockHeader,
     max_nonce: int = 2**32,
-    timeout_seconds: Optional[int] = None
+    timeout_seconds: Optional[int] = None,
+    stop_event: Optional[threading.Event] = None,
+    num_threads: int = 1
 ) -> Optional[BlockHeader]:
     """
     Mina block header (trova nonce valido).
@@ -218,6 +370,8 @@ def mine_block_header(
         header: Header da minare (con nonce=0)
         max_nonce: Max tentativi (default 2^32)
         timeout_seconds: Timeout (None = no timeout)
+        stop_event: Se settato, mining interrotto (es. stop_mining)
+        num_threads: Worker paralleli (>1 = search_nonce_parallel)
     
     Returns:
         BlockHeader: Header con nonce valido, o None se non trovato
@@ -252,74 +406,78 @@ def mine_block_header(
             "height": header.height,
             "difficulty": header.difficulty,
             "max_nonce": max_nonce,
-            "timeout": timeout_seconds
+            "timeout": timeout_seconds,
+            "threads": num_threads
         }
     )
     
-    # Loop nonce
-    for nonce in range(max_nonce):
-        # Check timeout
-        if timeout_seconds:
-            elapsed = time.time() - start_time
-            if elapsed > timeout_seconds:
-                logger.warning(
-                    f"Mining timeout",
-                    extra_data={
-                        "nonces_tried": nonce,
-                        "elapsed": round(elapsed, 2)
-                    }
-                )
-                return None
-        
-        # Calcola hash
-        pow_hash = compute_pow_hash_scrypt(header_bytes, nonce)
-        
-        # Check difficulty
-        if check_pow_difficulty(pow_hash, header.difficulty):
-            # ✅ FOUND VALID NONCE!
-            elapsed = time.time() - start_time
-            hashrate = nonce / elapsed if elapsed > 0 else 0
-            
-            logger.info(
-                f"✅ Mining SUCCESS!",
-                extra_data={
-                    "height": header.height,
-                    "nonce": nonce,
-                    "difficulty": header.difficulty,
-                    "hash": pow_hash.hex()[:16] + "...",
-                    "nonces_tried": nonce,
-                    "time_seconds": round(elapsed, 2),
-                    "hashrate": round(hashrate, 2)
-                }
-            )
-            
-            # Create new header with valid nonce
-            from dataclasses import replace
-            return replace(header, nonce=nonce)
-        
-        # Log progress ogni 1000 nonce
-        if nonce > 0 and nonce % 1000 == 0:
-            elapsed = time.time() - start_time
-            hashrate = nonce / elapsed if elapsed > 0 else 0
-            
-            logger.debug(
-                f"Mining progress",
-                extra_data={
-                    "nonces_tried": nonce,
-                    "hashrate": round(hashrate, 2),
-                    "elapsed": round(elapsed, 2)
-                }
-            )
+    deadline = time.monotonic() + timeout_seconds if timeout_seconds else None
+    
+    if num_threads > 1:
+        nonce, tried = search_nonce_parallel(
+            header_bytes,
+            header.difficulty,
+            num_threads,
+            count=max_nonce,
+            stop_event=stop_event,
+            deadline=deadline
+        )
+    else:
+        nonce, tried = search_nonce(
+            header_bytes,
+            header.difficulty,
+            count=max_nonce,
+            stop_event=stop_event,
+            deadline=deadline
+        )
     
-    # Max nonce raggiunto senza successo
     elapsed = time.time() - start_time
-    logger.warning(
-        f"Mining failed: max nonce reached",
-        extra_data={
-            "max_nonce": max_nonce,
-            "time_seconds": round(elapsed, 2)
-        }
-    )
+    
+    if nonce is not None:
+        # ✅ FOUND VALID NONCE!
+        hashrate = tried / elapsed if elapsed > 0 else 0
+        
+        logger.info(
+            f"✅ Mining SUCCESS!",
+            extra_data={
+                "height": header.height,
+                "nonce": nonce,
+                "difficulty": header.difficulty,
+                "nonces_tried": tried,
+                "time_seconds": round(elapsed, 2),
+                "hashrate": round(hashrate, 2)
+            }
+        )
+        
+        # Create new header with valid nonce
+        from dataclasses import replace
+        return replace(header, nonce=nonce)
+    
+    if stop_event is not None and stop_event.is_set():
+        logger.info(
+            f"Mining stopped",
+            extra_data={
+                "nonces_tried": tried,
+                "elapsed": round(elapsed, 2)
+            }
+        )
+    elif tried < max_nonce:
+        logger.warning(
+            f"Mining timeout",
+            extra_data={
+                "nonces_tried": tried,
+                "elapsed": round(elapsed, 2)
+            }
+        )
+    else:
+        # Max nonce raggiunto senza successo
+        logger.warning(
+            f"Mining failed: max nonce reached",
+            extra_data={
+                "max_nonce": max_nonce,
+                "time_seconds": round(elapsed, 2)
+            }
+        )
     
     return None
 
@@ -429,6 +587,8 @@ __all__ = [
     "verify_block_pow",
     
     # Mining
+    "search_nonce",
+    "search_nonce_parallel",
     "mine_block_header",
     "estimate_mining_time",
     
@@ -17,12 +17,15 @@ Performance:
 - O(1) lookup per UTXO key
 - O(1) add/remove
 - O(n) query per address (con index)
+- Query per address con lock striped (read/write) per shard
 """
 
 from __future__ import annotations
-from typing import Dict, List, Tuple, Set, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Set, Optional
 from collections import defaultdict
+from contextlib import contextmanager, ExitStack
 from dataclasses import dataclass, field
+import logging
 import threading
 
 # Internal imports
@@ -46,6 +49,69 @@ from carbon_chain.constants import validate_amount
 
 logger = get_logger("utxo")
 
+# Numero shard lock per address (query per address contendono solo il proprio)
+UTXO_LOCK_SHARDS = 64
+
+
+# ============================================================================
+# READ/WRITE LOCK
+# ============================================================================
+
+class _RWLock:
+    """
+    Lock readers/writer (non rientrante).
+    
+    Più reader concorrenti, un solo writer. I writer in attesa hanno
+    precedenza sui nuovi reader (no starvation dei writer).
+    """
+    
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+    
+    def acquire_read(self) -> None:
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+    
+    def release_read(self) -> None:
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+    
+    def acquire_write(self) -> None:
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+    
+    def release_write(self) -> None:
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+    
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+    
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
 
 # ============================================================================
 # UTXO SET
@@ -61,13 +127,17 @@ class UTXOSet:
     - Statistiche (total supply, certified amount, etc.)
     
     Thread Safety:
-        - Protected da RLock per operazioni concorrenti
-        - Safe per multi-threading
+        - RLock globale serializza i writer e le operazioni sull'intero set
+        - Query per address: read lock sullo shard dell'address
+          (hash(address) % UTXO_LOCK_SHARDS), senza lock globale
+        - Writer: RLock globale + write lock sugli shard degli address toccati
+        - Ordine lock: globale → shard in ordine crescente
     
     Attributes:
         _utxos (dict): Mapping UTXOKey → TxOutput
         _address_index (dict): Index address → set[UTXOKey]
-        _lock (RLock): Lock per thread-safety
+        _lock (RLock): Lock globale (writer, operazioni su tutto il set)
+        _shard_locks (list): Lock read/write striped per address
     
     Examples:
         >>> utxo_set = UTXOSet()
@@ -88,9 +158,33 @@ class UTXOSet:
         
         # Thread safety
         self._lock = threading.RLock()
+        self._shard_locks = [_RWLock() for _ in range(UTXO_LOCK_SHARDS)]
         
         logger.debug("UTXOSet initialized")
     
+    def _shard_indexes(self, addresses: Optional[Iterable[str]]) -> List[int]:
+        """Indici shard (ordinati, unici) per address (None = tutti)"""
+        if addresses is None:
+            return list(range(UTXO_LOCK_SHARDS))
+        
+        return sorted({hash(address) % UTXO_LOCK_SHARDS for address in addresses})
+    
+    @contextmanager
+    def _read_shards(self, addresses: Iterable[str]) -> Iterator[None]:
+        """Read lock sugli shard degli address"""
+        with ExitStack() as stack:
+            for idx in self._shard_indexes(addresses):
+                stack.enter_context(self._shard_locks[idx].read())
+            yield
+    
+    @contextmanager
+    def _write_shards(self, addresses: Optional[Iterable[str]]) -> Iterator[None]:
+        """Write lock sugli shard degli address (None = tutti)"""
+        with ExitStack() as stack:
+            for idx in self._shard_indexes(addresses):
+                stack.enter_context(self._shard_locks[idx].write())
+            yield
+    
     def add_utxo(self, utxo_key: UTXOKey, output: TxOutput) -> None:
         """
         Aggiungi UTXO al set.
@@ -111,24 +205,29 @@ class UTXOSet:
             >>> output = TxOutput(100, "addr1")
             >>> utxo_set.add_utxo(key, output)
         """
-        with self._lock:
-            # Check duplicato
-            if utxo_key in self._utxos:
-                logger.warning(
-                    f"UTXO already exists",
-                    extra_data={"utxo_key": str(utxo_key)}
-                )
-                raise UTXOError(
-                    f"UTXO {utxo_key} already exists in set",
-                    code="UTXO_DUPLICATE"
-                )
-            
-            # Aggiungi a main storage
-            self._utxos[utxo_key] = output
-            
-            # Aggiorna address index
-            self._address_index[output.address].add(utxo_key)
-            
+        with self._lock, self._write_shards((output.address,)):
+            self._add_utxo_locked(utxo_key, output)
+    
+    def _add_utxo_locked(self, utxo_key: UTXOKey, output: TxOutput) -> None:
+        """add_utxo senza lock (chiamante tiene lock globale + shard)"""
+        # Check duplicato
+        if utxo_key in self._utxos:
+            logger.warning(
+                f"UTXO already exists",
+                extra_data={"utxo_key": str(utxo_key)}
+            )
+            raise UTXOError(
+                f"UTXO {utxo_key} already exists in set",
+                code="UTXO_DUPLICATE"
+            )
+        
+        # Aggiungi a main storage
+        self._utxos[utxo_key] = output
+        
+        # Aggiorna address index
+        self._address_index[output.address].add(utxo_key)
+        
+        if logger.is_enabled_for(logging.DEBUG):
             logger.debug(
                 f"UTXO added",
                 extra_data={
@@ -166,22 +265,36 @@ class UTXOSet:
         """
         with self._lock:
             # Check esistenza
-            if utxo_key not in self._utxos:
+            output = self._utxos.get(utxo_key)
+            if output is None:
                 raise UTXONotFoundError(
                     f"UTXO {utxo_key} not found in set",
                     code="UTXO_NOT_FOUND"
                 )
             
-            # Rimuovi da main storage
-            output = self._utxos.pop(utxo_key)
-            
-            # Rimuovi da address index
-            self._address_index[output.address].discard(utxo_key)
-            
-            # Cleanup address index se vuoto
-            if not self._address_index[output.address]:
-                del self._address_index[output.address]
-            
+            with self._write_shards((output.address,)):
+                return self._remove_utxo_locked(utxo_key)
+    
+    def _remove_utxo_locked(self, utxo_key: UTXOKey) -> TxOutput:
+        """remove_utxo senza lock (chiamante tiene lock globale + shard)"""
+        # Check esistenza
+        if utxo_key not in self._utxos:
+            raise UTXONotFoundError(
+                f"UTXO {utxo_key} not found in set",
+                code="UTXO_NOT_FOUND"
+            )
+        
+        # Rimuovi da main storage
+        output = self._utxos.pop(utxo_key)
+        
+        # Rimuovi da address index
+        self._address_index[output.address].discard(utxo_key)
+        
+        # Cleanup address index se vuoto
+        if not self._address_index[output.address]:
+            del self._address_index[output.address]
+        
+        if logger.is_enabled_for(logging.DEBUG):
             logger.debug(
                 f"UTXO removed",
                 extra_data={
@@ -190,8 +303,8 @@ class UTXOSet:
                     "total_utxos": len(self._utxos)
                 }
             )
-            
-            return output
+        
+        return output
     
     def get_utxo(self, utxo_key: UTXOKey) -> Optional[TxOutput]:
         """
@@ -257,7 +370,7 @@ class UTXOSet:
             >>> len(utxos)
             2
         """
-        with self._lock:
+        with self._read_shards((address,)):
             utxo_keys = self._address_index.get(address, set())
             
             result = []
@@ -303,6 +416,124 @@ class UTXOSet:
             if output.is_spendable()
         ]
     
+    def get_utxos_for_addresses(
+        self,
+        addresses: List[str]
+    ) -> Dict[str, List[Tuple[UTXOKey, TxOutput]]]:
+        """
+        Ottieni UTXO per più address (bulk, read lock sui soli shard coinvolti).
+        
+        Args:
+            addresses: Address da query (duplicati ignorati)
+        
+        Returns:
+            dict: address → lista (key, output)
+        
+        Examples:
+            >>> utxo_set = UTXOSet()
+            >>> utxo_set.add_utxo(UTXOKey("tx1", 0), TxOutput(100, "addr1"))
+            >>> result = utxo_set.get_utxos_for_addresses(["addr1", "addr2"])
+            >>> len(result["addr1"]), len(result["addr2"])
+            (1, 0)
+        """
+        with self._read_shards(addresses):
+            result = {}
+            
+            for address in addresses:
+                if address in result:
+                    continue
+                
+                utxos = []
+                for utxo_key in self._address_index.get(address, ()):
+                    output = self._utxos.get(utxo_key)
+                    if output:
+                        utxos.append((utxo_key, output))
+                
+                result[address] = utxos
+            
+            return result
+    
+    def get_spendable_utxos_for_addresses(
+        self,
+        addresses: List[str]
+    ) -> Dict[str, List[Tuple[UTXOKey, TxOutput]]]:
+        """
+        Ottieni UTXO spendibili per più address (bulk).
+        
+        Args:
+            addresses: Address da query
+        
+        Returns:
+            dict: address → lista (key, output) spendibili
+        """
+        return {
+            address: [
+                (key, output)
+                for key, output in utxos
+                if output.is_spendable()
+            ]
+            for address, utxos in self.get_utxos_for_addresses(addresses).items()
+        }
+    
+    def select_for_amount(
+        self,
+        address: str,
+        target_amount: int
+    ) -> Tuple[List[Tuple[UTXOKey, TxOutput]], int]:
+        """
+        Seleziona UTXO spendibili per coprire target (greedy, largest first).
+        
+        Filtro spendibili e selezione in un solo passaggio sotto read
+        lock: nessuna lista intermedia di tutti gli UTXO dell'address.
+        Caso comune (il più grande UTXO copre il target): un max() O(N),
+        niente sort.
+        
+        Args:
+            address: Address mittente
+            target_amount: Amount target (Satoshi)
+        
+        Returns:
+            Tuple: (selected, total) - total < target se fondi insufficienti
+                (selected = tutti gli spendibili)
+        
+        Examples:
+            >>> utxo_set = UTXOSet()
+            >>> utxo_set.add_utxo(UTXOKey("tx1", 0), TxOutput(100, "addr1"))
+            >>> utxo_set.add_utxo(UTXOKey("tx2", 0), TxOutput(50, "addr1"))
+            >>> selected, total = utxo_set.select_for_amount("addr1", 120)
+            >>> total
+            150
+        """
+        with self._read_shards((address,)):
+            utxos = self._utxos
+            spendable = [
+                (utxo_key, output)
+                for utxo_key in self._address_index.get(address, ())
+                if (output := utxos.get(utxo_key)) is not None and output.is_spendable()
+            ]
+        
+        if not spendable:
+            return [], 0
+        
+        amount_key = lambda x: x[1].amount
+        
+        # Fast path: UTXO più grande sufficiente da solo
+        largest = max(spendable, key=amount_key)
+        if largest[1].amount >= target_amount:
+            return [largest], largest[1].amount
+        
+        selected = []
+        total = 0
+        
+        for utxo_key, output in sorted(spendable, key=amount_key, reverse=True):
+            selected.append((utxo_key, output))
+            total += output.amount
+            
+            if total >= target_amount:
+                break
+        
+        return selected, total
+    
     def get_balance(self, address: str) -> int:
         """
         Calcola balance totale per address (solo spendibili).
@@ -476,35 +707,16 @@ class UTXOSet:
         with self._lock:
             txid = tx.compute_txid()
             
-            # Step 1: Rimuovi input (se non COINBASE)
+            # Address toccati: owner degli input + destinatari output
+            touched = {output.address for output in tx.outputs}
             if not tx.is_coinbase():
                 for inp in tx.inputs:
-                    utxo_key = UTXOKey(inp.prev_txid, inp.prev_output_index)
-                    
-                    # Check esistenza
-                    if not self.contains(utxo_key):
-                        raise UTXONotFoundError(
-                            f"Input UTXO {utxo_key} not found",
-                            code="INPUT_UTXO_NOT_FOUND"
-                        )
-                    
-                    # Check spendibile
-                    output = self.get_utxo(utxo_key)
-                    if not output.is_spendable():
-                        raise UTXONotSpendableError(
-                            f"Input UTXO {utxo_key} not spendable "
-                            f"(compensated={output.is_compensated}, burned={output.is_burned})",
-                            code="INPUT_NOT_SPENDABLE"
-                        )
-                    
-                    # Rimuovi
-                    self.remove_utxo(utxo_key)
+                    spent = self._utxos.get(UTXOKey(inp.prev_txid, inp.prev_output_index))
+                    if spent is not None:
+                        touched.add(spent.address)
             
-            # Step 2: Aggiungi output (se non BURN)
-            if not tx.is_burn():
-                for idx, output in enumerate(tx.outputs):
-                    utxo_key = UTXOKey(txid, idx)
-                    self.add_utxo(utxo_key, output)
+            with self._write_shards(touched):
+                self._apply_transaction_locked(tx, txid)
             
             logger.info(
                 f"Transaction applied to UTXO set",
@@ -517,6 +729,38 @@ class UTXOSet:
                 }
             )
     
+    def _apply_transaction_locked(self, tx: Transaction, txid: str) -> None:
+        """apply_transaction con lock globale + shard già acquisiti"""
+        # Step 1: Rimuovi input (se non COINBASE)
+        if not tx.is_coinbase():
+            for inp in tx.inputs:
+                utxo_key = UTXOKey(inp.prev_txid, inp.prev_output_index)
+                
+                # Check esistenza
+                if not self.contains(utxo_key):
+                    raise UTXONotFoundError(
+                        f"Input UTXO {utxo_key} not found",
+                        code="INPUT_UTXO_NOT_FOUND"
+                    )
+                
+                # Check spendibile
+                output = self.get_utxo(utxo_key)
+                if not output.is_spendable():
+                    raise UTXONotSpendableError(
+                        f"Input UTXO {utxo_key} not spendable "
+                        f"(compensated={output.is_compensated}, burned={output.is_burned})",
+                        code="INPUT_NOT_SPENDABLE"
+                    )
+                
+                # Rimuovi
+                self._remove_utxo_locked(utxo_key)
+        
+        # Step 2: Aggiungi output (se non BURN)
+        if not tx.is_burn():
+            for idx, output in enumerate(tx.outputs):
+                utxo_key = UTXOKey(txid, idx)
+                self._add_utxo_locked(utxo_key, output)
+    
     def rollback_transaction(self, tx: Transaction) -> None:
         """
         Rollback transazione (operazione inversa di apply).
@@ -540,10 +784,11 @@ class UTXOSet:
             
             # Step 1: Rimuovi output (inverso di add)
             if not tx.is_burn():
-                for idx in range(len(tx.outputs)):
-                    utxo_key = UTXOKey(txid, idx)
-                    if self.contains(utxo_key):
-                        self.remove_utxo(utxo_key)
+                with self._write_shards(output.address for output in tx.outputs):
+                    for idx in range(len(tx.outputs)):
+                        utxo_key = UTXOKey(txid, idx)
+                        if self.contains(utxo_key):
+                            self._remove_utxo_locked(utxo_key)
             
             # Step 2: Re-aggiungi input (inverso di remove)
             # TODO: Richiede prev outputs storage
@@ -603,7 +848,7 @@ class UTXOSet:
             >>> # ... modifiche ...
             >>> utxo_set.restore_snapshot(snapshot)  # Ripristina stato
         """
-        with self._lock:
+        with self._lock, self._write_shards(None):
             self._utxos = dict(snapshot.utxos)
             self._address_index = dict(snapshot.address_index)
             
@@ -619,7 +864,7 @@ class UTXOSet:
         Warning:
             Operazione distruttiva
         """
-        with self._lock:
+        with self._lock, self._write_shards(None):
             self._utxos.clear()
             self._address_index.clear()
             
@@ -315,13 +315,14 @@ class TransactionValidator:
             
             # Valida metadata
             if output.certificate_metadata:
-                for field in REQUIRED_CERT_FIELDS:
-                    if field not in output.certificate_metadata:
-                        raise CertificateError(
-                            f"Missing required certificate field: {field}",
-                            code="MISSING_CERT_FIELD",
-                            details={"field": field}
-                        )
+                missing = REQUIRED_CERT_FIELDS - output.certificate_metadata.keys()
+                if missing:
+                    missing = sorted(missing)
+                    raise CertificateError(
+                        f"Missing required certificate field: {', '.join(missing)}",
+                        code="MISSING_CERT_FIELD",
+                        details={"field": missing[0], "fields": missing}
+                    )
     
     def _validate_compensation(self, tx: Transaction) -> None:
         """Validazione ASSIGN_COMPENSATION"""
@@ -795,13 +796,14 @@ class CertificateValidator:
             )
         
         # 3. Check required fields
-        for field in REQUIRED_CERT_FIELDS:
-            if field not in metadata:
-                raise CertificateError(
-                    f"Missing required certificate field: {field}",
-                    code="MISSING_CERT_FIELD",
-                    details={"field": field}
-                )
+        missing = REQUIRED_CERT_FIELDS - metadata.keys()
+        if missing:
+            missing = sorted(missing)
+            raise CertificateError(
+                f"Missing required certificate field: {', '.join(missing)}",
+                code="MISSING_CERT_FIELD",
+                details={"field": missing[0], "fields": missing}
+            )
     
     def register_certificate(self, cert_hash: bytes, txid: str) -> None:
         """Registra certificato nell'index"""
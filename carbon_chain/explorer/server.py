@@ -219,11 +219,8 @@ def create_explorer_app(
     async def address_detail(request: Request, address: str):
         """Address/wallet detail page"""
         try:
-            # Get balance
-            balance = blockchain.utxo_set.get_balance(address)
-            
-            # Get UTXOs
-            utxos = blockchain.utxo_set.get_utxos(address)
+            # Balance + UTXOs (singola lettura)
+            balance, utxos = blockchain.get_address_state(address)
             
             context = {
                 "request": request,
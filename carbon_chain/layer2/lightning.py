@@ -242,9 +242,9 @@ class PaymentChannel:
             timestamp=int(time.time())
         )
         
-        tx.metadata["channel_id"] = self.channel_id
-        tx.metadata["sequence"] = self.sequence
-        tx.metadata["commitment_type"] = "channel_close"
+        tx.set_metadata("channel_id", self.channel_id)
+        tx.set_metadata("sequence", self.sequence)
+        tx.set_metadata("commitment_type", "channel_close")
         
         return tx
     
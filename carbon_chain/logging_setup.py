@@ -14,14 +14,19 @@ Features:
 - Context enrichment
 - Performance tracking
 - Audit trail
+- Handler asincroni (QueueHandler + QueueListener)
 """
 
 import logging
 import logging.handlers
 import json
 import sys
+import copy
+import queue
+import atexit
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 import traceback
 
@@ -183,6 +188,19 @@ class CarbonChainLogger:
         """Clear context"""
         self._context.clear()
     
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        True se un messaggio di questo livello verrebbe emesso.
+        
+        Per hot path: evita di costruire extra_data (slicing, str(),
+        hash) quando il livello è filtrato.
+        
+        Example:
+            >>> if logger.is_enabled_for(logging.DEBUG):
+            ...     logger.debug("UTXO added", extra_data={...})
+        """
+        return self._logger.isEnabledFor(level)
+    
     def _log(
         self,
         level: int,
@@ -191,6 +209,10 @@ class CarbonChainLogger:
         exc_info: Optional[Exception] = None
     ):
         """Internal log method"""
+        # Livello filtrato: nessun merge del context
+        if not self._logger.isEnabledFor(level):
+            return
+        
         # Merge context + extra_data
         merged_extra = {**self._context}
         if extra_data:
@@ -229,6 +251,83 @@ class CarbonChainLogger:
         self._log(logging.ERROR, message, extra_data, exc_info=sys.exc_info())
 
 
+# ============================================================================
+# ASYNC HANDLERS (QUEUE)
+# ============================================================================
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler che preserva il LogRecord.
+    
+    La coda è in-process (nessun pickling): a differenza di
+    QueueHandler.prepare() non pre-formatta il messaggio né rimuove
+    exc_info, così JSONFormatter/ColoredTextFormatter lavorano sul
+    record originale nel thread del listener.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Risolvi args subito (possono essere oggetti mutabili)"""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Listener attivi: chiave → QueueListener
+_queue_listeners: Dict[str, logging.handlers.QueueListener] = {}
+_queue_listeners_lock = threading.Lock()
+
+
+def _attach_queue_handler(
+    logger: logging.Logger,
+    handlers: List[logging.Handler],
+    key: str
+) -> None:
+    """
+    Collega handlers al logger tramite coda.
+    
+    Il logger riceve solo un QueueHandler (enqueue, nessun I/O nel thread
+    chiamante); un QueueListener in background scrive sugli handlers.
+    
+    Args:
+        logger: Logger destinazione
+        handlers: Handler reali (file, console, ...)
+        key: Chiave listener (un listener attivo per chiave)
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        *handlers,
+        respect_handler_level=True
+    )
+    
+    with _queue_listeners_lock:
+        previous = _queue_listeners.pop(key, None)
+        if previous is not None:
+            previous.stop()
+        
+        listener.start()
+        _queue_listeners[key] = listener
+    
+    logger.addHandler(_RecordQueueHandler(log_queue))
+
+
+def shutdown_logging() -> None:
+    """
+    Ferma i listener asincroni (flush dei record in coda).
+    
+    Registrato con atexit: i log emessi prima dell'uscita non vanno persi.
+    """
+    with _queue_listeners_lock:
+        for listener in _queue_listeners.values():
+            listener.stop()
+        _queue_listeners.clear()
+
+
+atexit.register(shutdown_logging)
+
+
 # ============================================================================
 # SETUP FUNCTION
 # ============================================================================
@@ -241,6 +340,7 @@ def setup_logging(
     log_rotation_mb: int = 100,
     log_retention_days: int = 30,
     enable_console: bool = True,
+    async_logging: bool = True,
 ) -> CarbonChainLogger:
     """
     Setup logging system completo.
@@ -253,6 +353,8 @@ def setup_logging(
         log_rotation_mb: MB prima rotation
         log_retention_days: Giorni retention
         enable_console: Log anche su console
+        async_logging: Se True, handler dietro QueueHandler (I/O su thread
+            listener, il chiamante paga solo l'enqueue)
     
     Returns:
         CarbonChainLogger: Logger configurato
@@ -272,6 +374,8 @@ def setup_logging(
     # Clear existing handlers
     root_logger.handlers.clear()
     
+    handlers: List[logging.Handler] = []
+    
     # ========================================================================
     # FILE HANDLER (with rotation)
     # ========================================================================
@@ -299,7 +403,7 @@ def setup_logging(
                 )
             )
         
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
     
     # ========================================================================
     # CONSOLE HANDLER
@@ -311,7 +415,7 @@ def setup_logging(
         # Use colored formatter for console
         console_handler.setFormatter(ColoredTextFormatter())
         
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # ========================================================================
     # ERROR FILE HANDLER (separate error log)
@@ -338,7 +442,17 @@ def setup_logging(
                 )
             )
         
-        root_logger.addHandler(error_handler)
+        handlers.append(error_handler)
+    
+    # ========================================================================
+    # ATTACH (async via queue o diretto)
+    # ========================================================================
+    
+    if async_logging and handlers:
+        _attach_queue_handler(root_logger, handlers, key=root_logger.name)
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
     
     # Wrap in CarbonChainLogger
     return CarbonChainLogger(root_logger)
@@ -446,11 +560,16 @@ class AuditLogger:
         self.logger = logging.getLogger("carbonchain.audit")
         self.logger.setLevel(logging.INFO)
         
-        # File handler (no rotation per audit - keep all)
+        # Un solo writer per audit file (più AuditLogger condividono il logger)
+        listener_key = f"audit:{audit_file.resolve()}"
+        if listener_key in _queue_listeners:
+            return
+        
+        # File handler (no rotation per audit - keep all), scritto dal listener
         handler = logging.FileHandler(audit_file, encoding='utf-8')
         handler.setFormatter(JSONFormatter(include_extra=True))
         
-        self.logger.addHandler(handler)
+        _attach_queue_handler(self.logger, [handler], key=listener_key)
     
     def log_certificate_creation(
         self,
@@ -496,6 +615,44 @@ class AuditLogger:
             }
         )
     
+    def log_certificate_batch(self, certificates: list):
+        """
+        Log batch certificate creation (una sola entry).
+        
+        Args:
+            certificates: Lista {"certificate_id", "total_kg", "issuer", "txid"}
+        """
+        self.logger.info(
+            "Certificate batch created",
+            extra={
+                'extra_data': {
+                    "action": "certificate_batch_created",
+                    "count": len(certificates),
+                    "certificates": certificates,
+                    "timestamp": datetime.utcnow().isoformat()
+                }
+            }
+        )
+    
+    def log_compensation_batch(self, compensations: list):
+        """
+        Log batch compensation (una sola entry).
+        
+        Args:
+            compensations: Lista {"project_id", "amount_kg", "certificate_id", "txid"}
+        """
+        self.logger.info(
+            "Compensation batch executed",
+            extra={
+                'extra_data': {
+                    "action": "compensation_batch",
+                    "count": len(compensations),
+                    "compensations": compensations,
+                    "timestamp": datetime.utcnow().isoformat()
+                }
+            }
+        )
+    
     def log_block_added(self, height: int, block_hash: str, tx_count: int):
         """Log block addition"""
         self.logger.info(
@@ -538,6 +695,7 @@ __all__ = [
     "setup_logging",
     "get_logger",
     "get_default_logger",
+    "shutdown_logging",
     "CarbonChainLogger",
     "PerformanceLogger",
     "AuditLogger",
@@ -14,7 +14,7 @@ Features:
 - Query API
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 import time
 
 # Internal imports
@@ -23,13 +23,13 @@ from carbon_chain.domain.models import (
     Transaction,
     TxInput,
     TxOutput,
+    CertificateSpec,
+    certificate_metadata_registry,
 )
 from carbon_chain.domain.blockchain import Blockchain
-from carbon_chain.domain.crypto_core import compute_certificate_hash
 from carbon_chain.constants import (
     TxType,
     CertificateState,
-    REQUIRED_CERT_FIELDS,
 )
 from carbon_chain.errors import (
     CertificateError,
@@ -74,6 +74,9 @@ class CertificateService:
     def __init__(self, blockchain: Blockchain, config: ChainSettings):
         self.blockchain = blockchain
         self.config = config
+        
+        # Cache info certificati: cert_id → (blockchain epoch, info)
+        self._cert_info_cache: Dict[str, Tuple[int, Optional[Dict]]] = {}
     
     # ========================================================================
     # CERTIFICATE CREATION
@@ -83,9 +86,10 @@ class CertificateService:
         self,
         wallet: HDWallet,
         from_address_index: int,
-        certificate_data: Dict,
+        certificate_data: Union[Dict, CertificateSpec],
         amount_kg: int,
-        change_address_index: Optional[int] = None
+        change_address_index: Optional[int] = None,
+        now: Optional[int] = None
     ) -> Transaction:
         """
         Crea transazione assignment certificato.
@@ -103,9 +107,11 @@ class CertificateService:
                 "issuer": str,
                 "issue_date": int,
                 ... (altri campi opzionali)
-            }
+            } oppure CertificateSpec
             amount_kg: Amount kg CO2 da certificare (Satoshi)
             change_address_index: Change address index
+            now: Timestamp tx (None = int(time.time())); i batch passano
+                un unico timestamp per tutte le tx
         
         Returns:
             Transaction: Tx firmata ASSIGN_CERT
@@ -126,31 +132,218 @@ class CertificateService:
             ...     wallet, 0, cert_data, 10000
             ... )
         """
-        # Validazione certificate data
-        self._validate_certificate_data(certificate_data)
+        # Validazione certificate data + hash (deterministico)
+        spec, cert_metadata, cert_hash = self._prepare_certificate(certificate_data)
+        self._check_certificate_amount(spec, amount_kg)
         
-        # Check amount non supera total
-        if amount_kg > certificate_data["total_kg"]:
-            raise CertificateError(
-                f"Amount {amount_kg} exceeds certificate total_kg {certificate_data['total_kg']}",
-                code="AMOUNT_EXCEEDS_TOTAL"
+        from_address = wallet.get_address(from_address_index)
+        
+        tx = self._build_certificate_assignment(
+            wallet,
+            from_address,
+            from_address_index,
+            spec,
+            cert_metadata,
+            cert_hash,
+            amount_kg,
+            change_address_index,
+            now if now is not None else int(time.time()),
+            self.blockchain.utxo_set.get_spendable_utxos_for_address(from_address)
+        )
+        
+        # Firma
+        signed_tx = wallet.sign_transaction(tx, from_address)
+        txid = signed_tx.compute_txid()
+        
+        # Audit log
+        audit_logger.log_certificate_creation(
+            cert_id=spec.certificate_id,
+            total_kg=spec.total_kg,
+            issuer=spec.issuer,
+            txid=txid
+        )
+        
+        logger.info(
+            "Certificate assignment transaction created",
+            extra_data={
+                "txid": txid[:16] + "...",
+                "cert_id": spec.certificate_id,
+                "amount_kg": amount_kg
+            }
+        )
+        
+        return signed_tx
+    
+    def create_certificate_assignments_batch(
+        self,
+        wallet: HDWallet,
+        assignments: List[Tuple[int, Union[Dict, CertificateSpec], int, Optional[int]]],
+        now: Optional[int] = None
+    ) -> List[Transaction]:
+        """
+        Crea batch di transazioni assignment certificato.
+        
+        Rispetto a N chiamate create_certificate_assignment:
+        - UTXO di tutti gli address letti con una sola query bulk
+        - Validazione + hash memoizzati per certificate_data duplicati
+        - Firma batch (keypair risolto una volta per address)
+        - Una sola entry audit log
+        
+        UTXO selezionati da una tx non vengono riusati dalle successive.
+        
+        Args:
+            wallet: HD Wallet
+            assignments: Lista (from_address_index, certificate_data
+                (dict o CertificateSpec), amount_kg, change_address_index)
+            now: Timestamp comune per tutte le tx (None = time.time())
+        
+        Returns:
+            List[Transaction]: Tx firmate ASSIGN_CERT (stesso ordine)
+        
+        Raises:
+            CertificateError: Se un assignment è invalido (nessuna tx creata)
+        
+        Examples:
+            >>> txs = service.create_certificate_assignments_batch(
+            ...     wallet,
+            ...     [(0, cert_a, 1000, None), (0, cert_b, 2000, None)]
+            ... )
+        """
+        if not assignments:
+            return []
+        
+        timestamp = now if now is not None else int(time.time())
+        
+        # Address lookup + bulk UTXO fetch
+        from_addresses = [
+            wallet.get_address(from_index)
+            for from_index, _, _, _ in assignments
+        ]
+        available = self.blockchain.utxo_set.get_spendable_utxos_for_addresses(
+            from_addresses
+        )
+        
+        # Memo validazione/hash: certificate_id → (certificate_data, prepared)
+        prepared: Dict[str, Tuple] = {}
+        specs = []
+        
+        unsigned = []
+        for (from_index, certificate_data, amount_kg, change_index), from_address in zip(
+            assignments, from_addresses
+        ):
+            if isinstance(certificate_data, CertificateSpec):
+                cert_id = certificate_data.certificate_id
+            else:
+                cert_id = certificate_data.get("certificate_id")
+            
+            cached = prepared.get(cert_id)
+            
+            if cached is None or cached[0] != certificate_data:
+                cached = (certificate_data, self._prepare_certificate(certificate_data))
+                prepared[cert_id] = cached
+            
+            spec, cert_metadata, cert_hash = cached[1]
+            self._check_certificate_amount(spec, amount_kg)
+            specs.append(spec)
+            
+            tx = self._build_certificate_assignment(
+                wallet,
+                from_address,
+                from_index,
+                spec,
+                cert_metadata,
+                cert_hash,
+                amount_kg,
+                change_index,
+                timestamp,
+                available[from_address]
             )
+            
+            # UTXO consumati non disponibili per le tx successive
+            spent = {(inp.prev_txid, inp.prev_output_index) for inp in tx.inputs}
+            available[from_address] = [
+                (key, output)
+                for key, output in available[from_address]
+                if (key.txid, key.output_index) not in spent
+            ]
+            
+            unsigned.append((tx, from_address))
+        
+        # Firma batch
+        signed_txs = wallet.sign_transactions(unsigned)
+        
+        # Audit log consolidato
+        audit_logger.log_certificate_batch([
+            {
+                "certificate_id": spec.certificate_id,
+                "total_kg": spec.total_kg,
+                "issuer": spec.issuer,
+                "txid": signed_tx.compute_txid()
+            }
+            for spec, signed_tx in zip(specs, signed_txs)
+        ])
         
-        # Calcola certificate hash (deterministico)
-        cert_hash = compute_certificate_hash(
-            cert_id=certificate_data["certificate_id"],
-            total_kg=certificate_data["total_kg"],
-            location=certificate_data["location"],
-            description=certificate_data["description"],
-            timestamp=certificate_data["issue_date"],
-            issuer=certificate_data.get("issuer", ""),
-            extra_data=certificate_data
+        logger.info(
+            "Certificate assignment batch created",
+            extra_data={
+                "count": len(signed_txs),
+                "certificates": len(prepared)
+            }
         )
         
-        from_address = wallet.get_address(from_address_index)
+        return signed_txs
+    
+    def _prepare_certificate(
+        self,
+        certificate_data: Union[Dict, CertificateSpec]
+    ) -> Tuple[CertificateSpec, Dict, bytes]:
+        """
+        Valida certificate data e calcola certificate hash.
+        
+        Returns:
+            Tuple: (spec, metadata dict, certificate hash)
+        """
+        spec = self._validate_certificate_data(certificate_data)
+        
+        if isinstance(certificate_data, CertificateSpec):
+            metadata = spec.to_dict()
+        else:
+            metadata = certificate_data
+        
+        # Calcola certificate hash (deterministico)
+        return spec, metadata, spec.compute_hash()
+    
+    def _check_certificate_amount(self, spec: CertificateSpec, amount_kg: int) -> None:
+        """Check amount non supera total_kg certificato"""
+        if amount_kg > spec.total_kg:
+            raise CertificateError(
+                f"Amount {amount_kg} exceeds certificate total_kg {spec.total_kg}",
+                code="AMOUNT_EXCEEDS_TOTAL"
+            )
+    
+    def _build_certificate_assignment(
+        self,
+        wallet: HDWallet,
+        from_address: str,
+        from_address_index: int,
+        spec: CertificateSpec,
+        certificate_metadata: Dict,
+        cert_hash: bytes,
+        amount_kg: int,
+        change_address_index: Optional[int],
+        timestamp: int,
+        spendable_utxos: List
+    ) -> Transaction:
+        """Costruisci tx ASSIGN_CERT non firmata da UTXO spendibili dati"""
+        # Registra metadata una volta: gli output condividono l'istanza canonica
+        cert_metadata = certificate_metadata_registry.register(cert_hash, certificate_metadata)
         
         # Select UTXO (solo standard, no certificati)
-        selected_utxos = self._select_standard_utxos(from_address, amount_kg)
+        selected_utxos = self._select_standard_utxos(
+            from_address,
+            amount_kg,
+            spendable_utxos
+        )
         
         if not selected_utxos:
             raise CertificateError(
@@ -176,10 +369,10 @@ class CertificateService:
                 amount=amount_kg,
                 address=from_address,  # Mantieni stesso address
                 is_certified=True,
-                certificate_id=certificate_data["certificate_id"],
+                certificate_id=spec.certificate_id,
                 certificate_hash=cert_hash,
-                certificate_total_kg=certificate_data["total_kg"],
-                certificate_metadata=certificate_data
+                certificate_total_kg=spec.total_kg,
+                certificate_metadata=cert_metadata  # Per riferimento
             )
         ]
         
@@ -197,70 +390,38 @@ class CertificateService:
             )
         
         # Crea transazione
-        tx = Transaction(
+        return Transaction(
             tx_type=TxType.ASSIGN_CERT,
             inputs=inputs,
             outputs=outputs,
-            timestamp=int(time.time()),
+            timestamp=timestamp,
             metadata={
-                "certificate_id": certificate_data["certificate_id"],
+                "certificate_id": spec.certificate_id,
                 "action": "assign_certificate"
             }
         )
-        
-        # Firma
-        signed_tx = wallet.sign_transaction(tx, from_address)
-        
-        # Audit log
-        audit_logger.log_certificate_creation(
-            cert_id=certificate_data["certificate_id"],
-            total_kg=certificate_data["total_kg"],
-            issuer=certificate_data.get("issuer", ""),
-            txid=signed_tx.compute_txid()
-        )
-        
-        logger.info(
-            "Certificate assignment transaction created",
-            extra_data={
-                "txid": signed_tx.compute_txid()[:16] + "...",
-                "cert_id": certificate_data["certificate_id"],
-                "amount_kg": amount_kg
-            }
-        )
-        
-        return signed_tx
     
-    def _validate_certificate_data(self, cert_data: Dict) -> None:
-        """Valida certificate data"""
-        # Check required fields
-        for field in REQUIRED_CERT_FIELDS:
-            if field not in cert_data:
-                raise CertificateError(
-                    f"Missing required certificate field: {field}",
-                    code="MISSING_CERT_FIELD",
-                    details={"field": field}
-                )
-        
-        # Validate types
-        if not isinstance(cert_data["total_kg"], int) or cert_data["total_kg"] <= 0:
-            raise CertificateError(
-                "total_kg must be positive integer",
-                code="INVALID_TOTAL_KG"
-            )
+    def _validate_certificate_data(
+        self,
+        cert_data: Union[Dict, CertificateSpec]
+    ) -> CertificateSpec:
+        """Valida certificate data (campi + valori) e ritorna la spec"""
+        if isinstance(cert_data, CertificateSpec):
+            return cert_data
         
-        if not isinstance(cert_data["certificate_id"], str) or not cert_data["certificate_id"]:
-            raise CertificateError(
-                "certificate_id must be non-empty string",
-                code="INVALID_CERT_ID"
-            )
+        return CertificateSpec.from_dict(cert_data)
     
     def _select_standard_utxos(
         self,
         address: str,
-        target_amount: int
+        target_amount: int,
+        spendable_utxos: Optional[List] = None
     ) -> List:
         """Seleziona UTXO standard (no certificati)"""
-        all_utxos = self.blockchain.utxo_set.get_spendable_utxos_for_address(address)
+        if spendable_utxos is None:
+            all_utxos = self.blockchain.utxo_set.get_spendable_utxos_for_address(address)
+        else:
+            all_utxos = spendable_utxos
         
         # Filtra solo standard
         standard_utxos = [
@@ -272,6 +433,16 @@ class CertificateService:
         if not standard_utxos:
             return []
         
+        # Fast path: singolo UTXO sufficiente (il più piccolo → change minimo)
+        best_single = min(
+            (utxo for utxo in standard_utxos if utxo[1].amount >= target_amount),
+            key=lambda x: x[1].amount,
+            default=None
+        )
+        
+        if best_single is not None:
+            return [best_single]
+        
         # Sort by amount
         sorted_utxos = sorted(
             standard_utxos,
@@ -319,29 +490,34 @@ class CertificateService:
         Examples:
             >>> info = service.get_certificate_info("CERT-2025-001")
             >>> print(f"Issued: {info['issued_kg']} kg")
-        """
-        cert_info = self.blockchain.get_certificate_info(cert_id)
         
-        if not cert_info:
-            return None
+        Note:
+            Risultato in cache fino al prossimo blocco (blockchain.epoch).
+        """
+        epoch = self.blockchain.epoch
+        cached = self._cert_info_cache.get(cert_id)
         
-        # Calcola remaining e state
-        issued = cert_info["issued_kg"]
-        compensated = cert_info["compensated_kg"]
-        total = cert_info["total_kg"]
-        remaining = total - issued
+        if cached is None or cached[0] != epoch:
+            cert_info = self.blockchain.get_certificate_info(cert_id)
+            
+            if cert_info:
+                cert_info = self._enrich_certificate_info(cert_info)
+            else:
+                cert_info = None
+            
+            cached = (epoch, cert_info)
+            self._cert_info_cache[cert_id] = cached
         
-        # Determina state
-        if compensated >= issued:
-            state = CertificateState.FULLY_COMPENSATED
-        elif compensated > 0:
-            state = CertificateState.PARTIALLY_COMPENSATED
-        else:
-            state = CertificateState.ACTIVE
+        # Copia: il chiamante può modificare il dict
+        return dict(cached[1]) if cached[1] is not None else None
+    
+    def _enrich_certificate_info(self, cert_info: Dict) -> Dict:
+        """Aggiungi remaining_kg e state a entry indice certificati"""
+        state = self.blockchain.certificate_state(cert_info)
         
         return {
             **cert_info,
-            "remaining_kg": remaining,
+            "remaining_kg": cert_info["total_kg"] - cert_info["issued_kg"],
             "state": state.value
         }
     
@@ -362,18 +538,11 @@ class CertificateService:
             >>> certs = service.list_certificates()
             >>> active = service.list_certificates(CertificateState.ACTIVE)
         """
-        all_certs = self.blockchain.list_certificates()
-        
-        result = []
-        for cert in all_certs:
-            cert_info = self.get_certificate_info(cert["certificate_id"])
-            
-            if cert_info:
-                # Filter by state se richiesto
-                if filter_state is None or cert_info["state"] == filter_state.value:
-                    result.append(cert_info)
-        
-        return result
+        # Filtro applicato dall'indice state della blockchain
+        return [
+            self._enrich_certificate_info(cert_info)
+            for cert_info in self.blockchain.list_certificates(filter_state)
+        ]
     
     def get_certificate_utilization(self, cert_id: str) -> Dict:
         """
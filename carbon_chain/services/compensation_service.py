@@ -14,7 +14,7 @@ Features:
 - Validation rules
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 import time
 
 # Internal imports
@@ -24,14 +24,15 @@ from carbon_chain.domain.models import (
     TxInput,
     TxOutput,
     UTXOKey,
+    ProjectSpec,
 )
 from carbon_chain.domain.blockchain import Blockchain
 from carbon_chain.constants import (
     TxType,
     PROJECT_TYPES,
+    PROJECT_TYPE_SET,
 )
 from carbon_chain.errors import (
-    CompensationError,
     CompensationNotCertifiedError,
     CompensationAlreadyUsedError,
 )
@@ -74,6 +75,13 @@ class CompensationService:
     def __init__(self, blockchain: Blockchain, config: ChainSettings):
         self.blockchain = blockchain
         self.config = config
+        
+        # Flag config letti nei loop di selezione (cache locale)
+        self._enforce_cert_uniqueness = config.enforce_cert_uniqueness
+        self._forbid_spending_compensated = config.forbid_spending_compensated
+        
+        # Cache info progetti: project_id → (blockchain epoch, info)
+        self._project_info_cache: Dict[str, Tuple[int, Optional[Dict]]] = {}
     
     # ========================================================================
     # COMPENSATION CREATION
@@ -83,10 +91,11 @@ class CompensationService:
         self,
         wallet: HDWallet,
         from_address_index: int,
-        project_data: Dict,
+        project_data: Union[Dict, ProjectSpec],
         amount_kg: int,
         certificate_filter: Optional[str] = None,
-        change_address_index: Optional[int] = None
+        change_address_index: Optional[int] = None,
+        now: Optional[int] = None
     ) -> Transaction:
         """
         Crea transazione compensazione.
@@ -104,10 +113,11 @@ class CompensationService:
                 "organization": str,
                 "start_date": int,
                 ... (altri campi)
-            }
+            } oppure ProjectSpec
             amount_kg: Amount kg CO2 da compensare
             certificate_filter: Se specificato, usa solo questo certificato
             change_address_index: Change address index
+            now: Timestamp tx (None = int(time.time()))
         
         Returns:
             Transaction: Tx firmata ASSIGN_COMPENSATION
@@ -130,15 +140,183 @@ class CompensationService:
             ... )
         """
         # Validazione project data
-        self._validate_project_data(project_data)
+        spec, project_metadata = self._prepare_project(project_data)
         
         from_address = wallet.get_address(from_address_index)
         
+        tx = self._build_compensation_transaction(
+            wallet,
+            from_address,
+            from_address_index,
+            spec,
+            project_metadata,
+            amount_kg,
+            certificate_filter,
+            change_address_index,
+            now if now is not None else int(time.time()),
+            self.blockchain.utxo_set.get_utxos_for_address(from_address)
+        )
+        
+        # Firma
+        signed_tx = wallet.sign_transaction(tx, from_address)
+        txid = signed_tx.compute_txid()
+        
+        # Audit log
+        audit_logger.log_compensation(
+            project_id=spec.project_id,
+            amount_kg=amount_kg,
+            cert_id=tx.outputs[0].certificate_id,
+            txid=txid
+        )
+        
+        logger.info(
+            "Compensation transaction created",
+            extra_data={
+                "txid": txid[:16] + "...",
+                "project_id": spec.project_id,
+                "amount_kg": amount_kg,
+                "certificates": tx.metadata["certificates_used"]
+            }
+        )
+        
+        return signed_tx
+    
+    def create_compensation_transactions_batch(
+        self,
+        wallet: HDWallet,
+        compensations: List[Tuple[int, Union[Dict, ProjectSpec], int, Optional[str], Optional[int]]],
+        now: Optional[int] = None
+    ) -> List[Transaction]:
+        """
+        Crea batch di transazioni compensazione.
+        
+        Rispetto a N chiamate create_compensation_transaction:
+        - UTXO di tutti gli address letti con una sola query bulk
+        - Validazione memoizzata per project_data duplicati
+        - Firma batch (keypair risolto una volta per address)
+        - Una sola entry audit log
+        
+        UTXO selezionati da una tx non vengono riusati dalle successive.
+        
+        Args:
+            wallet: HD Wallet
+            compensations: Lista (from_address_index, project_data (dict o
+                ProjectSpec), amount_kg, certificate_filter, change_address_index)
+            now: Timestamp comune per tutte le tx (None = time.time())
+        
+        Returns:
+            List[Transaction]: Tx firmate ASSIGN_COMPENSATION (stesso ordine)
+        
+        Raises:
+            CompensationError: Se una compensazione è invalida (nessuna tx creata)
+        
+        Examples:
+            >>> txs = service.create_compensation_transactions_batch(
+            ...     wallet,
+            ...     [(0, project_data, 500, None, None), (0, project_data, 300, None, None)]
+            ... )
+        """
+        if not compensations:
+            return []
+        
+        timestamp = now if now is not None else int(time.time())
+        
+        # Address lookup + bulk UTXO fetch
+        from_addresses = [
+            wallet.get_address(from_index)
+            for from_index, _, _, _, _ in compensations
+        ]
+        available = self.blockchain.utxo_set.get_utxos_for_addresses(from_addresses)
+        
+        # Memo validazione: project_id → (project_data, spec, metadata)
+        validated: Dict[str, Tuple] = {}
+        specs = []
+        
+        unsigned = []
+        for (from_index, project_data, amount_kg, certificate_filter, change_index), from_address in zip(
+            compensations, from_addresses
+        ):
+            if isinstance(project_data, ProjectSpec):
+                project_id = project_data.project_id
+            else:
+                project_id = project_data.get("project_id")
+            
+            cached = validated.get(project_id)
+            
+            if cached is None or cached[0] != project_data:
+                cached = (project_data, *self._prepare_project(project_data))
+                validated[project_id] = cached
+            
+            _, spec, project_metadata = cached
+            specs.append(spec)
+            
+            tx = self._build_compensation_transaction(
+                wallet,
+                from_address,
+                from_index,
+                spec,
+                project_metadata,
+                amount_kg,
+                certificate_filter,
+                change_index,
+                timestamp,
+                available[from_address]
+            )
+            
+            # UTXO consumati non disponibili per le tx successive
+            spent = {(inp.prev_txid, inp.prev_output_index) for inp in tx.inputs}
+            available[from_address] = [
+                (key, output)
+                for key, output in available[from_address]
+                if (key.txid, key.output_index) not in spent
+            ]
+            
+            unsigned.append((tx, from_address))
+        
+        # Firma batch
+        signed_txs = wallet.sign_transactions(unsigned)
+        
+        # Audit log consolidato
+        audit_logger.log_compensation_batch([
+            {
+                "project_id": spec.project_id,
+                "amount_kg": amount_kg,
+                "certificate_id": signed_tx.outputs[0].certificate_id,
+                "txid": signed_tx.compute_txid()
+            }
+            for spec, (_, _, amount_kg, _, _), signed_tx in zip(specs, compensations, signed_txs)
+        ])
+        
+        logger.info(
+            "Compensation batch created",
+            extra_data={
+                "count": len(signed_txs),
+                "projects": len(validated)
+            }
+        )
+        
+        return signed_txs
+    
+    def _build_compensation_transaction(
+        self,
+        wallet: HDWallet,
+        from_address: str,
+        from_address_index: int,
+        spec: ProjectSpec,
+        project_metadata: Dict,
+        amount_kg: int,
+        certificate_filter: Optional[str],
+        change_address_index: Optional[int],
+        timestamp: int,
+        address_utxos: List
+    ) -> Transaction:
+        """Costruisci tx ASSIGN_COMPENSATION non firmata da UTXO dati"""
         # Select UTXO certificati (solo non compensati)
         selected_utxos = self._select_certified_utxos(
             from_address,
             amount_kg,
-            certificate_filter
+            certificate_filter,
+            address_utxos
         )
         
         if not selected_utxos:
@@ -148,7 +326,7 @@ class CompensationService:
             )
         
         # Check tutti dalla stessa certificazione (se strict)
-        if self.config.enforce_cert_uniqueness and len(selected_utxos) > 1:
+        if self._enforce_cert_uniqueness and len(selected_utxos) > 1:
             cert_ids = set(output.certificate_id for _, output in selected_utxos)
             if len(cert_ids) > 1 and certificate_filter is None:
                 logger.warning(
@@ -184,8 +362,8 @@ class CompensationService:
                 certificate_hash=first_output.certificate_hash,
                 certificate_total_kg=first_output.certificate_total_kg,
                 certificate_metadata=first_output.certificate_metadata,
-                compensation_project_id=project_data["project_id"],
-                compensation_metadata=project_data
+                compensation_project_id=spec.project_id,
+                compensation_metadata=project_metadata
             )
         ]
         
@@ -208,74 +386,63 @@ class CompensationService:
             )
         
         # Crea transazione
-        tx = Transaction(
+        return Transaction(
             tx_type=TxType.ASSIGN_COMPENSATION,
             inputs=inputs,
             outputs=outputs,
-            timestamp=int(time.time()),
+            timestamp=timestamp,
             metadata={
-                "project_id": project_data["project_id"],
+                "project_id": spec.project_id,
                 "certificates_used": list(used_certificates),
                 "action": "assign_compensation"
             }
         )
+    
+    def _prepare_project(
+        self,
+        project_data: Union[Dict, ProjectSpec]
+    ) -> Tuple[ProjectSpec, Dict]:
+        """
+        Valida project data.
         
-        # Firma
-        signed_tx = wallet.sign_transaction(tx, from_address)
+        Returns:
+            Tuple: (spec, metadata dict per compensation_metadata)
+        """
+        spec = self._validate_project_data(project_data)
         
-        # Audit log
-        audit_logger.log_compensation(
-            project_id=project_data["project_id"],
-            amount_kg=amount_kg,
-            cert_id=first_output.certificate_id,
-            txid=signed_tx.compute_txid()
-        )
+        if isinstance(project_data, ProjectSpec):
+            return spec, spec.to_dict()
         
-        logger.info(
-            "Compensation transaction created",
-            extra_data={
-                "txid": signed_tx.compute_txid()[:16] + "...",
-                "project_id": project_data["project_id"],
-                "amount_kg": amount_kg,
-                "certificates": list(used_certificates)
-            }
-        )
-        
-        return signed_tx
+        return spec, project_data
     
-    def _validate_project_data(self, project_data: Dict) -> None:
-        """Valida project data"""
-        required_fields = [
-            "project_id",
-            "project_name",
-            "location",
-            "project_type",
-            "organization"
-        ]
-        
-        for field in required_fields:
-            if field not in project_data:
-                raise CompensationError(
-                    f"Missing required project field: {field}",
-                    code="MISSING_PROJECT_FIELD",
-                    details={"field": field}
-                )
+    def _validate_project_data(
+        self,
+        project_data: Union[Dict, ProjectSpec]
+    ) -> ProjectSpec:
+        """Valida project data e ritorna la spec"""
+        if isinstance(project_data, ProjectSpec):
+            spec = project_data
+        else:
+            spec = ProjectSpec.from_dict(project_data)
         
         # Validate project type
-        if project_data["project_type"] not in PROJECT_TYPES:
+        if spec.project_type not in PROJECT_TYPE_SET:
             logger.warning(
-                f"Unknown project type: {project_data['project_type']}",
+                f"Unknown project type: {spec.project_type}",
                 extra_data={
-                    "project_type": project_data["project_type"],
+                    "project_type": spec.project_type,
                     "valid_types": PROJECT_TYPES
                 }
             )
+        
+        return spec
     
     def _select_certified_utxos(
         self,
         address: str,
         target_amount: int,
-        certificate_filter: Optional[str] = None
+        certificate_filter: Optional[str] = None,
+        address_utxos: Optional[List] = None
     ) -> List:
         """
         Seleziona UTXO certificati per compensazione.
@@ -284,11 +451,15 @@ class CompensationService:
             address: Address owner
             target_amount: Amount target
             certificate_filter: Se specificato, usa solo questo certificato
+            address_utxos: UTXO dell'address già letti (None = query UTXO set)
         
         Returns:
             List: Selected UTXO
         """
-        all_utxos = self.blockchain.utxo_set.get_utxos_for_address(address)
+        if address_utxos is None:
+            all_utxos = self.blockchain.utxo_set.get_utxos_for_address(address)
+        else:
+            all_utxos = address_utxos
         
         # Filtra certificati non compensati
         certified_utxos = [
@@ -309,7 +480,7 @@ class CompensationService:
             return []
         
         # Check no already compensated (double check)
-        if self.config.forbid_spending_compensated:
+        if self._forbid_spending_compensated:
             for key, output in certified_utxos:
                 if output.is_compensated:
                     raise CompensationAlreadyUsedError(
@@ -317,6 +488,16 @@ class CompensationService:
                         code="UTXO_ALREADY_COMPENSATED"
                     )
         
+        # Fast path: singolo UTXO sufficiente (il più piccolo → change minimo)
+        best_single = min(
+            (utxo for utxo in certified_utxos if utxo[1].amount >= target_amount),
+            key=lambda x: x[1].amount,
+            default=None
+        )
+        
+        if best_single is not None:
+            return [best_single]
+        
         # Sort by amount
         sorted_utxos = sorted(
             certified_utxos,
@@ -362,16 +543,32 @@ class CompensationService:
         Examples:
             >>> info = service.get_project_info("PROJ-REFORESTATION-2025")
             >>> print(f"Compensated: {info['total_kg_compensated']} kg")
+        
+        Note:
+            Risultato in cache fino al prossimo blocco (blockchain.epoch).
         """
-        proj_info = self.blockchain.get_project_info(project_id)
+        epoch = self.blockchain.epoch
+        cached = self._project_info_cache.get(project_id)
         
-        if not proj_info:
-            return None
+        if cached is None or cached[0] != epoch:
+            proj_info = self.blockchain.get_project_info(project_id)
+            
+            if proj_info:
+                # Aggiungi project_name da metadata
+                metadata = proj_info.get("metadata", {})
+                proj_info["project_name"] = metadata.get("project_name", project_id)
+            else:
+                proj_info = None
+            
+            cached = (epoch, proj_info)
+            self._project_info_cache[project_id] = cached
         
-        # Aggiungi project_name da metadata
-        metadata = proj_info.get("metadata", {})
-        proj_info["project_name"] = metadata.get("project_name", project_id)
+        if cached[1] is None:
+            return None
         
+        # Copia: il chiamante può modificare il dict (e la lista certificati)
+        proj_info = dict(cached[1])
+        proj_info["certificates_used"] = list(proj_info["certificates_used"])
         return proj_info
     
     def list_projects(
@@ -391,19 +588,13 @@ class CompensationService:
             >>> all_projects = service.list_projects()
             >>> reforestation = service.list_projects("reforestation")
         """
-        all_projects = self.blockchain.list_projects()
+        # Filtro applicato dall'indice project_type della blockchain
+        result = self.blockchain.list_projects(filter_type)
         
-        result = []
-        for proj in all_projects:
-            proj_info = self.get_project_info(proj["project_id"])
-            
-            if proj_info:
-                # Filter by type se richiesto
-                metadata = proj_info.get("metadata", {})
-                proj_type = metadata.get("project_type")
-                
-                if filter_type is None or proj_type == filter_type:
-                    result.append(proj_info)
+        for proj_info in result:
+            # Aggiungi project_name da metadata
+            metadata = proj_info.get("metadata", {})
+            proj_info["project_name"] = metadata.get("project_name", proj_info["project_id"])
         
         return result
     
@@ -14,14 +14,15 @@ Features:
 - Mining statistics
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
+import dataclasses
 import threading
 import time
 
 # Internal imports
 from carbon_chain.domain.blockchain import Blockchain
 from carbon_chain.domain.mempool import Mempool
-from carbon_chain.domain.models import Block
+from carbon_chain.domain.models import Block, BlockHeader, Transaction
 from carbon_chain.logging_setup import get_logger
 from carbon_chain.config import ChainSettings
 
@@ -32,6 +33,15 @@ from carbon_chain.config import ChainSettings
 
 logger = get_logger("mining_service")
 
+# Pausa dopo tentativo senza blocco / base backoff errori (secondi)
+MINING_IDLE_BACKOFF = 0.1
+
+# Backoff massimo dopo errori consecutivi (secondi)
+MINING_ERROR_BACKOFF_MAX = 1.0
+
+# Intervallo polling mempool/tip del thread che prepara il template (secondi)
+TEMPLATE_REFRESH_INTERVAL = 0.1
+
 
 # ============================================================================
 # MINING SERVICE
@@ -73,9 +83,22 @@ class MiningService:
         self.miner_address = miner_address
         self.config = config
         
+        # Address abbreviato per log/statistiche (calcolato una volta)
+        self._miner_address_short = miner_address[:16] + "..."
+        
         # Mining state
         self.is_mining = False
         self._mining_thread: Optional[threading.Thread] = None
+        self._template_thread: Optional[threading.Thread] = None
+        
+        # Interrompe la ricerca nonce in corso (stop_mining)
+        self._stop_event = threading.Event()
+        
+        # Template riusato finché (mempool.cookie, blockchain.epoch) invariati:
+        # ((cookie, epoch), (header, transazioni)), sostituito atomicamente
+        self._template_entry: Optional[
+            Tuple[Tuple[int, int], Tuple[BlockHeader, List[Transaction]]]
+        ] = None
         
         # Statistics
         self.blocks_mined = 0
@@ -102,16 +125,26 @@ class MiningService:
             return
         
         self.is_mining = True
+        self._stop_event.clear()
         self.start_time = time.time()
         
         logger.info(
             "Mining started",
             extra_data={
-                "miner_address": self.miner_address[:16] + "...",
-                "difficulty": self.blockchain.current_difficulty
+                "miner_address": self._miner_address_short,
+                "difficulty": self.blockchain.current_difficulty,
+                "threads": self.config.mining_threads
             }
         )
         
+        # Prepara il template successivo mentre la ricerca nonce è in corso
+        self._template_thread = threading.Thread(
+            target=self._template_loop,
+            name="mining-template",
+            daemon=True
+        )
+        self._template_thread.start()
+        
         if background:
             self._mining_thread = threading.Thread(
                 target=self._mining_loop,
@@ -133,9 +166,16 @@ class MiningService:
             return
         
         self.is_mining = False
+        self._stop_event.set()
         
         if self._mining_thread:
             self._mining_thread.join(timeout=5)
+            
+            if self._mining_thread.is_alive():
+                logger.warning("Mining thread did not stop within timeout")
+        
+        if self._template_thread:
+            self._template_thread.join(timeout=5)
         
         logger.info(
             "Mining stopped",
@@ -146,7 +186,15 @@ class MiningService:
         )
     
     def _mining_loop(self) -> None:
-        """Mining loop principale"""
+        """
+        Mining loop principale.
+        
+        Dopo un blocco trovato riparte subito col template successivo;
+        le pause (nessun blocco / errore) attendono su _stop_event, così
+        stop_mining sveglia il loop immediatamente.
+        """
+        error_backoff = MINING_IDLE_BACKOFF
+        
         while self.is_mining:
             try:
                 # Mine singolo blocco
@@ -171,16 +219,21 @@ class MiningService:
                             "blocks_mined": self.blocks_mined
                         }
                     )
+                else:
+                    # Timeout senza blocco: breve pausa (per non saturare CPU)
+                    self._stop_event.wait(MINING_IDLE_BACKOFF)
                 
-                # Breve pausa (per non saturare CPU)
-                time.sleep(0.1)
+                error_backoff = MINING_IDLE_BACKOFF
             
             except Exception as e:
                 logger.error(
                     f"Mining error: {e}",
                     extra_data={"error": str(e)}
                 )
-                time.sleep(1)
+                
+                # Backoff esponenziale: 0.1s, 0.2s, 0.4s ... max 1s
+                self._stop_event.wait(error_backoff)
+                error_backoff = min(error_backoff * 2, MINING_ERROR_BACKOFF_MAX)
     
     def _mine_single_block(self) -> Optional[Block]:
         """
@@ -189,20 +242,81 @@ class MiningService:
         Returns:
             Block: Blocco minato, o None se fallito
         """
+        header_template, all_transactions = self._get_block_template()
+        
+        # Mine block
+        block = self.blockchain.mine_block_template(
+            header_template,
+            all_transactions,
+            timeout_seconds=30 if self.config.dev_mode else None,
+            stop_event=self._stop_event
+        )
+        
+        return block
+    
+    def _get_block_template(self) -> Tuple[BlockHeader, List[Transaction]]:
+        """
+        Template blocco da minare (cached).
+        
+        COINBASE e merkle root vengono ricostruiti solo se mempool o tip
+        sono cambiati; altrimenti si riusa il template aggiornando il
+        timestamp.
+        
+        Returns:
+            Tuple: (header template, transazioni con COINBASE)
+        """
+        entry = self._template_entry
+        
+        if entry is not None and entry[0] == self._template_key_now():
+            header_template, all_transactions = entry[1]
+            return (
+                dataclasses.replace(header_template, timestamp=int(time.time())),
+                all_transactions
+            )
+        
+        # Template non (ancora) pronto: costruzione sincrona
+        return self._refresh_template()
+    
+    def _template_key_now(self) -> Tuple[int, int]:
+        """Chiave validità template: (mempool.cookie, blockchain.epoch)"""
+        return (self.mempool.cookie, self.blockchain.epoch)
+    
+    def _refresh_template(self) -> Tuple[BlockHeader, List[Transaction]]:
+        """Ricostruisci template (selezione mempool + COINBASE + merkle)"""
+        key = self._template_key_now()
+        
         # Select transactions da mempool
         transactions = self.mempool.get_transactions_for_mining(
             max_count=1000,
             max_size=1_000_000  # 1 MB
         )
         
-        # Mine block
-        block = self.blockchain.mine_block(
-            miner_address=self.miner_address,
-            transactions=transactions,
-            timeout_seconds=30 if self.config.dev_mode else None
+        template = self.blockchain.create_block_template(
+            self.miner_address,
+            transactions
         )
+        self._template_entry = (key, template)
         
-        return block
+        return template
+    
+    def _template_loop(self) -> None:
+        """
+        Producer template: ricostruisce in background quando mempool o
+        tip cambiano, così il loop di mining lo trova già pronto.
+        """
+        while self.is_mining:
+            try:
+                entry = self._template_entry
+                if entry is None or entry[0] != self._template_key_now():
+                    self._refresh_template()
+            
+            except Exception as e:
+                logger.error(
+                    f"Template refresh error: {e}",
+                    extra_data={"error": str(e)}
+                )
+            
+            self._stop_event.wait(TEMPLATE_REFRESH_INTERVAL)
     
     # ========================================================================
     # STATISTICS
@@ -242,7 +356,7 @@ class MiningService:
             "duration_seconds": round(duration, 2),
             "avg_block_time": round(avg_time, 2),
             "current_difficulty": self.blockchain.current_difficulty,
-            "miner_address": self.miner_address[:16] + "..."
+            "miner_address": self._miner_address_short
         }
     
     def get_miner_balance(self) -> int:
@@ -9,7 +9,7 @@ Version: 1.0.0
 """
 
 from typing import List, Dict, Optional
-import json
+import os
 from pathlib import Path
 
 # Internal imports
@@ -23,6 +23,7 @@ from carbon_chain.domain.blockchain import Blockchain
 from carbon_chain.domain.models import Transaction
 from carbon_chain.errors import WalletError, ValidationError
 from carbon_chain.logging_setup import get_logger
+from carbon_chain.utils.serialization import dump_json_bytes, load_json_bytes
 from carbon_chain.config import ChainSettings
 
 
@@ -264,6 +265,9 @@ class MultiSigService:
         # Use first as base
         combined = psbts[0]
         
+        # Signer già presenti (dedup O(1) per firma)
+        seen_signers = {s.signer_index for s in combined.partial_signatures}
+        
         # Combine signatures from others
         for psbt in psbts[1:]:
             # Validate same transaction
@@ -272,9 +276,9 @@ class MultiSigService:
             
             # Add signatures not already present
             for sig in psbt.partial_signatures:
-                if not any(s.signer_index == sig.signer_index 
-                          for s in combined.partial_signatures):
+                if sig.signer_index not in seen_signers:
                     combined.partial_signatures.append(sig)
+                    seen_signers.add(sig.signer_index)
         
         # Check if finalized
         if len(combined.partial_signatures) >= combined.multisig_config.m:
@@ -307,20 +311,19 @@ class MultiSigService:
             logger.warning("PSBT not finalized - insufficient signatures")
             return None
         
-        # Verify all signatures
-        if not psbt.verify_signatures():
+        # Verify + get finalized signatures (singolo passaggio)
+        signatures = psbt.finalize_signatures()
+        
+        if signatures is None:
             logger.error("PSBT signature verification failed")
             return None
         
-        # Get finalized signatures
-        signatures = psbt.get_finalized_signatures()
-        
-        # Deserialize transaction
+        # Deserialize transaction (solo se firme valide)
         transaction = Transaction.deserialize(psbt.transaction_data)
         
         # Attach signatures to transaction
         # (In production: implement proper signature attachment)
-        transaction.metadata["multisig_signatures"] = [sig.hex() for sig in signatures]
+        transaction.set_metadata("multisig_signatures", [sig.hex() for sig in signatures])
         
         logger.info(
             f"Finalized PSBT",
@@ -358,7 +361,7 @@ class MultiSigService:
             "my_public_key": wallet.my_public_key.hex()
         }
         
-        file_path.write_text(json.dumps(wallet_data, indent=2))
+        file_path.write_bytes(dump_json_bytes(wallet_data, indent=True))
         
         logger.info(f"Saved multisig wallet to {file_path}")
         
@@ -379,10 +382,13 @@ class MultiSigService:
         """
         file_path = self.storage_dir / f"{wallet_name}.json"
         
-        if not file_path.exists():
+        # Singola open (nessun exists() + read separati)
+        try:
+            raw = file_path.read_bytes()
+        except FileNotFoundError:
             raise WalletError(f"Wallet file not found: {file_path}")
         
-        wallet_data = json.loads(file_path.read_text())
+        wallet_data = load_json_bytes(raw)
         
         # Reconstruct wallet
         config = MultiSigConfig.from_dict(wallet_data["config"])
@@ -405,8 +411,13 @@ class MultiSigService:
         Returns:
             List[str]: Nomi wallet
         """
-        wallet_files = self.storage_dir.glob("*.json")
-        return [f.stem for f in wallet_files]
+        # Singolo scandir: DirEntry con tipo cached, nessun Path per file
+        with os.scandir(self.storage_dir) as entries:
+            return [
+                entry.name[:-len(".json")]
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            ]
     
     # ========================================================================
     # QUERIES
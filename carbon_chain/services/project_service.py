@@ -13,11 +13,17 @@ Features:
 - Statistics
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
+from collections import Counter
+import heapq
 
 # Internal imports
 from carbon_chain.domain.blockchain import Blockchain
-from carbon_chain.constants import PROJECT_TYPES
+from carbon_chain.constants import (
+    PROJECT_TYPES,
+    PROJECT_TYPE_SET,
+    REQUIRED_PROJECT_FIELDS,
+)
 from carbon_chain.errors import ValidationError
 from carbon_chain.logging_setup import get_logger
 from carbon_chain.config import ChainSettings
@@ -84,24 +90,27 @@ class ProjectService:
         Returns:
             List[dict]: Lista progetti
         """
-        all_projects = self.blockchain.list_projects()
-        
-        result = []
-        for proj in all_projects:
-            # Filter by type
-            if filter_type:
-                metadata = proj.get("metadata", {})
-                if metadata.get("project_type") != filter_type:
-                    continue
+        if filter_type:
+            # Tipo sempre via indice blockchain (project_type senza default:
+            # la colonna types usa "unknown" solo per raggruppare)
+            projects = self.blockchain.list_projects(filter_type)
             
-            # Filter by min_kg
-            if min_kg:
-                if proj["total_kg_compensated"] < min_kg:
-                    continue
+            if not min_kg:
+                return projects
             
-            result.append(proj)
+            return [p for p in projects if p["total_kg_compensated"] >= min_kg]
         
-        return result
+        if not min_kg:
+            return self.blockchain.list_projects()
+        
+        # Filtro su vista colonnare, materializza solo i progetti selezionati
+        columns = self.blockchain.projects_columnar()
+        
+        return self._materialize_projects(
+            project_id
+            for project_id, kg in zip(columns.project_ids, columns.kg)
+            if kg >= min_kg
+        )
     
     def get_top_projects(self, limit: int = 10) -> List[Dict]:
         """
@@ -113,16 +122,18 @@ class ProjectService:
         Returns:
             List[dict]: Top progetti
         """
-        all_projects = self.blockchain.list_projects()
+        columns = self.blockchain.projects_columnar()
         
-        # Sort by total_kg_compensated
-        sorted_projects = sorted(
-            all_projects,
-            key=lambda p: p["total_kg_compensated"],
-            reverse=True
+        # Top-N per total_kg_compensated (stabile come sorted(reverse=True))
+        top_indexes = heapq.nlargest(
+            limit,
+            range(len(columns)),
+            key=columns.kg.__getitem__
         )
         
-        return sorted_projects[:limit]
+        return self._materialize_projects(
+            columns.project_ids[i] for i in top_indexes
+        )
     
     def get_projects_by_type(self) -> Dict[str, List[Dict]]:
         """
@@ -131,19 +142,27 @@ class ProjectService:
         Returns:
             dict: {project_type: [projects]}
         """
-        all_projects = self.blockchain.list_projects()
+        columns = self.blockchain.projects_columnar()
         
-        by_type = {}
-        for proj in all_projects:
-            metadata = proj.get("metadata", {})
-            proj_type = metadata.get("project_type", "unknown")
-            
-            if proj_type not in by_type:
-                by_type[proj_type] = []
-            
-            by_type[proj_type].append(proj)
+        # Raggruppa ID per tipo in un passaggio, poi materializza
+        ids_by_type: Dict[str, List[str]] = {}
+        for project_id, proj_type in zip(columns.project_ids, columns.types):
+            ids_by_type.setdefault(proj_type, []).append(project_id)
+        
+        return {
+            proj_type: self._materialize_projects(project_ids)
+            for proj_type, project_ids in ids_by_type.items()
+        }
+    
+    def _materialize_projects(self, project_ids: Iterable[str]) -> List[Dict]:
+        """Project info per ID (salta progetti non trovati)"""
+        projects = []
+        for project_id in project_ids:
+            proj_info = self.blockchain.get_project_info(project_id)
+            if proj_info:
+                projects.append(proj_info)
         
-        return by_type
+        return projects
     
     # ========================================================================
     # STATISTICS
@@ -171,9 +190,9 @@ class ProjectService:
     
     def get_global_statistics(self) -> Dict:
         """Statistiche globali progetti"""
-        all_projects = self.blockchain.list_projects()
+        columns = self.blockchain.projects_columnar()
         
-        if not all_projects:
+        if not columns:
             return {
                 "total_projects": 0,
                 "total_kg_compensated": 0,
@@ -181,30 +200,25 @@ class ProjectService:
                 "by_type": {}
             }
         
-        total_kg = sum(p["total_kg_compensated"] for p in all_projects)
+        total_kg = sum(columns.kg)
         
-        # By type
-        by_type = {}
-        for proj in all_projects:
-            metadata = proj.get("metadata", {})
-            proj_type = metadata.get("project_type", "unknown")
-            
-            if proj_type not in by_type:
-                by_type[proj_type] = {
-                    "count": 0,
-                    "total_kg": 0,
-                    "avg_kg": 0
-                }
-            
-            by_type[proj_type]["count"] += 1
-            by_type[proj_type]["total_kg"] += proj["total_kg_compensated"]
+        # By type: count e somme kg in un passaggio sulle colonne
+        counts = Counter(columns.types)
+        sums: Dict[str, int] = dict.fromkeys(counts, 0)
+        for proj_type, kg in zip(columns.types, columns.kg):
+            sums[proj_type] += kg
         
-        # Calcola average
-        for proj_type, stats in by_type.items():
-            stats["avg_kg"] = stats["total_kg"] // stats["count"] if stats["count"] > 0 else 0
+        by_type = {
+            proj_type: {
+                "count": count,
+                "total_kg": sums[proj_type],
+                "avg_kg": sums[proj_type] // count
+            }
+            for proj_type, count in counts.items()
+        }
         
         return {
-            "total_projects": len(all_projects),
+            "total_projects": len(columns),
             "total_kg_compensated": total_kg,
             "total_tonnes": round(total_kg / 1000, 3),
             "by_type": by_type
@@ -223,18 +237,17 @@ class ProjectService:
         Raises:
             ValidationError: Se validazione fallisce
         """
-        required = ["project_id", "project_name", "location", "project_type", "organization"]
-        
-        for field in required:
-            if field not in project_data:
-                raise ValidationError(
-                    f"Missing required field: {field}",
-                    code="MISSING_FIELD",
-                    details={"field": field}
-                )
+        missing = REQUIRED_PROJECT_FIELDS - project_data.keys()
+        if missing:
+            missing = sorted(missing)
+            raise ValidationError(
+                f"Missing required field: {', '.join(missing)}",
+                code="MISSING_FIELD",
+                details={"field": missing[0], "fields": missing}
+            )
         
         # Validate type
-        if project_data["project_type"] not in PROJECT_TYPES:
+        if project_data["project_type"] not in PROJECT_TYPE_SET:
             logger.warning(
                 f"Unknown project type: {project_data['project_type']}",
                 extra_data={"valid_types": PROJECT_TYPES}
@@ -8,8 +8,13 @@ Last Updated: 2025-11-27
 Version: 1.0.0
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass
+from array import array
+import hashlib
 import json
+import os
+import struct
 from pathlib import Path
 
 # Internal imports
@@ -19,9 +24,18 @@ from carbon_chain.wallet.stealth_address import (
     StealthPayment
 )
 from carbon_chain.domain.blockchain import Blockchain
+from carbon_chain.services.wallet_service import WalletService
 from carbon_chain.domain.models import Transaction, TxOutput
-from carbon_chain.errors import WalletError
+from carbon_chain.constants import STEALTH_METADATA_KEY
+from carbon_chain.domain.crypto_core import (
+    derive_key_pbkdf2,
+    encrypt_data_aes_gcm,
+    decrypt_data_aes_gcm,
+    generate_random_bytes,
+)
+from carbon_chain.errors import WalletError, InvalidPasswordError, DecryptionError
 from carbon_chain.logging_setup import get_logger
+from carbon_chain.utils.serialization import dump_json_bytes, load_json_bytes
 from carbon_chain.config import ChainSettings
 
 
@@ -31,6 +45,73 @@ from carbon_chain.config import ChainSettings
 
 logger = get_logger("services.stealth")
 
+# Suffisso file cursore scansione payments (per wallet)
+SCAN_CURSOR_SUFFIX = ".scan.json"
+
+# Suffisso indice payments trovati (append-only, record binari fissi)
+SCAN_INDEX_SUFFIX = ".scan.idx"
+
+# Record indice: height (u64 LE) + txid (32 bytes)
+_SCAN_INDEX_RECORD = struct.Struct("<Q32s")
+
+# Formato wallet file: 1 = chiavi in chiaro (legacy), 2 = chiavi AES-GCM
+WALLET_FILE_VERSION = 2
+
+# Iterazioni PBKDF2 per chiave file (come HDWallet.export_encrypted)
+WALLET_KDF_ITERATIONS = 100_000
+
+# ============================================================================
+# SCAN RESULT (COLUMNAR)
+# ============================================================================
+
+@dataclass(frozen=True)
+class StealthScanResult:
+    """
+    Payments ricevuti in forma colonnare (SoA).
+    
+    Colonne parallele in ordine di scansione: aggregazioni (totale,
+    finestre temporali) scorrono array int64 contigui invece di
+    dereferenziare Transaction/StealthPayment per riga.
+    
+    Attributes:
+        txids: TXID transazioni
+        timestamps: Timestamp transazioni (array int64)
+        amounts: Amount verso one-time address (array int64, Satoshi)
+        one_time_addresses: One-time address
+        ephemeral_public_keys: Ephemeral public key
+    """
+    txids: Tuple[str, ...]
+    timestamps: array
+    amounts: array
+    one_time_addresses: Tuple[str, ...]
+    ephemeral_public_keys: Tuple[bytes, ...]
+    
+    def __len__(self) -> int:
+        return len(self.txids)
+    
+    def total_amount(self) -> int:
+        """Totale ricevuto (Satoshi)"""
+        return sum(self.amounts)
+    
+    def to_dicts(self) -> List[Dict]:
+        """Righe come dict (formato get_received_payments)"""
+        return [
+            {
+                "txid": txid,
+                "timestamp": timestamp,
+                "one_time_address": address,
+                "amount": amount,
+                "ephemeral_public_key": ephemeral.hex()
+            }
+            for txid, timestamp, address, amount, ephemeral in zip(
+                self.txids,
+                self.timestamps,
+                self.one_time_addresses,
+                self.amounts,
+                self.ephemeral_public_keys
+            )
+        ]
+
 
 # ============================================================================
 # STEALTH SERVICE
@@ -49,6 +130,7 @@ class StealthService:
     Attributes:
         blockchain: Blockchain instance
         config: Chain settings
+        wallet_service: Wallet service (creazione transazioni)
         storage_dir: Storage directory
     
     Examples:
@@ -74,6 +156,9 @@ class StealthService:
         self.blockchain = blockchain
         self.config = config
         
+        # Wallet service per transazioni stealth (stateless, una per service)
+        self.wallet_service = WalletService(blockchain, config)
+        
         # Storage directory
         self.storage_dir = storage_dir or (config.wallet_dir / "stealth")
         self.storage_dir.mkdir(parents=True, exist_ok=True)
@@ -86,26 +171,30 @@ class StealthService:
     
     def create_stealth_wallet(
         self,
-        wallet_name: Optional[str] = None
+        wallet_name: Optional[str] = None,
+        password: Optional[str] = None,
+        insecure_plaintext: bool = False
     ) -> StealthWallet:
         """
         Crea nuovo stealth wallet.
         
         Args:
             wallet_name: Nome wallet (optional)
+            password: Password cifratura chiavi (vedi save_wallet)
+            insecure_plaintext: Salva chiavi in chiaro (sconsigliato)
         
         Returns:
             StealthWallet: Wallet creato
         """
-        wallet = StealthWallet.create()
+        wallet = StealthWallet()
         
         # Save wallet
         if wallet_name:
-            self.save_wallet(wallet, wallet_name)
+            self.save_wallet(wallet, wallet_name, password, insecure_plaintext)
         
         logger.info(
             f"Created stealth wallet",
-            extra_data={"address": wallet.get_address()}
+            extra_data={"address": wallet.get_stealth_address().to_meta_address()}
         )
         
         return wallet
@@ -115,7 +204,9 @@ class StealthService:
         stealth_address: StealthAddress,
         scan_private_key: bytes,
         spend_private_key: bytes,
-        wallet_name: Optional[str] = None
+        wallet_name: Optional[str] = None,
+        password: Optional[str] = None,
+        insecure_plaintext: bool = False
     ) -> StealthWallet:
         """
         Importa stealth wallet.
@@ -125,20 +216,29 @@ class StealthService:
             scan_private_key: Scan private key
             spend_private_key: Spend private key
             wallet_name: Nome wallet
+            password: Password cifratura chiavi (vedi save_wallet)
+            insecure_plaintext: Salva chiavi in chiaro (sconsigliato)
         
         Returns:
             StealthWallet: Wallet importato
+        
+        Raises:
+            WalletError: Se le chiavi non corrispondono a stealth_address
         """
-        wallet = StealthWallet(
-            stealth_address=stealth_address,
-            scan_private_key=scan_private_key,
-            spend_private_key=spend_private_key
-        )
+        wallet = StealthWallet.from_keys(scan_private_key.hex(), spend_private_key.hex())
+        
+        meta_address = wallet.get_stealth_address().to_meta_address()
+        if meta_address != stealth_address.to_meta_address():
+            raise WalletError(
+                "Private keys do not match stealth address",
+                code="KEY_MISMATCH",
+                details={"stealth_address": stealth_address.to_meta_address()}
+            )
         
         if wallet_name:
-            self.save_wallet(wallet, wallet_name)
+            self.save_wallet(wallet, wallet_name, password, insecure_plaintext)
         
-        logger.info(f"Imported stealth wallet: {wallet.get_address()}")
+        logger.info(f"Imported stealth wallet: {meta_address}")
         
         return wallet
     
@@ -203,10 +303,7 @@ class StealthService:
         payment = self.create_payment_to(receiver_stealth_address, amount)
         
         # Create transaction to one-time address
-        from carbon_chain.services.wallet_service import WalletService
-        wallet_service = WalletService(self.blockchain, self.config)
-        
-        transaction = wallet_service.create_transfer(
+        transaction = self.wallet_service.create_transfer(
             wallet=sender_wallet,
             from_address_index=from_address_index,
             to_address=payment.one_time_address,
@@ -214,7 +311,7 @@ class StealthService:
         )
         
         # Attach stealth metadata
-        transaction.metadata["stealth_payment"] = payment.to_dict()
+        transaction.set_metadata(STEALTH_METADATA_KEY, payment.to_metadata())
         
         logger.info(
             f"Created stealth transaction",
@@ -236,6 +333,11 @@ class StealthService:
         """
         Scansiona blockchain per stealth payments.
         
+        Incrementale: i blocchi già scansionati per il wallet (cursore
+        su disco, vedi _cursor_path) non vengono riscansionati; i payment
+        già trovati (indice append-only, vedi _index_path) sono ricaricati
+        per txid senza ricalcolare ECDH.
+        
         Args:
             wallet: Stealth wallet
             start_height: Start block height
@@ -244,49 +346,230 @@ class StealthService:
         Returns:
             List: Lista (Transaction, StealthPayment) trovati
         """
-        if end_height is None:
-            end_height = self.blockchain.get_height()
-        
+        return [
+            (tx, payment)
+            for tx, payment, _ in self._scan_payments(wallet, start_height, end_height)
+        ]
+    
+    def _scan_payments(
+        self,
+        wallet: StealthWallet,
+        start_height: int,
+        end_height: Optional[int]
+    ) -> List[Tuple[Transaction, StealthPayment, int]]:
+        """Scan (vedi scan_for_payments) con amount ricevuto per payment"""
+        # Il cursore non supera mai il tip (blocchi futuri da scansionare)
+        tip_height = self.blockchain.get_height()
+        if end_height is None or end_height > tip_height:
+            end_height = tip_height
+        
+        cursor = self._load_scan_cursor(wallet)
+        scanned_height = cursor["height"]
+        
+        # Payment già noti nel range richiesto
         found_payments = []
-        
-        # Scan blocks
-        for height in range(start_height, end_height + 1):
-            block = self.blockchain.get_block(height)
+        seen_txids = set()
+        # ("found" nel cursore JSON: formato legacy, prima dell'indice)
+        for entry in cursor.get("found", []) + self._load_scan_index(wallet):
+            if entry["txid"] in seen_txids:
+                continue
             
-            if not block:
+            if start_height <= entry["height"] <= end_height:
+                cached = self._load_cached_payment(entry["txid"], entry["height"])
+                if cached:
+                    tx, payment = cached
+                    found_payments.append((tx, payment, self._payment_amount(tx, payment)))
+                    seen_txids.add(entry["txid"])
+        
+        # Il cursore avanza solo se la scansione è contigua al già scansionato
+        scan_start = max(start_height, scanned_height + 1)
+        extends_cursor = start_height <= scanned_height + 1
+        new_entries = []
+        
+        # Candidati solo da blocchi con stealth payments (indice blockchain);
+        # payment già noti (cursore) scartati prima di decode + ECDH,
+        # txid letto una volta per candidato
+        candidates = [
+            (height, tx, txid)
+            for height, block_txs in self.blockchain.get_stealth_transactions(
+                scan_start,
+                end_height
+            )
+            for tx in block_txs
+            if (txid := tx.compute_txid()) not in seen_txids
+        ]
+        
+        # Reconstruct payments + unico check batch sull'intero range
+        # (ECDH solo sui candidati, parallelo su più processi se grande)
+        payments = [
+            StealthPayment.from_metadata(tx.metadata[STEALTH_METADATA_KEY])
+            for _, tx, _ in candidates
+        ]
+        mask = wallet.is_payment_for_me_batch(payments)
+        
+        for (height, tx, txid), payment, is_mine in zip(candidates, payments, mask):
+            if not is_mine or txid in seen_txids:
                 continue
             
-            # Scan transactions in block
-            for tx in block.transactions:
-                # Check if transaction has stealth metadata
-                if "stealth_payment" not in tx.metadata:
-                    continue
-                
-                # Reconstruct stealth payment
-                payment_data = tx.metadata["stealth_payment"]
-                payment = StealthPayment(
-                    ephemeral_public_key=bytes.fromhex(payment_data["ephemeral_public_key"]),
-                    one_time_address=payment_data["one_time_address"],
-                    payment_id=bytes.fromhex(payment_data["payment_id"]) 
-                        if payment_data.get("payment_id") else None
-                )
-                
-                # Check if payment is for this wallet
-                if wallet.is_payment_for_me(payment):
-                    found_payments.append((tx, payment))
-                    
-                    logger.info(
-                        f"Found stealth payment",
-                        extra_data={
-                            "height": height,
-                            "txid": tx.compute_txid()[:16] + "..."
-                        }
-                    )
-        
-        logger.info(f"Scanned blocks {start_height}-{end_height}, found {len(found_payments)} payments")
+            seen_txids.add(txid)
+            found_payments.append((tx, payment, self._payment_amount(tx, payment)))
+            new_entries.append({"txid": txid, "height": height})
+            
+            logger.info(
+                f"Found stealth payment",
+                extra_data={
+                    "height": height,
+                    "txid": txid[:16] + "..."
+                }
+            )
+        
+        if extends_cursor and end_height > scanned_height:
+            cursor["height"] = end_height
+            self._append_scan_index(wallet, new_entries)
+            self._save_scan_cursor(wallet, cursor)
+        
+        logger.info(
+            f"Scanned blocks {scan_start}-{end_height}, found {len(found_payments)} payments",
+            extra_data={"cached_height": scanned_height}
+        )
         
         return found_payments
     
+    def invalidate_scan_cache(self, wallet: StealthWallet) -> None:
+        """
+        Elimina cursore di scansione (es. dopo rotazione chiavi).
+        
+        Args:
+            wallet: Stealth wallet
+        """
+        self._cursor_path(wallet).unlink(missing_ok=True)
+        self._index_path(wallet).unlink(missing_ok=True)
+        
+        logger.info(f"Invalidated stealth scan cache: {self._scan_file_stem(wallet)}")
+    
+    @staticmethod
+    def _scan_file_stem(wallet: StealthWallet) -> str:
+        """Nome file scan per wallet: hash del meta-address (base64 non path-safe)"""
+        meta_address = wallet.get_stealth_address().to_meta_address()
+        return hashlib.sha256(meta_address.encode('utf-8')).hexdigest()[:32]
+    
+    def _cursor_path(self, wallet: StealthWallet) -> Path:
+        """Path cursore scansione: {"height": int} ("found" legacy, opzionale)"""
+        return self.storage_dir / f"{self._scan_file_stem(wallet)}{SCAN_CURSOR_SUFFIX}"
+    
+    def _index_path(self, wallet: StealthWallet) -> Path:
+        """Path indice payments trovati (record _SCAN_INDEX_RECORD)"""
+        return self.storage_dir / f"{self._scan_file_stem(wallet)}{SCAN_INDEX_SUFFIX}"
+    
+    def _load_scan_index(self, wallet: StealthWallet) -> List[Dict]:
+        """Carica indice payments trovati: [{"txid", "height"}]"""
+        try:
+            data = self._index_path(wallet).read_bytes()
+        except FileNotFoundError:
+            return []
+        
+        # Record finale parziale (append interrotto) ignorato
+        data = data[:len(data) - len(data) % _SCAN_INDEX_RECORD.size]
+        
+        return [
+            {"txid": txid.hex(), "height": height}
+            for height, txid in _SCAN_INDEX_RECORD.iter_unpack(data)
+        ]
+    
+    def _append_scan_index(self, wallet: StealthWallet, entries: List[Dict]) -> None:
+        """Appendi payments trovati all'indice (singola write, nessuna riscrittura)"""
+        if not entries:
+            return
+        
+        records = b"".join(
+            _SCAN_INDEX_RECORD.pack(entry["height"], bytes.fromhex(entry["txid"]))
+            for entry in entries
+        )
+        
+        with open(self._index_path(wallet), "ab") as f:
+            f.write(records)
+    
+    def _load_scan_cursor(self, wallet: StealthWallet) -> Dict:
+        """Carica cursore scansione (height -1 se assente o illeggibile)"""
+        try:
+            return json.loads(self._cursor_path(wallet).read_text())
+        except FileNotFoundError:
+            pass
+        except (ValueError, OSError) as e:
+            logger.warning(
+                "Unreadable stealth scan cursor, rescanning",
+                extra_data={"error": str(e)}
+            )
+        
+        return {"height": -1}
+    
+    def _save_scan_cursor(self, wallet: StealthWallet, cursor: Dict) -> None:
+        """Riscrivi cursore atomicamente (file temporaneo + os.replace)"""
+        cursor_path = self._cursor_path(wallet)
+        tmp_path = cursor_path.with_name(cursor_path.name + ".tmp")
+        
+        tmp_path.write_text(json.dumps(cursor))
+        os.replace(tmp_path, cursor_path)
+    
+    def _load_cached_payment(
+        self,
+        txid: str,
+        height: int
+    ) -> Optional[tuple[Transaction, StealthPayment]]:
+        """Ricarica payment già trovato (nessun ECDH: match già noto)"""
+        block = self.blockchain.get_block(height)
+        tx = block.get_transaction_by_txid(txid) if block else None
+        
+        if tx is None or STEALTH_METADATA_KEY not in tx.metadata:
+            return None
+        
+        return tx, StealthPayment.from_metadata(tx.metadata[STEALTH_METADATA_KEY])
+    
+    @staticmethod
+    def _payment_amount(tx: Transaction, payment: StealthPayment) -> int:
+        """Amount del primo output verso il one-time address (0 se assente)"""
+        address = payment.one_time_address
+        return next(
+            (output.amount for output in tx.outputs if output.address == address),
+            0
+        )
+    
+    def get_received_columns(
+        self,
+        wallet: StealthWallet
+    ) -> StealthScanResult:
+        """
+        Get payments ricevuti in forma colonnare.
+        
+        Args:
+            wallet: Stealth wallet
+        
+        Returns:
+            StealthScanResult: Colonne txid/timestamp/amount/address/ephemeral
+        """
+        payments = self._scan_payments(wallet, 0, None)
+        
+        txids = []
+        timestamps = array('q')
+        amounts = array('q')
+        addresses = []
+        ephemerals = []
+        
+        for tx, payment, amount in payments:
+            txids.append(tx.compute_txid())
+            timestamps.append(tx.timestamp)
+            amounts.append(amount)
+            addresses.append(payment.one_time_address)
+            ephemerals.append(payment.ephemeral_pubkey)
+        
+        return StealthScanResult(
+            txids=tuple(txids),
+            timestamps=timestamps,
+            amounts=amounts,
+            one_time_addresses=tuple(addresses),
+            ephemeral_public_keys=tuple(ephemerals)
+        )
+    
     def get_received_payments(
         self,
         wallet: StealthWallet
@@ -300,26 +583,7 @@ class StealthService:
         Returns:
             List[Dict]: Lista payments con dettagli
         """
-        payments = self.scan_for_payments(wallet)
-        
-        result = []
-        for tx, payment in payments:
-            # Find output amount
-            output_amount = 0
-            for output in tx.outputs:
-                if output.address == payment.one_time_address:
-                    output_amount = output.amount
-                    break
-            
-            result.append({
-                "txid": tx.compute_txid(),
-                "timestamp": tx.timestamp,
-                "one_time_address": payment.one_time_address,
-                "amount": output_amount,
-                "ephemeral_public_key": payment.ephemeral_public_key.hex()
-            })
-        
-        return result
+        return self.get_received_columns(wallet).to_dicts()
     
     # ========================================================================
     # SPENDING
@@ -356,28 +620,54 @@ class StealthService:
     def save_wallet(
         self,
         wallet: StealthWallet,
-        wallet_name: str
+        wallet_name: str,
+        password: Optional[str] = None,
+        insecure_plaintext: bool = False
     ) -> Path:
         """
         Salva stealth wallet su file.
         
+        Con password le private keys sono cifrate AES-256-GCM (formato
+        v2, chiave PBKDF2 da password, address come associated data).
+        Senza password il salvataggio in chiaro (v1) richiede
+        insecure_plaintext=True.
+        
         Args:
             wallet: Wallet da salvare
             wallet_name: Nome file
+            password: Password cifratura chiavi
+            insecure_plaintext: Salva chiavi in chiaro (sconsigliato)
         
         Returns:
             Path: File path
+        
+        Raises:
+            WalletError: Se né password né insecure_plaintext
         """
         file_path = self.storage_dir / f"{wallet_name}.json"
         
-        wallet_data = {
-            "stealth_address": wallet.stealth_address.to_dict(),
-            # NOTE: Private keys should be encrypted in production!
-            "scan_private_key": wallet.scan_private_key.hex(),
-            "spend_private_key": wallet.spend_private_key.hex()
-        }
+        if password:
+            wallet_data = self._encrypt_wallet_keys(wallet, password)
+        elif insecure_plaintext:
+            logger.warning(
+                "Saving stealth wallet private keys unencrypted",
+                extra_data={"wallet_name": wallet_name}
+            )
+            keys = wallet.export_keys()
+            wallet_data = {
+                "version": 1,
+                "stealth_address": keys["stealth_address"],
+                "scan_private_key": keys["scan_private"],
+                "spend_private_key": keys["spend_private"]
+            }
+        else:
+            raise WalletError(
+                "Password required to save stealth wallet",
+                code="PASSWORD_REQUIRED",
+                details={"wallet_name": wallet_name}
+            )
         
-        file_path.write_text(json.dumps(wallet_data, indent=2))
+        file_path.write_bytes(dump_json_bytes(wallet_data, indent=True))
         
         logger.info(f"Saved stealth wallet to {file_path}")
         
@@ -385,42 +675,128 @@ class StealthService:
     
     def load_wallet(
         self,
-        wallet_name: str
+        wallet_name: str,
+        password: Optional[str] = None,
+        insecure_plaintext: bool = False
     ) -> StealthWallet:
         """
         Carica stealth wallet da file.
         
         Args:
             wallet_name: Nome wallet
+            password: Password (wallet cifrati, v2)
+            insecure_plaintext: Accetta wallet con chiavi in chiaro (v1)
         
         Returns:
             StealthWallet: Wallet caricato
+        
+        Raises:
+            WalletError: File assente, password mancante o wallet in chiaro
+                senza insecure_plaintext
+            InvalidPasswordError: Password errata o file manomesso
         """
         file_path = self.storage_dir / f"{wallet_name}.json"
         
-        if not file_path.exists():
+        # Singola open (nessun exists() + read separati)
+        try:
+            raw = file_path.read_bytes()
+        except FileNotFoundError:
             raise WalletError(f"Wallet file not found: {file_path}")
         
-        wallet_data = json.loads(file_path.read_text())
+        wallet_data = load_json_bytes(raw)
+        
+        if wallet_data.get("version", 1) >= WALLET_FILE_VERSION:
+            if not password:
+                raise WalletError(
+                    "Password required to load encrypted stealth wallet",
+                    code="PASSWORD_REQUIRED",
+                    details={"wallet_name": wallet_name}
+                )
+            
+            scan_private_key, spend_private_key = self._decrypt_wallet_keys(
+                wallet_data,
+                password
+            )
+        elif insecure_plaintext:
+            scan_private_key = wallet_data["scan_private_key"]
+            spend_private_key = wallet_data["spend_private_key"]
+        else:
+            raise WalletError(
+                "Stealth wallet stores plaintext private keys; "
+                "re-save it with a password or load with insecure_plaintext",
+                code="PLAINTEXT_WALLET",
+                details={"wallet_name": wallet_name}
+            )
+        
+        # Ricostruisci wallet (public keys derivate dalle private)
+        wallet = StealthWallet.from_keys(scan_private_key, spend_private_key)
+        
+        if wallet.get_stealth_address().to_meta_address() != wallet_data["stealth_address"]:
+            raise WalletError(
+                "Stealth wallet keys do not match stored address",
+                code="KEY_MISMATCH",
+                details={"wallet_name": wallet_name}
+            )
+        
+        logger.info(f"Loaded stealth wallet from {file_path}")
         
-        # Reconstruct stealth address
-        addr_data = wallet_data["stealth_address"]
-        stealth_address = StealthAddress(
-            scan_public_key=bytes.fromhex(addr_data["scan_public_key"]),
-            spend_public_key=bytes.fromhex(addr_data["spend_public_key"]),
-            encoded_address=addr_data["encoded_address"]
+        return wallet
+    
+    @staticmethod
+    def _encrypt_wallet_keys(wallet: StealthWallet, password: str) -> Dict:
+        """Wallet file v2: scan_key || spend_key (32 bytes big-endian) cifrate in un'unica chiamata AEAD"""
+        salt = generate_random_bytes(16)
+        key = derive_key_pbkdf2(
+            password=password.encode('utf-8'),
+            salt=salt,
+            iterations=WALLET_KDF_ITERATIONS,
+            key_length=32
         )
         
-        # Create wallet
-        wallet = StealthWallet(
-            stealth_address=stealth_address,
-            scan_private_key=bytes.fromhex(wallet_data["scan_private_key"]),
-            spend_private_key=bytes.fromhex(wallet_data["spend_private_key"])
+        address = wallet.get_stealth_address().to_meta_address()
+        ciphertext, nonce = encrypt_data_aes_gcm(
+            plaintext=(
+                wallet.scan_private.to_bytes(32, 'big')
+                + wallet.spend_private.to_bytes(32, 'big')
+            ),
+            key=key,
+            associated_data=address.encode('utf-8')
         )
         
-        logger.info(f"Loaded stealth wallet from {file_path}")
+        return {
+            "version": WALLET_FILE_VERSION,
+            "stealth_address": address,
+            "kdf_iterations": WALLET_KDF_ITERATIONS,
+            "salt": salt.hex(),
+            "nonce": nonce.hex(),
+            "encrypted_keys": ciphertext.hex()
+        }
+    
+    @staticmethod
+    def _decrypt_wallet_keys(wallet_data: Dict, password: str) -> Tuple[str, str]:
+        """Decifra wallet file v2 -> (scan_private_key, spend_private_key) hex"""
+        key = derive_key_pbkdf2(
+            password=password.encode('utf-8'),
+            salt=bytes.fromhex(wallet_data["salt"]),
+            iterations=wallet_data["kdf_iterations"],
+            key_length=32
+        )
         
-        return wallet
+        try:
+            keys = decrypt_data_aes_gcm(
+                ciphertext=bytes.fromhex(wallet_data["encrypted_keys"]),
+                key=key,
+                nonce=bytes.fromhex(wallet_data["nonce"]),
+                associated_data=wallet_data["stealth_address"].encode('utf-8')
+            )
+        except DecryptionError:
+            raise InvalidPasswordError(
+                "Invalid password or corrupted wallet data",
+                code="DECRYPTION_FAILED"
+            )
+        
+        # Scan e spend key: scalari 32 bytes ciascuno
+        return keys[:32].hex(), keys[32:].hex()
     
     def list_wallets(self) -> List[str]:
         """
@@ -429,8 +805,15 @@ class StealthService:
         Returns:
             List[str]: Nomi wallet
         """
-        wallet_files = self.storage_dir.glob("*.json")
-        return [f.stem for f in wallet_files]
+        # Singolo scandir: DirEntry con tipo cached, nessun Path per file
+        with os.scandir(self.storage_dir) as entries:
+            return [
+                entry.name[:-len(".json")]
+                for entry in entries
+                if entry.name.endswith(".json")
+                and not entry.name.endswith(SCAN_CURSOR_SUFFIX)
+                and entry.is_file(follow_symlinks=False)
+            ]
 
 
 # ============================================================================
@@ -439,4 +822,5 @@ class StealthService:
 
 __all__ = [
     "StealthService",
+    "StealthScanResult",
 ]
@@ -16,6 +16,7 @@ Features:
 """
 
 from typing import List, Dict, Optional, Tuple
+import logging
 import time
 
 # Internal imports
@@ -47,6 +48,12 @@ from carbon_chain.config import ChainSettings
 
 logger = get_logger("wallet_service")
 
+# Address derivate + interrogate per lookup bulk in get_next_unused_address
+UNUSED_ADDRESS_SCAN_BATCH = 20
+
+# Gap limit (BIP44): scan interrotto dopo N address consecutive mai usate
+DEFAULT_ADDRESS_GAP_LIMIT = 5
+
 
 # ============================================================================
 # WALLET SERVICE
@@ -201,7 +208,8 @@ class WalletService:
     def get_total_balance(
         self,
         wallet: HDWallet,
-        max_addresses: int = 20
+        max_addresses: int = 20,
+        gap_limit: int = DEFAULT_ADDRESS_GAP_LIMIT
     ) -> int:
         """
         Ottieni balance totale wallet (tutte le addresses).
@@ -209,6 +217,7 @@ class WalletService:
         Args:
             wallet: HD Wallet
             max_addresses: Max addresses da controllare
+            gap_limit: Stop dopo N address consecutive mai usate
         
         Returns:
             int: Balance totale in Satoshi
@@ -216,16 +225,13 @@ class WalletService:
         Examples:
             >>> total = service.get_total_balance(wallet)
         """
-        total = 0
+        # Balance bulk solo address usate (cache blockchain fino al prossimo blocco)
+        balances = self.blockchain.get_balances([
+            address
+            for _, address in self._scan_used_addresses(wallet, max_addresses, gap_limit)
+        ])
         
-        for index in range(max_addresses):
-            address = wallet.get_address(index)
-            balance = self.blockchain.get_balance(address)
-            
-            if balance > 0:
-                total += balance
-        
-        return total
+        return sum(balances.values())
     
     def list_utxos(
         self,
@@ -343,15 +349,16 @@ class WalletService:
         # Firma transazione
         signed_tx = wallet.sign_transaction(tx, from_address)
         
-        logger.info(
-            "Transfer transaction created",
-            extra_data={
-                "txid": signed_tx.compute_txid()[:16] + "...",
-                "amount": amount_satoshi,
-                "from": from_address[:16] + "...",
-                "to": to_address[:16] + "..."
-            }
-        )
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "Transfer transaction created",
+                extra_data={
+                    "txid": signed_tx.compute_txid()[:16] + "...",
+                    "amount": amount_satoshi,
+                    "from": from_address[:16] + "...",
+                    "to": to_address[:16] + "..."
+                }
+            )
         
         return signed_tx
     
@@ -403,7 +410,8 @@ class WalletService:
         """
         Seleziona UTXO per amount target.
         
-        Strategy: Simple greedy (largest first)
+        Strategy: Simple greedy (largest first), vedi
+        UTXOSet.select_for_amount
         
         Args:
             from_address: Address mittente
@@ -411,42 +419,22 @@ class WalletService:
         
         Returns:
             Tuple: (selected_utxos, total_input, change_amount)
-        
-        Algorithm:
-            1. Ottieni tutti UTXO spendibili
-            2. Ordina per amount (decrescente)
-            3. Accumula fino a target + fee
-            4. Calcola change
         """
-        # Ottieni UTXO spendibili
-        all_utxos = self.blockchain.utxo_set.get_spendable_utxos_for_address(from_address)
-        
-        if not all_utxos:
-            return [], 0, 0
-        
-        # Sort by amount (decrescente)
-        sorted_utxos = sorted(
-            all_utxos,
-            key=lambda x: x[1].amount,
-            reverse=True
+        selected, total = self.blockchain.utxo_set.select_for_amount(
+            from_address,
+            target_amount
         )
         
-        # Seleziona UTXO
-        selected = []
-        total = 0
-        
-        for utxo_key, output in sorted_utxos:
-            selected.append((utxo_key, output))
-            total += output.amount
-            
-            if total >= target_amount:
-                break
-        
         # Calcola change
         change = total - target_amount if total >= target_amount else 0
         
         return selected, total, change
     
+    @staticmethod
+    def _spendable_balance(utxos: List[Tuple[UTXOKey, TxOutput]]) -> int:
+        """Balance da lista UTXO (come UTXOSet.get_balance: solo spendibili)"""
+        return sum(output.amount for _, output in utxos if output.is_spendable())
+    
     # ========================================================================
     # ADDRESS MANAGEMENT
     # ========================================================================
@@ -469,16 +457,17 @@ class WalletService:
         Examples:
             >>> index, address = service.get_next_unused_address(wallet)
         """
-        for index in range(max_check):
-            address = wallet.get_address(index)
-            balance = self.blockchain.get_balance(address)
-            utxos = self.blockchain.get_utxos(address)
+        # Lookup bulk a blocchi: di solito il primo blocco basta
+        for batch_start in range(0, max_check, UNUSED_ADDRESS_SCAN_BATCH):
+            batch_end = min(batch_start + UNUSED_ADDRESS_SCAN_BATCH, max_check)
+            addresses = wallet.get_addresses(batch_end)[batch_start:]
+            utxos_by_address = self.blockchain.utxo_set.get_utxos_for_addresses(addresses)
             
-            # Address inutilizzato se:
-            # - Balance = 0
-            # - No UTXO
-            if balance == 0 and not utxos:
-                return index, address
+            for index, address in enumerate(addresses, start=batch_start):
+                # Address inutilizzato se nessun UTXO
+                # (balance = somma UTXO spendibili, quindi anche 0)
+                if not utxos_by_address[address]:
+                    return index, address
         
         # Se tutti usati, return next
         return max_check, wallet.get_address(max_check)
@@ -486,7 +475,8 @@ class WalletService:
     def scan_wallet_addresses(
         self,
         wallet: HDWallet,
-        max_addresses: int = 100
+        max_addresses: int = 100,
+        gap_limit: int = DEFAULT_ADDRESS_GAP_LIMIT
     ) -> List[Dict]:
         """
         Scansiona addresses wallet con balance/UTXO.
@@ -494,6 +484,7 @@ class WalletService:
         Args:
             wallet: HD Wallet
             max_addresses: Max addresses da scansionare
+            gap_limit: Stop dopo N address consecutive mai usate
         
         Returns:
             List[dict]: Lista {
@@ -510,10 +501,15 @@ class WalletService:
         """
         result = []
         
-        for index in range(max_addresses):
-            address = wallet.get_address(index)
-            balance = self.blockchain.get_balance(address)
-            utxos = self.blockchain.get_utxos(address)
+        # Singolo lookup bulk sulle address usate entro il gap limit
+        used = self._scan_used_addresses(wallet, max_addresses, gap_limit)
+        utxos_by_address = self.blockchain.utxo_set.get_utxos_for_addresses(
+            [address for _, address in used]
+        )
+        
+        for index, address in used:
+            utxos = utxos_by_address[address]
+            balance = self._spendable_balance(utxos)
             
             if balance > 0 or utxos:
                 result.append({
@@ -526,6 +522,41 @@ class WalletService:
         
         return result
     
+    def _scan_used_addresses(
+        self,
+        wallet: HDWallet,
+        max_addresses: int,
+        gap_limit: int
+    ) -> List[Tuple[int, str]]:
+        """
+        Address usate (index, address): indici 0.. fino a gap_limit
+        address consecutive mai usate (o max_addresses).
+        
+        "Usata" = ha mai ricevuto output (indice address blockchain):
+        address svuotate non interrompono lo scan. Le mai usate non hanno
+        UTXO, quindi non servono lookup balance. Derivazione a blocchi
+        di gap_limit (parallela, vedi HDWallet.get_addresses).
+        """
+        used = []
+        scanned = 0
+        consecutive_unused = 0
+        
+        while scanned < max_addresses and consecutive_unused < gap_limit:
+            batch_end = min(scanned + gap_limit, max_addresses)
+            
+            for address in wallet.get_addresses(batch_end)[scanned:]:
+                scanned += 1
+                
+                if self.blockchain.is_address_used(address):
+                    used.append((scanned - 1, address))
+                    consecutive_unused = 0
+                else:
+                    consecutive_unused += 1
+                    if consecutive_unused >= gap_limit:
+                        break
+        
+        return used
+    
     # ========================================================================
     # TRANSACTION HISTORY
     # ========================================================================
@@ -560,36 +591,25 @@ class WalletService:
             ...     print(f"{tx['txid'][:16]}: {tx['amount']}")
         """
         address = wallet.get_address(address_index)
-        history = []
         
-        # Scan blockchain
-        blocks_to_scan = self.blockchain.blocks[-max_blocks:] if max_blocks else self.blockchain.blocks
+        # Solo blocchi nel range richiesto (ultimi max_blocks)
+        start_height = max(0, len(self.blockchain.blocks) - max_blocks) if max_blocks else 0
         
-        for block in blocks_to_scan:
-            for tx in block.transactions:
-                # Check se tx coinvolge address
-                
-                # Input (spesa)
-                for inp in tx.inputs:
-                    utxo_key = UTXOKey(inp.prev_txid, inp.prev_output_index)
-                    utxo = self.blockchain.utxo_set.get_utxo(utxo_key)
-                    
-                    # Note: UTXO potrebbe essere già speso
-                    # Richiede lookup storico da storage
-                
-                # Output (ricezione)
-                for idx, output in enumerate(tx.outputs):
-                    if output.address == address:
-                        history.append({
-                            "txid": tx.compute_txid(),
-                            "block_height": block.header.height,
-                            "timestamp": block.header.timestamp,
-                            "type": tx.tx_type.name,
-                            "amount": output.amount,
-                            "direction": "in",
-                            "certified": output.is_certified,
-                            "compensated": output.is_compensated
-                        })
+        # Output ricevuti via indice address (niente scansione blocchi)
+        history = []
+        
+        for height, tx, output_index in self.blockchain.get_address_outputs(address, start_height):
+            output = tx.outputs[output_index]
+            history.append({
+                "txid": tx.compute_txid(),
+                "block_height": height,
+                "timestamp": self.blockchain.blocks[height].header.timestamp,
+                "type": tx.tx_type.name,
+                "amount": output.amount,
+                "direction": "in",
+                "certified": output.is_certified,
+                "compensated": output.is_compensated
+            })
         
         return history
 
@@ -16,10 +16,15 @@ Features:
 """
 
 import sqlite3
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from pathlib import Path
 import json
+import queue
 import threading
+import time
+import zlib
+from concurrent.futures import Future
+from contextlib import contextmanager
 
 # Internal imports
 from carbon_chain.domain.models import (
@@ -31,10 +36,12 @@ from carbon_chain.domain.models import (
 from carbon_chain.errors import (
     DatabaseError,
     DatabaseConnectionError,
+    DatabaseCorruptionError,
     BlockNotFoundError,
     TransactionNotFoundError,
 )
 from carbon_chain.logging_setup import get_logger
+from carbon_chain.utils.serialization import dump_json_bytes, load_json_bytes
 from carbon_chain.config import ChainSettings
 
 
@@ -45,6 +52,110 @@ from carbon_chain.config import ChainSettings
 logger = get_logger("storage")
 
 
+# Compressione BLOB: zlib con dizionario preset dei nomi campo ricorrenti.
+# Formato: tag 1 byte + stream zlib; i BLOB JSON legacy iniziano con '{'
+BLOB_TAG_ZLIB = b"\x01"
+BLOB_COMPRESSION_LEVEL = 1
+
+# NON modificare: serve a decomprimere i BLOB già scritti
+# (un dizionario diverso richiede un nuovo tag)
+BLOB_ZDICT = (
+    b'{"header":{"version":1,"previous_hash":"","merkle_root":"",'
+    b'"timestamp":,"difficulty":,"nonce":,"height":},"transactions":['
+    b'"certificate_id":"","certificate_hash":"","certificate_total_kg":,'
+    b'"certificate_metadata":,"compensation_project_id":"",'
+    b'"compensation_metadata":null,"metadata":null,'
+    b'{"tx_type":1,"inputs":[{"prev_txid":"","prev_output_index":0,'
+    b'"signature":"","public_key":""}],"outputs":[{"amount":,"address":"1",'
+    b'"is_certified":false,"is_compensated":false,"is_burned":false}],'
+    b'"timestamp":,"nonce":0,"txid":"'
+)
+
+
+def _dump_blob(data: Dict) -> bytes:
+    """Serializza colonna BLOB (block_data/tx_data/output_data): JSON compresso"""
+    payload = dump_json_bytes(data)
+    
+    compressor = zlib.compressobj(BLOB_COMPRESSION_LEVEL, zdict=BLOB_ZDICT)
+    return BLOB_TAG_ZLIB + compressor.compress(payload) + compressor.flush()
+
+
+def _load_blob(raw: bytes) -> Dict:
+    """
+    Deserializza colonna BLOB (compresso o JSON legacy non compresso).
+    
+    Lo stream zlib è auto-delimitato (checksum Adler-32 finale): stream
+    troncato o byte in coda dopo la fine vengono rifiutati senza parsing.
+    
+    Raises:
+        DatabaseCorruptionError: Se BLOB compresso troncato o con dati in coda
+    """
+    if raw[:1] == BLOB_TAG_ZLIB:
+        decompressor = zlib.decompressobj(zdict=BLOB_ZDICT)
+        try:
+            raw = decompressor.decompress(memoryview(raw)[1:])
+        except zlib.error as e:
+            raise DatabaseCorruptionError(
+                f"Corrupted BLOB: {e}",
+                code="BLOB_CORRUPTED"
+            )
+        
+        if not decompressor.eof or decompressor.unused_data:
+            raise DatabaseCorruptionError(
+                "Corrupted BLOB: truncated stream or trailing data",
+                code="BLOB_CORRUPTED"
+            )
+    
+    return load_json_bytes(raw)
+
+
+# output_data vuoto = output non certificato, interamente nelle colonne
+# tipizzate (to_dict non serializza altro per output non certificati)
+EMPTY_OUTPUT_DATA = b""
+
+
+def _dump_output_blob(output: TxOutput) -> bytes:
+    """Serializza output_data solo per output certificati (internal)"""
+    if output.is_certified:
+        return _dump_blob(output.to_dict())
+    
+    return EMPTY_OUTPUT_DATA
+
+
+def _hash_hex(value: Any) -> Optional[str]:
+    """Colonna hash → hex (BLOB 32 byte; TEXT hex nei database legacy)"""
+    if isinstance(value, bytes):
+        return value.hex()
+    
+    return value
+
+
+def _utxo_summaries(cursor: sqlite3.Cursor) -> List[Dict]:
+    """
+    Righe (txid, output_index, amount, is_certified, is_compensated) → dict.
+    
+    Itera il cursor direttamente (nessuna lista intermedia di righe).
+    """
+    return [
+        {
+            "txid": txid,
+            "output_index": output_index,
+            "amount": amount,
+            "is_certified": bool(is_certified),
+            "is_compensated": bool(is_compensated)
+        }
+        for txid, output_index, amount, is_certified, is_compensated in cursor
+    ]
+
+
+def _output_from_row(amount: int, address: str, is_burned: int, output_data: bytes) -> TxOutput:
+    """Ricostruisci TxOutput da riga utxos (BLOB solo se certificato)"""
+    if output_data:
+        return TxOutput.from_dict(_load_blob(output_data))
+    
+    return TxOutput(amount=amount, address=address, is_burned=bool(is_burned))
+
+
 # ============================================================================
 # DATABASE SCHEMA
 # ============================================================================
@@ -55,10 +166,10 @@ CREATE_TABLES_SQL = """
 -- Blocks table
 CREATE TABLE IF NOT EXISTS blocks (
     height INTEGER PRIMARY KEY,
-    hash TEXT UNIQUE NOT NULL,
+    hash BLOB UNIQUE NOT NULL,
     version INTEGER NOT NULL,
-    previous_hash TEXT NOT NULL,
-    merkle_root TEXT NOT NULL,
+    previous_hash BLOB NOT NULL,
+    merkle_root BLOB NOT NULL,
     timestamp INTEGER NOT NULL,
     difficulty INTEGER NOT NULL,
     nonce INTEGER NOT NULL,
@@ -97,13 +208,17 @@ CREATE TABLE IF NOT EXISTS utxos (
     is_compensated INTEGER NOT NULL DEFAULT 0,
     is_burned INTEGER NOT NULL DEFAULT 0,
     certificate_id TEXT,
-    certificate_hash TEXT,
+    certificate_hash BLOB,
     output_data BLOB NOT NULL,
     created_at INTEGER NOT NULL,
     PRIMARY KEY (txid, output_index)
-);
+) WITHOUT ROWID;
 
-CREATE INDEX IF NOT EXISTS idx_utxo_address ON utxos(address);
+-- Indice address coprente per le query per address (txid/output_index
+-- inclusi implicitamente come chiave primaria); sostituisce idx_utxo_address
+DROP INDEX IF EXISTS idx_utxo_address;
+CREATE INDEX IF NOT EXISTS idx_utxo_address_cover
+    ON utxos(address, amount, is_certified, is_compensated);
 CREATE INDEX IF NOT EXISTS idx_utxo_certified ON utxos(is_certified);
 CREATE INDEX IF NOT EXISTS idx_utxo_compensated ON utxos(is_compensated);
 CREATE INDEX IF NOT EXISTS idx_utxo_cert_id ON utxos(certificate_id);
@@ -111,7 +226,7 @@ CREATE INDEX IF NOT EXISTS idx_utxo_cert_id ON utxos(certificate_id);
 -- Certificates table
 CREATE TABLE IF NOT EXISTS certificates (
     certificate_id TEXT PRIMARY KEY,
-    certificate_hash TEXT UNIQUE NOT NULL,
+    certificate_hash BLOB UNIQUE NOT NULL,
     total_kg INTEGER NOT NULL,
     issued_kg INTEGER NOT NULL DEFAULT 0,
     compensated_kg INTEGER NOT NULL DEFAULT 0,
@@ -160,6 +275,104 @@ INSERT OR REPLACE INTO metadata (key, value, updated_at)
 VALUES ('schema_version', '1', strftime('%s', 'now'));
 """
 
+# Connessioni read-only nel pool lettori (aperte on demand)
+READER_POOL_SIZE = 8
+
+# PRAGMA connessioni lettore: sola lettura + stesso tuning letture del writer
+# (journal_mode/page_size sono persistenti nel file, impostati dal writer)
+READER_PRAGMAS = (
+    "PRAGMA query_only = ON",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+)
+
+# Max blocchi per transazione nel thread writer di save_block_async
+WRITE_BATCH_MAX_BLOCKS = 8
+
+# Pagine liberate per chiamata a vacuum() (incremental_vacuum)
+VACUUM_PAGES = 1000
+
+# Valore di PRAGMA auto_vacuum per la modalità INCREMENTAL
+AUTO_VACUUM_INCREMENTAL = 2
+
+# Righe per fetchmany in iter_blocks / load_utxos
+BLOCK_FETCH_BATCH = 1000
+UTXO_FETCH_BATCH = 10_000
+
+# PRAGMA per connessione: WAL + synchronous NORMAL (durabile a checkpoint),
+# letture via mmap (256 MiB), page cache 64 MiB, temp in memoria.
+# page_size/auto_vacuum prima di journal_mode e dello schema: hanno effetto
+# solo su database nuovo (in WAL page_size non è più modificabile),
+# no-op sui file esistenti
+CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA page_size = 8192",
+    "PRAGMA auto_vacuum = INCREMENTAL",
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+)
+
+# Statement hot path (SQL identico = statement compilato riusato
+# dalla cache per-connection di sqlite3)
+INSERT_BLOCK_SQL = """
+    INSERT INTO blocks (
+        height, hash, version, previous_hash, merkle_root,
+        timestamp, difficulty, nonce, tx_count, block_data, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_TRANSACTION_SQL = """
+    INSERT INTO transactions (
+        txid, block_height, tx_type, timestamp,
+        input_count, output_count, tx_data, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+DELETE_UTXO_SQL = """
+    DELETE FROM utxos
+    WHERE txid = ? AND output_index = ?
+"""
+
+INSERT_UTXO_SQL = """
+    INSERT INTO utxos (
+        txid, output_index, address, amount,
+        is_certified, is_compensated, is_burned,
+        certificate_id, certificate_hash,
+        output_data, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPSERT_CERTIFICATE_SQL = """
+    INSERT INTO certificates (
+        certificate_id, certificate_hash, total_kg,
+        issued_kg, compensated_kg, first_txid, first_block,
+        metadata, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(certificate_id) DO UPDATE SET
+        issued_kg = issued_kg + ?,
+        compensated_kg = compensated_kg + ?
+"""
+
+UPSERT_PROJECT_SQL = """
+    INSERT INTO projects (
+        project_id, project_name, project_type, location,
+        organization, total_kg_compensated, first_txid,
+        first_block, metadata, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(project_id) DO UPDATE SET
+        total_kg_compensated = total_kg_compensated + ?
+"""
+
+LINK_PROJECT_CERTIFICATE_SQL = """
+    INSERT OR IGNORE INTO project_certificates (
+        project_id, certificate_id
+    ) VALUES (?, ?)
+"""
+
 
 # ============================================================================
 # DATABASE CLASS
@@ -169,7 +382,9 @@ class BlockchainDatabase:
     """
     Database SQLite per blockchain persistence.
     
-    Thread-safe con connection pooling.
+    Thread-safe: un'unica connection writer serializzata da lock
+    (save_block, schema, vacuum) + pool di connection read-only per
+    le query (WAL: i lettori non bloccano il writer).
     
     Attributes:
         db_path: Path database file
@@ -185,8 +400,19 @@ class BlockchainDatabase:
         self.db_path = db_path
         self.config = config
         
-        # Thread-local storage per connections
-        self._local = threading.local()
+        # Writer unico (SQLite ammette un solo writer alla volta)
+        self._write_lock = threading.Lock()
+        self._writer_conn = self._connect(str(db_path), CONNECTION_PRAGMAS)
+        
+        # Pool lettori read-only
+        self._reader_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        
+        # Coda save_block_async (thread writer avviato al primo uso)
+        self._write_queue: "queue.Queue[Optional[Tuple[Block, Future]]]" = queue.Queue()
+        self._write_queue_lock = threading.Lock()
+        self._writer_thread: Optional[threading.Thread] = None
         
         # Initialize database
         self._initialize_database()
@@ -196,33 +422,69 @@ class BlockchainDatabase:
             extra_data={"db_path": str(db_path)}
         )
     
-    def _get_connection(self) -> sqlite3.Connection:
-        """Ottieni connection thread-local"""
-        if not hasattr(self._local, 'connection'):
-            try:
-                self._local.connection = sqlite3.connect(
-                    str(self.db_path),
-                    check_same_thread=False,
-                    timeout=30.0
-                )
-                # Enable foreign keys
-                self._local.connection.execute("PRAGMA foreign_keys = ON")
-                # WAL mode for better concurrency
-                self._local.connection.execute("PRAGMA journal_mode = WAL")
-            except sqlite3.Error as e:
-                raise DatabaseConnectionError(
-                    f"Failed to connect to database: {e}",
-                    code="DB_CONNECTION_FAILED"
-                )
+    def _connect(
+        self,
+        database: str,
+        pragmas: tuple,
+        uri: bool = False
+    ) -> sqlite3.Connection:
+        """Apri connection con PRAGMA di tuning (internal)"""
+        try:
+            conn = sqlite3.connect(
+                database,
+                check_same_thread=False,
+                timeout=30.0,
+                uri=uri
+            )
+            for pragma in pragmas:
+                conn.execute(pragma)
+            return conn
+        except sqlite3.Error as e:
+            raise DatabaseConnectionError(
+                f"Failed to connect to database: {e}",
+                code="DB_CONNECTION_FAILED"
+            )
+    
+    @contextmanager
+    def _writer(self) -> Iterator[sqlite3.Connection]:
+        """Connection writer, in mutua esclusione (internal)"""
+        with self._write_lock:
+            yield self._writer_conn
+    
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Connection read-only dal pool (internal).
+        
+        Apre una nuova connection finché il pool ha meno di
+        READER_POOL_SIZE connection, poi attende che una si liberi.
+        """
+        try:
+            conn = self._reader_pool.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._readers_lock:
+                if len(self._readers) < READER_POOL_SIZE:
+                    conn = self._connect(
+                        f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+                        READER_PRAGMAS,
+                        uri=True
+                    )
+                    self._readers.append(conn)
+            if conn is None:
+                conn = self._reader_pool.get()
         
-        return self._local.connection
+        try:
+            yield conn
+        finally:
+            self._reader_pool.put(conn)
     
     def _initialize_database(self) -> None:
         """Inizializza database con schema"""
         try:
-            conn = self._get_connection()
-            conn.executescript(CREATE_TABLES_SQL)
-            conn.commit()
+            with self._writer() as conn:
+                conn.executescript(CREATE_TABLES_SQL)
+                conn.commit()
             
             logger.info("Database schema initialized")
         
@@ -249,46 +511,93 @@ class BlockchainDatabase:
         Examples:
             >>> db.save_block(block)
         """
-        try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Serialize block
-            block_data = json.dumps(block.to_dict()).encode('utf-8')
-            block_hash = block.compute_block_hash()
-            
-            # Insert block
-            cursor.execute("""
-                INSERT INTO blocks (
-                    height, hash, version, previous_hash, merkle_root,
-                    timestamp, difficulty, nonce, tx_count, block_data, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                block.header.height,
-                block_hash,
-                block.header.version,
-                block.header.previous_hash,
-                block.header.merkle_root.hex(),
-                block.header.timestamp,
-                block.header.difficulty,
-                block.header.nonce,
-                len(block.transactions),
-                block_data,
-                int(time.time())
-            ))
-            
-            # Save transactions
-            for tx in block.transactions:
-                self._save_transaction(cursor, tx, block.header.height)
-            
-            # Update UTXO set
-            self._update_utxos(cursor, block)
-            
-            # Update certificates/projects
-            self._update_certificates_and_projects(cursor, block)
+        self._save_blocks([block])
+    
+    def save_block_async(self, block: Block) -> Future:
+        """
+        Accoda blocco per il salvataggio dal thread writer.
+        
+        Ritorna subito: il thread writer raggruppa fino a
+        WRITE_BATCH_MAX_BLOCKS blocchi accodati in un'unica transazione
+        (un commit/fsync per batch). Ordine di salvataggio = ordine di
+        accodamento.
+        
+        Args:
+            block: Block da salvare
+        
+        Returns:
+            Future: Risolto a None a blocco committato, o con l'eccezione
+                (DatabaseError) se il salvataggio del blocco fallisce
+        
+        Examples:
+            >>> future = db.save_block_async(block)
+            >>> future.result()  # Attende durabilità
+        """
+        future: Future = Future()
+        
+        with self._write_queue_lock:
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop,
+                    name="db-writer",
+                    daemon=True
+                )
+                self._writer_thread.start()
             
-            conn.commit()
+            self._write_queue.put((block, future))
+        
+        return future
+    
+    def _save_blocks(self, blocks: List[Block]) -> None:
+        """Salva blocchi in un'unica transazione (internal)"""
+        # Serialize blocchi (fuori dal lock writer)
+        serialized = [
+            (block, _dump_blob(block.to_dict()), block.compute_block_hash())
+            for block in blocks
+        ]
+        
+        # Un solo timestamp created_at per tutte le righe
+        created_at = int(time.time())
+        
+        with self._writer() as conn:
+            try:
+                cursor = conn.cursor()
+                
+                for block, block_data, block_hash in serialized:
+                    # Insert block
+                    cursor.execute(INSERT_BLOCK_SQL, (
+                        block.header.height,
+                        bytes.fromhex(block_hash),
+                        block.header.version,
+                        bytes.fromhex(block.header.previous_hash),
+                        block.header.merkle_root,
+                        block.header.timestamp,
+                        block.header.difficulty,
+                        block.header.nonce,
+                        len(block.transactions),
+                        block_data,
+                        created_at
+                    ))
+                    
+                    # Save transactions
+                    self._save_transactions(cursor, block, created_at)
+                    
+                    # Update UTXO set
+                    self._update_utxos(cursor, block, created_at)
+                    
+                    # Update certificates/projects
+                    self._update_certificates_and_projects(cursor, block, created_at)
+                
+                conn.commit()
             
+            except sqlite3.Error as e:
+                conn.rollback()
+                raise DatabaseError(
+                    f"Failed to save block: {e}",
+                    code="BLOCK_SAVE_FAILED"
+                )
+        
+        for block, _, block_hash in serialized:
             logger.debug(
                 f"Block saved to database",
                 extra_data={
@@ -296,13 +605,48 @@ class BlockchainDatabase:
                     "hash": block_hash[:16] + "..."
                 }
             )
+    
+    def _writer_loop(self) -> None:
+        """Thread writer: drena la coda a batch fino a sentinella None (internal)"""
+        stop = False
         
-        except sqlite3.Error as e:
-            conn.rollback()
-            raise DatabaseError(
-                f"Failed to save block: {e}",
-                code="BLOCK_SAVE_FAILED"
-            )
+        while not stop:
+            item = self._write_queue.get()
+            if item is None:
+                break
+            
+            batch = [item]
+            while len(batch) < WRITE_BATCH_MAX_BLOCKS:
+                try:
+                    item = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                
+                if item is None:
+                    stop = True
+                    break
+                
+                batch.append(item)
+            
+            self._flush_write_batch(batch)
+    
+    def _flush_write_batch(self, batch: List[Tuple[Block, Future]]) -> None:
+        """Salva batch e risolve i Future (internal)"""
+        try:
+            self._save_blocks([block for block, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+                return
+            
+            # Transazione annullata: riprova per blocco, così l'errore
+            # arriva solo ai blocchi che falliscono davvero
+            for item in batch:
+                self._flush_write_batch([item])
+            return
+        
+        for _, future in batch:
+            future.set_result(None)
     
     def load_block(self, height: int) -> Optional[Block]:
         """
@@ -318,23 +662,23 @@ class BlockchainDatabase:
             >>> block = db.load_block(0)  # Genesis
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT block_data FROM blocks WHERE height = ?
-            """, (height,))
-            
-            row = cursor.fetchone()
-            
-            if not row:
-                return None
-            
-            # Deserialize
-            block_dict = json.loads(row[0])
-            block = Block.from_dict(block_dict)
-            
-            return block
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT block_data FROM blocks WHERE height = ?
+                """, (height,))
+                
+                row = cursor.fetchone()
+                
+                if not row:
+                    return None
+                
+                # Deserialize
+                block_dict = _load_blob(row[0])
+                block = Block.from_dict(block_dict)
+                
+                return block
         
         except sqlite3.Error as e:
             raise DatabaseError(
@@ -342,33 +686,35 @@ class BlockchainDatabase:
                 code="BLOCK_LOAD_FAILED"
             )
     
-    def load_all_blocks(self) -> List[Block]:
+    def iter_blocks(self) -> Iterator[Block]:
         """
-        Carica tutti i blocchi (ordinati per height).
+        Itera i blocchi (ordinati per height) a batch di BLOCK_FETCH_BATCH righe.
         
-        Returns:
-            List[Block]: Lista blocchi
+        Solo un batch di BLOB in memoria alla volta: il picco non cresce
+        con la lunghezza della chain.
+        
+        Yields:
+            Block: Blocchi in ordine di height
         
         Examples:
-            >>> blocks = db.load_all_blocks()
-            >>> len(blocks)
-            100
+            >>> for block in db.iter_blocks():
+            ...     blockchain.add_block(block)
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT block_data FROM blocks ORDER BY height ASC
-            """)
-            
-            blocks = []
-            for row in cursor.fetchall():
-                block_dict = json.loads(row[0])
-                block = Block.from_dict(block_dict)
-                blocks.append(block)
-            
-            return blocks
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT block_data FROM blocks ORDER BY height ASC
+                """)
+                
+                while True:
+                    rows = cursor.fetchmany(BLOCK_FETCH_BATCH)
+                    if not rows:
+                        break
+                    
+                    for row in rows:
+                        yield Block.from_dict(_load_blob(row[0]))
         
         except sqlite3.Error as e:
             raise DatabaseError(
@@ -376,6 +722,20 @@ class BlockchainDatabase:
                 code="BLOCKS_LOAD_FAILED"
             )
     
+    def load_all_blocks(self) -> List[Block]:
+        """
+        Carica tutti i blocchi (ordinati per height).
+        
+        Returns:
+            List[Block]: Lista blocchi
+        
+        Examples:
+            >>> blocks = db.load_all_blocks()
+            >>> len(blocks)
+            100
+        """
+        return list(self.iter_blocks())
+    
     def get_block_count(self) -> int:
         """
         Ottieni numero blocchi.
@@ -384,11 +744,11 @@ class BlockchainDatabase:
             int: Count
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT COUNT(*) FROM blocks")
-            return cursor.fetchone()[0]
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("SELECT COUNT(*) FROM blocks")
+                return cursor.fetchone()[0]
         
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to count blocks: {e}")
@@ -401,13 +761,13 @@ class BlockchainDatabase:
             int: Height, o None se DB vuoto
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT MAX(height) FROM blocks")
-            result = cursor.fetchone()[0]
-            
-            return result
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("SELECT MAX(height) FROM blocks")
+                result = cursor.fetchone()[0]
+                
+                return result
         
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to get latest height: {e}")
@@ -416,33 +776,26 @@ class BlockchainDatabase:
     # TRANSACTION OPERATIONS
     # ========================================================================
     
-    def _save_transaction(
+    def _save_transactions(
         self,
         cursor: sqlite3.Cursor,
-        tx: Transaction,
-        block_height: int
+        block: Block,
+        created_at: int
     ) -> None:
-        """Salva transazione (internal)"""
-        import time
-        
-        tx_data = json.dumps(tx.to_dict()).encode('utf-8')
-        txid = tx.compute_txid()
-        
-        cursor.execute("""
-            INSERT INTO transactions (
-                txid, block_height, tx_type, timestamp,
-                input_count, output_count, tx_data, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            txid,
-            block_height,
-            tx.tx_type.value,
-            tx.timestamp,
-            len(tx.inputs),
-            len(tx.outputs),
-            tx_data,
-            int(time.time())
-        ))
+        """Salva transazioni del blocco, un solo executemany (internal)"""
+        cursor.executemany(INSERT_TRANSACTION_SQL, [
+            (
+                tx.compute_txid(),
+                block.header.height,
+                tx.tx_type.value,
+                tx.timestamp,
+                len(tx.inputs),
+                len(tx.outputs),
+                _dump_blob(tx.to_dict()),
+                created_at
+            )
+            for tx in block.transactions
+        ])
     
     def load_transaction(self, txid: str) -> Optional[Transaction]:
         """
@@ -455,20 +808,20 @@ class BlockchainDatabase:
             Transaction: Tx caricata
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT tx_data FROM transactions WHERE txid = ?
-            """, (txid,))
-            
-            row = cursor.fetchone()
-            
-            if not row:
-                return None
-            
-            tx_dict = json.loads(row[0])
-            return Transaction.from_dict(tx_dict)
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT tx_data FROM transactions WHERE txid = ?
+                """, (txid,))
+                
+                row = cursor.fetchone()
+                
+                if not row:
+                    return None
+                
+                tx_dict = _load_blob(row[0])
+                return Transaction.from_dict(tx_dict)
         
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to load transaction: {e}")
@@ -489,28 +842,18 @@ class BlockchainDatabase:
             List[dict]: Lista tx info
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Query UTXO per address
-            cursor.execute("""
-                SELECT txid, output_index, amount, is_certified, is_compensated
-                FROM utxos 
-                WHERE address = ?
-                LIMIT ?
-            """, (address, limit))
-            
-            results = []
-            for row in cursor.fetchall():
-                results.append({
-                    "txid": row[0],
-                    "output_index": row[1],
-                    "amount": row[2],
-                    "is_certified": bool(row[3]),
-                    "is_compensated": bool(row[4])
-                })
-            
-            return results
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                
+                # Query UTXO per address
+                cursor.execute("""
+                    SELECT txid, output_index, amount, is_certified, is_compensated
+                    FROM utxos 
+                    WHERE address = ?
+                    LIMIT ?
+                """, (address, limit))
+                
+                return _utxo_summaries(cursor)
         
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to query transactions: {e}")
@@ -519,34 +862,28 @@ class BlockchainDatabase:
     # UTXO OPERATIONS
     # ========================================================================
     
-    def _update_utxos(self, cursor: sqlite3.Cursor, block: Block) -> None:
-        """Update UTXO set con blocco (internal)"""
-        import time
+    def _update_utxos(
+        self,
+        cursor: sqlite3.Cursor,
+        block: Block,
+        created_at: int
+    ) -> None:
+        """
+        Update UTXO set con blocco (internal).
+        
+        Un executemany per tabella: prima tutti gli output creati, poi
+        tutti gli input spesi, così un output creato e speso nello stesso
+        blocco viene rimosso come nell'applicazione per-tx.
+        """
+        new_rows = []
+        spent_rows = []
         
         for tx in block.transactions:
-            txid = tx.compute_txid()
-            
-            # Rimuovi input spesi (se non COINBASE)
-            if not tx.is_coinbase():
-                for inp in tx.inputs:
-                    cursor.execute("""
-                        DELETE FROM utxos 
-                        WHERE txid = ? AND output_index = ?
-                    """, (inp.prev_txid, inp.prev_output_index))
-            
             # Aggiungi output (se non BURN)
             if not tx.is_burn():
-                for idx, output in enumerate(tx.outputs):
-                    output_data = json.dumps(output.to_dict()).encode('utf-8')
-                    
-                    cursor.execute("""
-                        INSERT INTO utxos (
-                            txid, output_index, address, amount,
-                            is_certified, is_compensated, is_burned,
-                            certificate_id, certificate_hash,
-                            output_data, created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
+                txid = tx.compute_txid()
+                new_rows.extend(
+                    (
                         txid,
                         idx,
                         output.address,
@@ -555,10 +892,22 @@ class BlockchainDatabase:
                         1 if output.is_compensated else 0,
                         1 if output.is_burned else 0,
                         output.certificate_id,
-                        output.certificate_hash.hex() if output.certificate_hash else None,
-                        output_data,
-                        int(time.time())
-                    ))
+                        output.certificate_hash,
+                        _dump_output_blob(output),
+                        created_at
+                    )
+                    for idx, output in enumerate(tx.outputs)
+                )
+            
+            # Rimuovi input spesi (se non COINBASE)
+            if not tx.is_coinbase():
+                spent_rows.extend(
+                    (inp.prev_txid, inp.prev_output_index)
+                    for inp in tx.inputs
+                )
+        
+        cursor.executemany(INSERT_UTXO_SQL, new_rows)
+        cursor.executemany(DELETE_UTXO_SQL, spent_rows)
     
     def load_utxos(self) -> Dict[UTXOKey, TxOutput]:
         """
@@ -573,22 +922,23 @@ class BlockchainDatabase:
             1000
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT txid, output_index, output_data FROM utxos")
-            
-            utxos = {}
-            for row in cursor.fetchall():
-                txid, output_index, output_data = row
+            with self._reader() as conn:
+                cursor = conn.cursor()
                 
-                output_dict = json.loads(output_data)
-                output = TxOutput.from_dict(output_dict)
+                cursor.execute("""
+                    SELECT txid, output_index, amount, address, is_burned, output_data
+                    FROM utxos
+                """)
                 
-                utxo_key = UTXOKey(txid, output_index)
-                utxos[utxo_key] = output
-            
-            return utxos
+                # Streaming a batch: nessuna lista di tutte le righe in memoria
+                utxos = {}
+                for rows in iter(lambda: cursor.fetchmany(UTXO_FETCH_BATCH), []):
+                    for txid, output_index, amount, address, is_burned, output_data in rows:
+                        utxos[UTXOKey(txid, output_index)] = _output_from_row(
+                            amount, address, is_burned, output_data
+                        )
+                
+                return utxos
         
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to load UTXOs: {e}")
@@ -604,26 +954,16 @@ class BlockchainDatabase:
             List[dict]: Lista UTXO
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT txid, output_index, amount, is_certified, is_compensated
-                FROM utxos
-                WHERE address = ?
-            """, (address,))
-            
-            results = []
-            for row in cursor.fetchall():
-                results.append({
-                    "txid": row[0],
-                    "output_index": row[1],
-                    "amount": row[2],
-                    "is_certified": bool(row[3]),
-                    "is_compensated": bool(row[4])
-                })
-            
-            return results
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT txid, output_index, amount, is_certified, is_compensated
+                    FROM utxos
+                    WHERE address = ?
+                """, (address,))
+                
+                return _utxo_summaries(cursor)
         
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to query UTXOs: {e}")
@@ -635,62 +975,53 @@ class BlockchainDatabase:
     def _update_certificates_and_projects(
         self,
         cursor: sqlite3.Cursor,
-        block: Block
+        block: Block,
+        created_at: int
     ) -> None:
-        """Update certificates e projects (internal)"""
-        import time
+        """Update certificates e projects, un executemany per tabella (internal)"""
+        cert_rows = []
+        project_rows = []
+        link_rows = []
         
         for tx in block.transactions:
+            is_assignment = tx.is_certificate_assignment()
+            is_compensation = tx.is_compensation()
+            
+            if not (is_assignment or is_compensation):
+                continue
+            
             txid = tx.compute_txid()
             
             # Update certificates
-            if tx.is_certificate_assignment():
+            if is_assignment:
                 for output in tx.outputs:
                     if not output.is_certified:
                         continue
                     
-                    # Upsert certificate
-                    cursor.execute("""
-                        INSERT INTO certificates (
-                            certificate_id, certificate_hash, total_kg,
-                            issued_kg, compensated_kg, first_txid, first_block,
-                            metadata, created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ON CONFLICT(certificate_id) DO UPDATE SET
-                            issued_kg = issued_kg + ?,
-                            compensated_kg = compensated_kg + ?
-                    """, (
+                    compensated_kg = output.amount if output.is_compensated else 0
+                    cert_rows.append((
                         output.certificate_id,
-                        output.certificate_hash.hex(),
+                        output.certificate_hash,
                         output.certificate_total_kg,
                         output.amount,
-                        output.amount if output.is_compensated else 0,
+                        compensated_kg,
                         txid,
                         block.header.height,
                         json.dumps(output.certificate_metadata or {}),
-                        int(time.time()),
+                        created_at,
                         output.amount,
-                        output.amount if output.is_compensated else 0
+                        compensated_kg
                     ))
             
             # Update projects
-            if tx.is_compensation():
+            if is_compensation:
                 for output in tx.outputs:
                     if not output.is_compensated:
                         continue
                     
                     metadata = output.compensation_metadata or {}
                     
-                    # Upsert project
-                    cursor.execute("""
-                        INSERT INTO projects (
-                            project_id, project_name, project_type, location,
-                            organization, total_kg_compensated, first_txid,
-                            first_block, metadata, created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ON CONFLICT(project_id) DO UPDATE SET
-                            total_kg_compensated = total_kg_compensated + ?
-                    """, (
+                    project_rows.append((
                         output.compensation_project_id,
                         metadata.get("project_name", output.compensation_project_id),
                         metadata.get("project_type", "unknown"),
@@ -700,44 +1031,49 @@ class BlockchainDatabase:
                         txid,
                         block.header.height,
                         json.dumps(metadata),
-                        int(time.time()),
+                        created_at,
                         output.amount
                     ))
                     
                     # Link project-certificate
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO project_certificates (
-                            project_id, certificate_id
-                        ) VALUES (?, ?)
-                    """, (output.compensation_project_id, output.certificate_id))
+                    link_rows.append(
+                        (output.compensation_project_id, output.certificate_id)
+                    )
+        
+        # Link dopo entrambi gli upsert (foreign key su projects/certificates)
+        if cert_rows:
+            cursor.executemany(UPSERT_CERTIFICATE_SQL, cert_rows)
+        if project_rows:
+            cursor.executemany(UPSERT_PROJECT_SQL, project_rows)
+            cursor.executemany(LINK_PROJECT_CERTIFICATE_SQL, link_rows)
     
     def get_certificate_info(self, cert_id: str) -> Optional[Dict]:
         """Ottieni info certificato"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT certificate_id, certificate_hash, total_kg,
-                       issued_kg, compensated_kg, first_txid, first_block, metadata
-                FROM certificates
-                WHERE certificate_id = ?
-            """, (cert_id,))
-            
-            row = cursor.fetchone()
-            if not row:
-                return None
-            
-            return {
-                "certificate_id": row[0],
-                "certificate_hash": row[1],
-                "total_kg": row[2],
-                "issued_kg": row[3],
-                "compensated_kg": row[4],
-                "first_txid": row[5],
-                "first_block": row[6],
-                "metadata": json.loads(row[7])
-            }
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT certificate_id, certificate_hash, total_kg,
+                           issued_kg, compensated_kg, first_txid, first_block, metadata
+                    FROM certificates
+                    WHERE certificate_id = ?
+                """, (cert_id,))
+                
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                
+                return {
+                    "certificate_id": row[0],
+                    "certificate_hash": _hash_hex(row[1]),
+                    "total_kg": row[2],
+                    "issued_kg": row[3],
+                    "compensated_kg": row[4],
+                    "first_txid": row[5],
+                    "first_block": row[6],
+                    "metadata": json.loads(row[7])
+                }
         
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to get certificate: {e}")
@@ -745,40 +1081,40 @@ class BlockchainDatabase:
     def get_project_info(self, project_id: str) -> Optional[Dict]:
         """Ottieni info progetto"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT project_id, project_name, project_type, location,
-                       organization, total_kg_compensated, first_txid, first_block, metadata
-                FROM projects
-                WHERE project_id = ?
-            """, (project_id,))
-            
-            row = cursor.fetchone()
-            if not row:
-                return None
-            
-            # Get certificates
-            cursor.execute("""
-                SELECT certificate_id FROM project_certificates
-                WHERE project_id = ?
-            """, (project_id,))
-            
-            certificates = [r[0] for r in cursor.fetchall()]
-            
-            return {
-                "project_id": row[0],
-                "project_name": row[1],
-                "project_type": row[2],
-                "location": row[3],
-                "organization": row[4],
-                "total_kg_compensated": row[5],
-                "first_txid": row[6],
-                "first_block": row[7],
-                "metadata": json.loads(row[8]),
-                "certificates_used": certificates
-            }
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT project_id, project_name, project_type, location,
+                           organization, total_kg_compensated, first_txid, first_block, metadata
+                    FROM projects
+                    WHERE project_id = ?
+                """, (project_id,))
+                
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                
+                # Get certificates
+                cursor.execute("""
+                    SELECT certificate_id FROM project_certificates
+                    WHERE project_id = ?
+                """, (project_id,))
+                
+                certificates = [r[0] for r in cursor.fetchall()]
+                
+                return {
+                    "project_id": row[0],
+                    "project_name": row[1],
+                    "project_type": row[2],
+                    "location": row[3],
+                    "organization": row[4],
+                    "total_kg_compensated": row[5],
+                    "first_txid": row[6],
+                    "first_block": row[7],
+                    "metadata": json.loads(row[8]),
+                    "certificates_used": certificates
+                }
         
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to get project: {e}")
@@ -788,19 +1124,53 @@ class BlockchainDatabase:
     # ========================================================================
     
     def close(self) -> None:
-        """Chiudi database connections"""
-        if hasattr(self._local, 'connection'):
-            self._local.connection.close()
-            delattr(self._local, 'connection')
+        """Chiudi database (drena coda save_block_async, writer + pool lettori)"""
+        with self._write_queue_lock:
+            writer_thread = self._writer_thread
+            self._writer_thread = None
+            if writer_thread is not None:
+                self._write_queue.put(None)
+        
+        if writer_thread is not None:
+            writer_thread.join()
+        
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+            self._reader_pool = queue.Queue()
+        
+        with self._write_lock:
+            self._writer_conn.close()
         
         logger.info("Database closed")
     
-    def vacuum(self) -> None:
-        """Ottimizza database (VACUUM)"""
+    def vacuum(self, pages: int = VACUUM_PAGES) -> None:
+        """
+        Recupera spazio libero del database.
+        
+        Database creati con auto_vacuum INCREMENTAL: libera al massimo
+        `pages` pagine (PRAGMA incremental_vacuum), costo limitato e
+        richiamabile periodicamente. Database legacy: VACUUM completo
+        (riscrive l'intero file).
+        
+        Args:
+            pages: Max pagine da liberare (solo modalità incrementale)
+        """
         try:
-            conn = self._get_connection()
-            conn.execute("VACUUM")
-            logger.info("Database vacuumed")
+            with self._writer() as conn:
+                auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+                
+                if auto_vacuum == AUTO_VACUUM_INCREMENTAL:
+                    # executescript: execute() farebbe un solo step (una pagina)
+                    conn.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+                else:
+                    conn.execute("VACUUM")
+            
+            logger.info(
+                "Database vacuumed",
+                extra_data={"incremental": auto_vacuum == AUTO_VACUUM_INCREMENTAL}
+            )
         except sqlite3.Error as e:
             logger.error(f"Vacuum failed: {e}")
 
@@ -7,6 +7,8 @@ Common utility functions and helpers.
 from carbon_chain.utils.serialization import (
     serialize_to_json,
     deserialize_from_json,
+    dump_json_bytes,
+    load_json_bytes,
     bytes_to_hex,
     hex_to_bytes,
 )
@@ -32,6 +34,8 @@ __all__ = [
     # Serialization
     "serialize_to_json",
     "deserialize_from_json",
+    "dump_json_bytes",
+    "load_json_bytes",
     "bytes_to_hex",
     "hex_to_bytes",
     
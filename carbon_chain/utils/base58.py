@@ -20,6 +20,13 @@ logger = get_logger("utils.base58")
 # Bitcoin Base58 alphabet (no 0, O, I, l to avoid confusion)
 BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
 
+# Two-digit lookup (58**2 entries): one bigint divmod per two output chars
+_BASE58_PAIR_BASE = 58 * 58
+_BASE58_PAIRS = tuple(
+    BASE58_ALPHABET[i // 58] + BASE58_ALPHABET[i % 58]
+    for i in range(_BASE58_PAIR_BASE)
+)
+
 
 # ============================================================================
 # BASE58 ENCODING
@@ -42,20 +49,24 @@ def base58_encode(data: bytes) -> str:
     # Convert bytes to integer
     num = int.from_bytes(data, byteorder='big')
     
-    # Encode to base58
-    encoded = ''
-    while num > 0:
-        num, remainder = divmod(num, 58)
-        encoded = BASE58_ALPHABET[remainder] + encoded
+    # Encode to base58, two digits per divmod (least significant first)
+    parts = []
+    while num >= _BASE58_PAIR_BASE:
+        num, remainder = divmod(num, _BASE58_PAIR_BASE)
+        parts.append(_BASE58_PAIRS[remainder])
+    
+    # Most significant digits (no leading '1' padding)
+    if num >= 58:
+        parts.append(_BASE58_PAIRS[num])
+    elif num:
+        parts.append(BASE58_ALPHABET[num])
+    
+    parts.reverse()
     
     # Preserve leading zeros
-    for byte in data:
-        if byte == 0:
-            encoded = '1' + encoded
-        else:
-            break
+    leading_zeros = len(data) - len(data.lstrip(b'\x00'))
     
-    return encoded or '1'
+    return '1' * leading_zeros + ''.join(parts) or '1'
 
 
 def base58_decode(encoded: str) -> bytes:
@@ -6,7 +6,7 @@ Metrics collection and performance monitoring.
 
 import time
 import functools
-from typing import Dict, Callable, Any
+from typing import Dict, Callable, Any, Optional
 from collections import defaultdict
 from dataclasses import dataclass, field
 
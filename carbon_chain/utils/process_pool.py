@@ -0,0 +1,87 @@
+"""
+CarbonChain - Process Pool
+============================
+Shared process pool for CPU-bound batches (firme, scan stealth).
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from carbon_chain.logging_setup import get_logger
+
+logger = get_logger("utils.process_pool")
+
+
+# ============================================================================
+# SHARED POOL
+# ============================================================================
+
+# Mai fork: il nodo è multi-thread (listener logging, writer DB, mining)
+# e un figlio forkato può ereditare un lock tenuto da un altro thread.
+# forkserver/spawn avviano worker puliti, senza memoria del processo padre.
+PROCESS_START_METHOD = (
+    "forkserver"
+    if "forkserver" in multiprocessing.get_all_start_methods()
+    else "spawn"
+)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Pool di processi condiviso, creato al primo uso.
+    
+    Worker = os.cpu_count(); i chiamanti regolano il parallelismo
+    con la dimensione dei chunk. I worker restano vivi tra le chiamate
+    (avvio di un processo forkserver/spawn = import dei moduli).
+    
+    Returns:
+        ProcessPoolExecutor: Pool condiviso
+    """
+    global _pool
+    
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context(PROCESS_START_METHOD)
+            )
+            
+            logger.debug(
+                "Process pool created",
+                extra_data={"start_method": PROCESS_START_METHOD}
+            )
+        
+        return _pool
+
+
+def discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Scarta pool non più utilizzabile (es. BrokenProcessPool).
+    
+    Il get_process_pool successivo ne crea uno nuovo.
+    
+    Args:
+        pool: Pool restituito da get_process_pool
+    """
+    global _pool
+    
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+__all__ = [
+    "PROCESS_START_METHOD",
+    "get_process_pool",
+    "discard_process_pool",
+]
@@ -13,6 +13,13 @@ from carbon_chain.logging_setup import get_logger
 
 logger = get_logger("utils.serialization")
 
+# Try to import orjson (optional dependency, codec JSON nativo)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # ============================================================================
 # JSON SERIALIZATION
@@ -71,6 +78,41 @@ def deserialize_from_json(json_str: str) -> Any:
         raise
 
 
+def dump_json_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize JSON-native object to UTF-8 bytes (orjson se disponibile).
+    
+    Nessun default handler: per file e BLOB già composti da tipi JSON.
+    
+    Args:
+        obj: Object to serialize (dict/list/str/int/float/bool/None)
+        indent: Indentazione 2 spazi (file leggibili, es. wallet)
+    
+    Returns:
+        bytes: JSON UTF-8
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def load_json_bytes(raw: bytes) -> Any:
+    """
+    Deserialize JSON bytes (orjson se disponibile).
+    
+    Args:
+        raw: JSON UTF-8 bytes
+    
+    Returns:
+        Any: Python object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    
+    return json.loads(raw)
+
+
 # ============================================================================
 # BYTES/HEX CONVERSION
 # ============================================================================
@@ -201,6 +243,8 @@ def read_compact_size(data: bytes, offset: int = 0) -> tuple[int, int]:
 __all__ = [
     "serialize_to_json",
     "deserialize_from_json",
+    "dump_json_bytes",
+    "load_json_bytes",
     "bytes_to_hex",
     "hex_to_bytes",
     "int_to_bytes",
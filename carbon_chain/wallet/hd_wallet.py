@@ -22,12 +22,17 @@ import hashlib
 import hmac
 import secrets
 import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 
 # Internal imports
 from carbon_chain.domain.keypairs import KeyPair, generate_keypair_from_seed
 from carbon_chain.domain.addressing import public_key_to_address
 from carbon_chain.domain.crypto_core import (
+    sign_message,
     derive_key_pbkdf2,
     encrypt_data_aes_gcm,
     decrypt_data_aes_gcm,
@@ -40,6 +45,7 @@ from carbon_chain.errors import (
     WalletLockedError,
 )
 from carbon_chain.logging_setup import get_logger
+from carbon_chain.utils.process_pool import get_process_pool, discard_process_pool
 from carbon_chain.config import ChainSettings
 
 
@@ -49,6 +55,18 @@ from carbon_chain.config import ChainSettings
 
 logger = get_logger("wallet")
 
+# Batch minimo per firma parallela (sotto, overhead pool > guadagno)
+PARALLEL_SIGNING_MIN_BATCH = 16
+
+# Address minime da derivare per derivazione parallela (thread)
+PARALLEL_DERIVATION_MIN_BATCH = 8
+
+
+def _sign_messages_worker(payload: Tuple[bytes, str, List[bytes]]) -> List[bytes]:
+    """Worker process pool: firma (private_key, algorithm, messages) con una chiave"""
+    private_key, algorithm, messages = payload
+    return [sign_message(message, private_key, algorithm) for message in messages]
+
 
 # ============================================================================
 # BIP39 WORDLIST (ENGLISH)
@@ -149,8 +167,11 @@ class HDWallet:
         # Deriva master key
         self.master_private_key = self._derive_master_key(self.seed)
         
-        # Cache addresses (index → (address, keypair))
-        self._address_cache: Dict[int, Tuple[str, KeyPair]] = {}
+        # Cache addresses ((account, change, index) → (address, keypair))
+        self._address_cache: Dict[Tuple[int, int, int], Tuple[str, KeyPair]] = {}
+        
+        # Indice inverso address esterne account 0 (address → index)
+        self._address_index: Dict[str, int] = {}
         
         logger.info(
             "HD Wallet initialized",
@@ -422,16 +443,19 @@ class HDWallet:
         
         # Cache
         self._address_cache[cache_key] = (address, keypair)
-        
-        logger.debug(
-            f"Address derived",
-            extra_data={
-                "index": index,
-                "account": account,
-                "change": change,
-                "address": address[:16] + "..."
-            }
-        )
+        if account == 0 and change == 0:
+            self._address_index[address] = index
+        
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                f"Address derived",
+                extra_data={
+                    "index": index,
+                    "account": account,
+                    "change": change,
+                    "address": address[:16] + "..."
+                }
+            )
         
         return address, keypair
     
@@ -516,6 +540,11 @@ class HDWallet:
             >>> wallet.find_address_index(addr)
             5
         """
+        # Address già derivata: lookup O(1), nessuna scansione
+        index = self._address_index.get(address)
+        if index is not None and index < max_search:
+            return index
+        
         for index in range(max_search):
             derived_addr, _ = self.derive_address(index)
             if derived_addr == address:
@@ -551,7 +580,131 @@ class HDWallet:
             >>> tx = Transaction(...)
             >>> signed_tx = wallet.sign_transaction(tx, addr)
         """
-        # Trova keypair per address
+        keypair = self._get_signing_keypair(from_address)
+        
+        signed_tx = self._sign_with_keypair(tx, keypair)
+        
+        logger.info(
+            "Transaction signed",
+            extra_data={
+                "txid": tx.compute_txid()[:16] + "...",
+                "from_address": from_address[:16] + "..."
+            }
+        )
+        
+        return signed_tx
+    
+    def sign_transactions(
+        self,
+        txs_with_addresses: List[Tuple],
+        max_workers: Optional[int] = None
+    ) -> List:
+        """
+        Firma batch di transazioni.
+        
+        Il keypair di ogni address viene risolto una sola volta per batch
+        (invece di una ricerca find_address_index per tx). Per batch grandi
+        le firme ECDSA (CPU-bound, indipendenti) sono calcolate in parallelo
+        su processi separati.
+        
+        Args:
+            txs_with_addresses: Lista (tx, from_address)
+            max_workers: Processi per firma parallela (None = os.cpu_count(),
+                1 = sempre seriale)
+        
+        Returns:
+            List[Transaction]: Tx firmate (stesso ordine)
+        
+        Raises:
+            WalletError: Se un address non è nel wallet
+        
+        Examples:
+            >>> signed = wallet.sign_transactions([(tx1, addr), (tx2, addr)])
+        """
+        keypairs: Dict[str, KeyPair] = {}
+        jobs = []
+        
+        # Costruzione seriale (economica): keypair + signing message
+        for tx, from_address in txs_with_addresses:
+            keypair = keypairs.get(from_address)
+            if keypair is None:
+                keypair = self._get_signing_keypair(from_address)
+                keypairs[from_address] = keypair
+            
+            jobs.append((tx, keypair, self._signing_message(tx)))
+        
+        workers = max_workers or os.cpu_count() or 1
+        signatures = None
+        
+        if workers > 1 and len(jobs) >= PARALLEL_SIGNING_MIN_BATCH:
+            signatures = self._sign_parallel(jobs, workers)
+        
+        if signatures is None:
+            signatures = [keypair.sign(message) for _, keypair, message in jobs]
+        
+        signed_txs = [
+            self._attach_signature(tx, keypair, signature)
+            for (tx, keypair, _), signature in zip(jobs, signatures)
+        ]
+        
+        logger.info(
+            "Transactions signed (batch)",
+            extra_data={
+                "count": len(signed_txs),
+                "addresses": len(keypairs)
+            }
+        )
+        
+        return signed_txs
+    
+    def _sign_parallel(self, jobs: List[Tuple], workers: int) -> Optional[List[bytes]]:
+        """
+        Firma messaggi sul process pool condiviso (None se non disponibile).
+        
+        Job raggruppati per keypair: ogni payload porta una sola private
+        key (solo quelle usate dal batch) con i suoi messaggi, mai il
+        wallet; i worker (forkserver/spawn) non ereditano la memoria
+        del processo.
+        """
+        algorithm = self.config.crypto_algorithm
+        chunk_size = max(1, len(jobs) // (workers * 4))
+        
+        # private_key -> indici job
+        indexes_by_key: Dict[bytes, List[int]] = {}
+        for i, (_, keypair, _) in enumerate(jobs):
+            indexes_by_key.setdefault(keypair.private_key, []).append(i)
+        
+        payloads = []
+        payload_indexes = []
+        for private_key, indexes in indexes_by_key.items():
+            for start in range(0, len(indexes), chunk_size):
+                chunk = indexes[start:start + chunk_size]
+                payloads.append((private_key, algorithm, [jobs[i][2] for i in chunk]))
+                payload_indexes.append(chunk)
+        
+        pool = get_process_pool()
+        signatures: List[Optional[bytes]] = [None] * len(jobs)
+        
+        try:
+            for chunk, chunk_signatures in zip(
+                payload_indexes,
+                pool.map(_sign_messages_worker, payloads)
+            ):
+                for i, signature in zip(chunk, chunk_signatures):
+                    signatures[i] = signature
+        
+        except (OSError, BrokenProcessPool) as e:
+            discard_process_pool(pool)
+            logger.warning(
+                "Parallel signing unavailable, falling back to serial",
+                extra_data={"error": str(e)}
+            )
+            return None
+        
+        return signatures
+    
+    def _get_signing_keypair(self, from_address: str) -> KeyPair:
+        """Risolvi keypair per address (WalletError se non trovato)"""
         address_index = self.find_address_index(from_address)
         
         if address_index is None:
@@ -560,16 +713,17 @@ class HDWallet:
                 code="ADDRESS_NOT_FOUND"
             )
         
-        keypair = self.get_keypair(address_index)
-        
-        # Crea signing message
+        return self.get_keypair(address_index)
+    
+    @staticmethod
+    def _signing_message(tx) -> bytes:
+        """Messaggio da firmare (tx senza firme, JSON canonico)"""
         tx_dict = tx.to_dict(include_signatures=False)
-        signing_message = json.dumps(tx_dict, sort_keys=True).encode('utf-8')
-        
-        # Firma
-        signature = keypair.sign(signing_message)
-        
-        # Aggiungi firma a input
+        return json.dumps(tx_dict, sort_keys=True).encode('utf-8')
+    
+    @staticmethod
+    def _attach_signature(tx, keypair: KeyPair, signature: bytes):
+        """Aggiungi firma + public key a tutti gli input"""
         from dataclasses import replace
         
         signed_inputs = []
@@ -582,17 +736,12 @@ class HDWallet:
             signed_inputs.append(signed_inp)
         
         # Crea tx firmata
-        signed_tx = replace(tx, inputs=signed_inputs)
-        
-        logger.info(
-            "Transaction signed",
-            extra_data={
-                "txid": tx.compute_txid()[:16] + "...",
-                "from_address": from_address[:16] + "..."
-            }
-        )
-        
-        return signed_tx
+        return replace(tx, inputs=signed_inputs)
+    
+    def _sign_with_keypair(self, tx, keypair: KeyPair):
+        """Firma tutti gli input di tx con keypair"""
+        signature = keypair.sign(self._signing_message(tx))
+        return self._attach_signature(tx, keypair, signature)
     
     # ========================================================================
     # WALLET ENCRYPTION
@@ -731,12 +880,22 @@ class HDWallet:
         logger.warning("⚠️ Mnemonic accessed - ensure secure handling!")
         return self.mnemonic
     
-    def get_addresses(self, count: int = 10) -> List[str]:
+    def get_addresses(
+        self,
+        count: int = 10,
+        max_workers: Optional[int] = None
+    ) -> List[str]:
         """
         Ottieni prime N addresses.
         
+        Le address non ancora in cache sono derivate su thread pool:
+        PBKDF2 e derivazione EC girano in OpenSSL senza GIL, quindi
+        scan di molte address scalano con i core.
+        
         Args:
             count: Numero addresses
+            max_workers: Thread per derivazione (None = os.cpu_count(),
+                1 = sempre seriale)
         
         Returns:
             List[str]: Lista addresses
@@ -747,6 +906,14 @@ class HDWallet:
             >>> len(addresses)
             5
         """
+        missing = [i for i in range(count) if (0, 0, i) not in self._address_cache]
+        workers = min(max_workers or os.cpu_count() or 1, len(missing))
+        
+        if workers > 1 and len(missing) >= PARALLEL_DERIVATION_MIN_BATCH:
+            # Popola cache (chiavi distinte per thread)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(self.derive_address, missing))
+        
         return [self.get_address(i) for i in range(count)]
     
     def __repr__(self) -> str:
@@ -17,6 +17,7 @@ Features:
 from __future__ import annotations
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
+from functools import cached_property
 import hashlib
 import time
 
@@ -25,6 +26,7 @@ from carbon_chain.domain.crypto_core import (
     generate_keypair,
     sign_message,
     verify_signature,
+    verify_signatures_batch,
     hash_sha256
 )
 from carbon_chain.domain.addressing import (
@@ -285,17 +287,48 @@ class PSBT:
         Returns:
             bool: True se tutte valide
         """
-        for partial_sig in self.partial_signatures:
-            if not verify_signature(
-                self.transaction_data,
-                partial_sig.signature,
-                partial_sig.public_key
-            ):
+        # Tutte le firme coprono transaction_data: verifica in batch
+        results = verify_signatures_batch(
+            self.transaction_data,
+            [(sig.signature, sig.public_key) for sig in self.partial_signatures]
+        )
+        
+        for partial_sig, is_valid in zip(self.partial_signatures, results):
+            if not is_valid:
                 logger.error(f"Invalid signature from signer {partial_sig.signer_index}")
                 return False
         
         return True
     
+    def finalize_signatures(self) -> Optional[List[bytes]]:
+        """
+        Verifica e ordina le firme in un solo passaggio (per finalize).
+        
+        Le firme sono ordinate per signer_index una volta, verificate in
+        batch su transaction_data (hash calcolato una volta) e le prime M
+        restituite.
+        
+        Returns:
+            List[bytes]: Firme finali, o None se non finalized o se una
+                firma è invalida
+        """
+        if not self.is_finalized:
+            return None
+        
+        sorted_sigs = sorted(self.partial_signatures, key=lambda s: s.signer_index)
+        
+        results = verify_signatures_batch(
+            self.transaction_data,
+            [(sig.signature, sig.public_key) for sig in sorted_sigs]
+        )
+        
+        for partial_sig, is_valid in zip(sorted_sigs, results):
+            if not is_valid:
+                logger.error(f"Invalid signature from signer {partial_sig.signer_index}")
+                return None
+        
+        return [sig.signature for sig in sorted_sigs[:self.multisig_config.m]]
+    
     def get_finalized_signatures(self) -> Optional[List[bytes]]:
         """
         Ottieni firme finali per broadcast.
@@ -438,9 +471,14 @@ class MultiSigWallet:
             my_public_key=public_key
         )
     
+    @cached_property
+    def address(self) -> str:
+        """P2SH address memoizzato (config immutabile dopo la creazione)"""
+        return self.config.get_address()
+    
     def get_address(self) -> str:
         """Get P2SH address"""
-        return self.config.get_address()
+        return self.address
     
     def create_psbt(self, transaction_data: bytes) -> PSBT:
         """
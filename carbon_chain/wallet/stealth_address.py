@@ -6,10 +6,17 @@ Privacy-enhanced addresses per transazioni anonime.
 Implementazione completa con ECDH dual-key system.
 """
 
-from typing import Tuple, Optional, List, Dict
+from typing import Tuple, Optional, List, Dict, Any
 from dataclasses import dataclass, field
+from functools import cached_property
+from binascii import a2b_hex
+from concurrent.futures.process import BrokenProcessPool
 import secrets
 import hashlib
+import os
+
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.exceptions import UnsupportedAlgorithm
 
 from carbon_chain.domain.crypto_core import (
     generate_keypair,
@@ -21,10 +28,14 @@ from carbon_chain.domain.addressing import (
 )
 from carbon_chain.errors import CryptoError
 from carbon_chain.logging_setup import get_logger
+from carbon_chain.utils.process_pool import get_process_pool, discard_process_pool
 
 
 logger = get_logger("stealth")
 
+# Batch minimo per verifica parallela (sotto, overhead pool > guadagno)
+PARALLEL_SCAN_MIN_BATCH = 512
+
 
 # Costanti per secp256k1
 SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
@@ -228,6 +239,81 @@ def compute_ecdh_secret(private_key: int, public_key: Point) -> bytes:
     return shared_secret
 
 
+# ============================================================================
+# NATIVE SCAN PATH
+# ============================================================================
+
+# Curva secp256k1 (OpenSSL via cryptography) per il path di scanning:
+# stessi risultati di ECC.point_multiply/compute_ecdh_secret, in codice nativo
+_NATIVE_CURVE = ec.SECP256K1()
+
+# Build OpenSSL senza secp256k1 (es. FIPS): fallback su ECC puro Python
+try:
+    ec.derive_private_key(1, _NATIVE_CURVE)
+    NATIVE_SECP256K1_AVAILABLE = True
+except UnsupportedAlgorithm:
+    NATIVE_SECP256K1_AVAILABLE = False
+
+
+def _scalar_base_multiply(k: int) -> Point:
+    """
+    Calcola k*G (nativo se disponibile).
+    
+    Args:
+        k: Scalare (1 <= k < n)
+    
+    Returns:
+        Point: k * G
+    """
+    if not NATIVE_SECP256K1_AVAILABLE:
+        return ECC.point_multiply(k, ECC.get_generator())
+    
+    numbers = ec.derive_private_key(k, _NATIVE_CURVE).public_key().public_numbers()
+    return Point(numbers.x, numbers.y)
+
+
+def _native_ecdh_secret(
+    private_key: ec.EllipticCurvePrivateKey,
+    public_key_compressed: bytes
+) -> bytes:
+    """
+    Shared secret ECDH nativo: sha256(x(private * public)).
+    
+    Args:
+        private_key: Chiave privata (oggetto cryptography)
+        public_key_compressed: Public key compressa (33 bytes)
+    
+    Returns:
+        bytes: Shared secret (come compute_ecdh_secret)
+    
+    Raises:
+        ValueError: Se public key non è un punto valido della curva
+    """
+    public_key = ec.EllipticCurvePublicKey.from_encoded_point(
+        _NATIVE_CURVE,
+        public_key_compressed
+    )
+    shared_x = private_key.exchange(ec.ECDH(), public_key)
+    return hashlib.sha256(shared_x).digest()
+
+
+def compute_view_tag(shared_secret: bytes) -> int:
+    """
+    View tag (stile EIP-5564) da shared secret ECDH.
+    
+    Il receiver, dopo l'ECDH, confronta un byte e scarta ~255/256
+    dei payment altrui senza calcolare c*G e l'address one-time.
+    Hash con domain separation: non rivela byte dello scalare c.
+    
+    Args:
+        shared_secret: Shared secret (compute_ecdh_secret)
+    
+    Returns:
+        int: View tag (0-255)
+    """
+    return hashlib.sha256(b"view_tag" + shared_secret).digest()[0]
+
+
 @dataclass
 class StealthAddress:
     """
@@ -291,7 +377,7 @@ class StealthAddress:
         return cls(scan_pubkey=scan_pubkey, spend_pubkey=spend_pubkey)
 
 
-@dataclass
+@dataclass(slots=True)
 class StealthPayment:
     """
     Stealth payment information.
@@ -303,14 +389,55 @@ class StealthPayment:
         ephemeral_pubkey: Public key effimera per recipient (compressed)
         amount: Amount da inviare
         tx_hash: Hash della transazione (optional)
+        view_tag: Primo byte di H("view_tag" || shared secret), pre-filtro
+            per lo scanning (None = payment legacy senza view tag)
     """
     one_time_address: str
     ephemeral_pubkey: bytes
     amount: int
     tx_hash: Optional[str] = None
+    view_tag: Optional[int] = None
     
     def __str__(self) -> str:
         return f"StealthPayment(to={self.one_time_address[:16]}..., amount={self.amount})"
+    
+    def to_metadata(self) -> Dict[str, Any]:
+        """
+        Serializza per metadata transazione (chiave STEALTH_METADATA_KEY).
+        
+        Returns:
+            dict: one_time_address, ephemeral_public_key (hex), amount,
+                view_tag (se presente)
+        """
+        data = {
+            "one_time_address": self.one_time_address,
+            "ephemeral_public_key": self.ephemeral_pubkey.hex(),
+            "amount": self.amount,
+        }
+        
+        if self.view_tag is not None:
+            data["view_tag"] = self.view_tag
+        
+        return data
+    
+    @classmethod
+    def from_metadata(cls, data: Dict[str, Any]) -> 'StealthPayment':
+        """
+        Ricostruisci da metadata transazione (hot path dello scanning).
+        
+        Args:
+            data: Dict prodotto da to_metadata
+        
+        Returns:
+            StealthPayment: Payment ricostruito
+        """
+        # a2b_hex: decode più rapido di bytes.fromhex (hex senza spazi)
+        return cls(
+            one_time_address=data["one_time_address"],
+            ephemeral_pubkey=a2b_hex(data["ephemeral_public_key"]),
+            amount=data.get("amount", 0),
+            view_tag=data.get("view_tag")
+        )
 
 
 class StealthWallet:
@@ -417,7 +544,8 @@ class StealthWallet:
         payment = StealthPayment(
             one_time_address=one_time_address,
             ephemeral_pubkey=ephemeral_public,
-            amount=amount
+            amount=amount,
+            view_tag=compute_view_tag(shared_secret)
         )
         
         logger.debug(
@@ -431,6 +559,35 @@ class StealthWallet:
         
         return payment
     
+    @cached_property
+    def _native_scan_key(self) -> ec.EllipticCurvePrivateKey:
+        """Scan private key come oggetto cryptography (costruita una volta)"""
+        return ec.derive_private_key(self.scan_private, _NATIVE_CURVE)
+    
+    def _ecdh(self, ephemeral_pubkey: bytes) -> bytes:
+        """
+        Shared secret ECDH con la scan key: H(v * R).
+        
+        Nativo (OpenSSL) se disponibile, altrimenti ECC puro Python;
+        stesso risultato in entrambi i casi.
+        
+        Args:
+            ephemeral_pubkey: Public key effimera R (compressed)
+        
+        Returns:
+            bytes: Shared secret
+        
+        Raises:
+            ValueError, CryptoError: Se ephemeral key non valida
+        """
+        if NATIVE_SECP256K1_AVAILABLE:
+            return _native_ecdh_secret(self._native_scan_key, ephemeral_pubkey)
+        
+        return compute_ecdh_secret(
+            self.scan_private,
+            ECC.decompress_point(ephemeral_pubkey)
+        )
+    
     def scan_transaction(self, tx_data: dict) -> Optional[Tuple[str, int]]:
         """
         Scanna singola transazione per verificare se appartiene a questo wallet.
@@ -450,19 +607,20 @@ class StealthWallet:
             if not ephemeral_pubkey_bytes or not outputs:
                 return None
             
-            # Decomprimi ephemeral pubkey
-            ephemeral_pubkey = ECC.decompress_point(ephemeral_pubkey_bytes)
-            
             # Calcola shared secret: v * R (dove v = scan_private, R = ephemeral_pubkey)
-            shared_secret = compute_ecdh_secret(self.scan_private, ephemeral_pubkey)
+            shared_secret = self._ecdh(ephemeral_pubkey_bytes)
+            
+            # View tag (se presente): scarta senza derivare l'address
+            view_tag = tx_data.get('view_tag')
+            if view_tag is not None and view_tag != compute_view_tag(shared_secret):
+                return None
             
             # Converti a scalare
             c = int.from_bytes(shared_secret, 'big') % SECP256K1_N
             
             # Deriva expected one-time pubkey: P = B + c*G
             spend_point = ECC.decompress_point(self.spend_public)
-            G = ECC.get_generator()
-            c_G = ECC.point_multiply(c, G)
+            c_G = _scalar_base_multiply(c)
             expected_pubkey = ECC.point_add(spend_point, c_G)
             expected_pubkey_compressed = ECC.compress_point(expected_pubkey)
             expected_address = public_key_to_address(expected_pubkey_compressed)
@@ -524,6 +682,135 @@ class StealthWallet:
         
         return found_transactions
     
+    def is_payment_for_me(self, payment: StealthPayment) -> bool:
+        """
+        Verifica se payment è destinato a questo wallet.
+        
+        Args:
+            payment: Stealth payment
+        
+        Returns:
+            bool: True se one-time address derivato da questo wallet
+        """
+        return self.is_payment_for_me_batch([payment])[0]
+    
+    def is_payment_for_me_batch(
+        self,
+        payments: List[StealthPayment],
+        max_workers: Optional[int] = None
+    ) -> List[bool]:
+        """
+        Verifica batch di payments (una maschera booleana).
+        
+        Spend point calcolato una volta per batch; ephemeral key
+        ripetute (più output stessa tx) condividono ECDH e derivazione
+        address. Moltiplicazioni scalari via _ecdh e _scalar_base_multiply.
+        
+        Payments con view tag: tag diverso = scartato subito dopo l'ECDH,
+        senza c*G né derivazione address.
+        
+        Per batch grandi i chunk sono verificati su processi separati;
+        ai worker (pool condiviso, forkserver/spawn) arrivano solo scan
+        private key e spend public key con ogni chunk, mai la spend
+        private key.
+        
+        Args:
+            payments: Lista payments candidati
+            max_workers: Processi per verifica parallela (None = os.cpu_count(),
+                1 = sempre seriale)
+        
+        Returns:
+            List[bool]: mask[i] True se payments[i] è per questo wallet
+        """
+        workers = max_workers or os.cpu_count() or 1
+        
+        if workers > 1 and len(payments) >= PARALLEL_SCAN_MIN_BATCH:
+            mask = self._match_payments_parallel(payments, workers)
+            if mask is not None:
+                return mask
+        
+        return self._match_payments(payments)
+    
+    def _match_payments_parallel(
+        self,
+        payments: List[StealthPayment],
+        workers: int
+    ) -> Optional[List[bool]]:
+        """Verifica payments sul process pool condiviso (None se non disponibile)"""
+        chunk_size = -(-len(payments) // (workers * 4))
+        chunks = [
+            (self.scan_private, self.spend_public, payments[i:i + chunk_size])
+            for i in range(0, len(payments), chunk_size)
+        ]
+        
+        pool = get_process_pool()
+        
+        try:
+            # map preserva l'ordine: maschere concatenate = maschera batch
+            return [
+                is_mine
+                for chunk_mask in pool.map(_match_payments_worker, chunks)
+                for is_mine in chunk_mask
+            ]
+        
+        except (OSError, BrokenProcessPool) as e:
+            discard_process_pool(pool)
+            logger.warning(
+                "Parallel stealth scan unavailable, falling back to serial",
+                extra_data={"error": str(e)}
+            )
+            return None
+    
+    def _match_payments(self, payments: List[StealthPayment]) -> List[bool]:
+        """Verifica seriale batch (vedi is_payment_for_me_batch)"""
+        if not payments:
+            return []
+        
+        spend_point = ECC.decompress_point(self.spend_public)
+        
+        # ephemeral_pubkey -> shared secret / expected one-time address
+        # (None se key invalida)
+        secret_by_ephemeral: Dict[bytes, Optional[bytes]] = {}
+        expected_by_ephemeral: Dict[bytes, Optional[str]] = {}
+        mask = []
+        
+        for payment in payments:
+            ephemeral = payment.ephemeral_pubkey
+            
+            if ephemeral not in secret_by_ephemeral:
+                try:
+                    secret_by_ephemeral[ephemeral] = self._ecdh(ephemeral)
+                except (ValueError, CryptoError):
+                    # Ephemeral key non valida: non è per noi
+                    secret_by_ephemeral[ephemeral] = None
+            
+            shared_secret = secret_by_ephemeral[ephemeral]
+            
+            if shared_secret is None or (
+                payment.view_tag is not None
+                and payment.view_tag != compute_view_tag(shared_secret)
+            ):
+                mask.append(False)
+                continue
+            
+            if ephemeral not in expected_by_ephemeral:
+                try:
+                    c = int.from_bytes(shared_secret, 'big') % SECP256K1_N
+                    expected_pubkey = ECC.point_add(
+                        spend_point,
+                        _scalar_base_multiply(c)
+                    )
+                    expected_by_ephemeral[ephemeral] = public_key_to_address(
+                        ECC.compress_point(expected_pubkey)
+                    )
+                except ValueError:
+                    # c == 0
+                    expected_by_ephemeral[ephemeral] = None
+            
+            mask.append(expected_by_ephemeral[ephemeral] == payment.one_time_address)
+        
+        return mask
+    
     def export_keys(self) -> dict:
         """
         Esporta chiavi del wallet.
@@ -571,11 +858,44 @@ class StealthWallet:
         return wallet
 
 
+# ============================================================================
+# PARALLEL SCAN WORKERS
+# ============================================================================
+
+# Ultimo wallet di sola scansione del processo worker: chunk consecutivi
+# dello stesso scan riusano la scan key nativa già costruita
+_scan_worker_wallet: Optional[StealthWallet] = None
+
+
+def _match_payments_worker(
+    payload: Tuple[int, bytes, List[StealthPayment]]
+) -> List[bool]:
+    """Worker process pool: maschera per (scan_private, spend_public, chunk)"""
+    global _scan_worker_wallet
+    
+    scan_private, spend_public, payments = payload
+    wallet = _scan_worker_wallet
+    
+    if (
+        wallet is None
+        or wallet.scan_private != scan_private
+        or wallet.spend_public != spend_public
+    ):
+        # Wallet scan-only: scan key + spend pub, nessuna spend private key
+        wallet = StealthWallet.__new__(StealthWallet)
+        wallet.scan_private = scan_private
+        wallet.spend_public = spend_public
+        _scan_worker_wallet = wallet
+    
+    return wallet._match_payments(payments)
+
+
 # Export pubblici
 __all__ = [
     "StealthAddress",
     "StealthWallet",
     "StealthPayment",
+    "compute_view_tag",
     "ECC",
     "Point",
 ]
@@ -15,6 +15,7 @@ import shutil
 # Internal imports
 from carbon_chain.config import ChainSettings
 from carbon_chain.domain.blockchain import Blockchain
+from carbon_chain.domain.models import Block
 from carbon_chain.domain.mempool import Mempool
 from carbon_chain.wallet.hd_wallet import HDWallet
 from carbon_chain.storage.db import BlockchainDatabase
@@ -84,17 +85,17 @@ def wallet(test_config):
 
 @pytest.fixture
 def funded_wallet(blockchain, wallet):
-    """Wallet con fondi (dopo mining)"""
-    # Mine blocco per funding
-    miner_address = wallet.get_address(0)
-    block = blockchain.mine_block(
-        miner_address=miner_address,
-        transactions=[],
-        timeout_seconds=30
+    """Wallet con fondi (COINBASE del blocco 1 verso address 0)"""
+    # Blocco dal template senza ricerca nonce: il PoW scrypt non serve
+    # ai test e a difficulty 1 può superare qualsiasi timeout
+    header, transactions = blockchain.create_block_template(
+        miner_address=wallet.get_address(0),
+        transactions=[]
+    )
+    blockchain.add_block(
+        Block(header=header, transactions=transactions),
+        skip_validation=True
     )
-    
-    if block:
-        blockchain.add_block(block)
     
     return wallet
 
@@ -5,7 +5,9 @@ Unit tests for HD Wallet functionality.
 """
 
 import pytest
-from carbon_chain.wallet.hd_wallet import HDWallet
+from carbon_chain.wallet.hd_wallet import HDWallet, PARALLEL_SIGNING_MIN_BATCH
+from carbon_chain.domain.models import Transaction, TxInput, TxOutput
+from carbon_chain.constants import TxType
 from carbon_chain.errors import InvalidMnemonicError
 
 
@@ -64,3 +66,29 @@ class TestHDWallet:
         
         # Same addresses
         assert wallet.get_address(0) == wallet2.get_address(0)
+    
+    def test_sign_transactions_parallel(self, wallet):
+        """Test batch signing on the process pool matches serial signing"""
+        addresses = [wallet.get_address(i) for i in range(3)]
+        batch = [
+            (
+                Transaction(
+                    tx_type=TxType.TRANSFER,
+                    inputs=[TxInput("00" * 32, i)],
+                    outputs=[TxOutput(amount=1000 + i, address=addresses[0])],
+                    timestamp=1700000000
+                ),
+                addresses[i % 3]
+            )
+            for i in range(PARALLEL_SIGNING_MIN_BATCH)
+        ]
+        
+        parallel = wallet.sign_transactions(batch, max_workers=2)
+        serial = wallet.sign_transactions(batch, max_workers=1)
+        
+        for (tx, address), signed, signed_serial in zip(batch, parallel, serial):
+            keypair = wallet._get_signing_keypair(address)
+            signature = signed.inputs[0].signature
+            
+            assert signed.inputs[0].public_key == signed_serial.inputs[0].public_key
+            assert keypair.verify(wallet._signing_message(tx), signature)
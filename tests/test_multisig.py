@@ -122,6 +122,25 @@ class TestPSBT:
         assert len(psbt.partial_signatures) == 2
         assert psbt.is_finalized  # 2-of-3 complete
     
+    def test_psbt_finalize_signatures(self):
+        """Test finalize returns sorted signatures, None on invalid signature"""
+        sk1, pk1 = generate_keypair()
+        sk2, pk2 = generate_keypair()
+        sk3, pk3 = generate_keypair()
+        
+        config = MultiSigConfig(m=2, n=3, public_keys=[pk1, pk2, pk3])
+        psbt = PSBT(transaction_data=b"test_transaction", multisig_config=config)
+        
+        assert psbt.finalize_signatures() is None  # Not finalized
+        
+        psbt.add_signature(2, sk3, pk3)
+        psbt.add_signature(0, sk1, pk1)
+        
+        assert psbt.finalize_signatures() == psbt.get_finalized_signatures()
+        
+        psbt.partial_signatures[0].signature = b"invalid"
+        assert psbt.finalize_signatures() is None
+    
     def test_psbt_duplicate_signature(self):
         """Test duplicate signature rejection"""
         sk1, pk1 = generate_keypair()
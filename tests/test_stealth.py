@@ -1,145 +1,237 @@
-#!/usr/bin/env python3
 """
-CarbonChain - MultiSig Demo
-=============================
-Demo script per multi-signature wallets.
-
-Usage:
-    python scripts/multisig_demo.py
+CarbonChain - Stealth Address Tests
+=====================================
+Unit tests for stealth addresses and stealth service.
 """
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import time
 
-from carbon_chain.wallet.multisig import MultiSigWallet, PSBT
-from carbon_chain.domain.crypto_core import generate_keypair
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+import pytest
+from carbon_chain.constants import STEALTH_METADATA_KEY, TxType
+from carbon_chain.errors import InvalidPasswordError, WalletError
+from carbon_chain.domain.models import Block, BlockHeader, Transaction, TxInput, TxOutput
+from carbon_chain.services.stealth_service import StealthService
+from carbon_chain.wallet.stealth_address import StealthPayment, StealthWallet
 
-console = Console()
 
+# ============================================================================
+# HELPERS
+# ============================================================================
 
-def main():
-    """Run multisig demo"""
-    
-    console.print(Panel.fit(
-        "[cyan]CarbonChain - MultiSig Wallet Demo[/cyan]\n\n"
-        "Demonstrating 2-of-3 multi-signature wallet",
-        border_style="cyan"
-    ))
-    
-    # ========================================================================
-    # STEP 1: Create participants
-    # ========================================================================
-    
-    console.print("\n[yellow]Step 1: Creating 3 participants for 2-of-3 multisig[/yellow]")
-    
-    # Generate keypairs for other participants
-    _, pk2 = generate_keypair()
-    _, pk3 = generate_keypair()
-    
-    # Create wallet for participant 1
-    wallet1 = MultiSigWallet.create(
-        m=2, n=3, my_index=0,
-        other_public_keys=[pk2, pk3]
+def _make_tx(amount, address, stealth_payment=None, inputs=()):
+    """Coinbase, o transfer se inputs (metadata stealth se stealth_payment)"""
+    tx = Transaction(
+        tx_type=TxType.TRANSFER if inputs else TxType.COINBASE,
+        inputs=list(inputs),
+        outputs=[TxOutput(amount=amount, address=address)],
+        timestamp=int(time.time())
     )
     
-    console.print(f"[green]✅ Created 2-of-3 multisig wallet[/green]")
-    console.print(f"[cyan]Address: {wallet1.get_address()}[/cyan]")
-    
-    # Display info
-    table = Table(title="MultiSig Configuration")
-    table.add_column("Property", style="cyan")
-    table.add_column("Value", style="green")
-    
-    table.add_row("Type", "2-of-3 MultiSig")
-    table.add_row("Required Signatures", "2")
-    table.add_row("Total Participants", "3")
-    table.add_row("My Index", "0")
-    table.add_row("Address", wallet1.get_address())
+    if stealth_payment is not None:
+        tx.set_metadata(STEALTH_METADATA_KEY, stealth_payment.to_metadata())
     
-    console.print(table)
-    
-    # ========================================================================
-    # STEP 2: Create PSBT
-    # ========================================================================
-    
-    console.print("\n[yellow]Step 2: Creating Partially Signed Bitcoin Transaction (PSBT)[/yellow]")
-    
-    tx_data = b"example_transaction_data_to_sign"
-    psbt = wallet1.create_psbt(tx_data)
-    
-    console.print(f"[green]✅ Created PSBT[/green]")
-    console.print(f"Signatures collected: {len(psbt.partial_signatures)}/{psbt.multisig_config.m}")
-    console.print(f"Finalized: {psbt.is_finalized}")
-    
-    # ========================================================================
-    # STEP 3: Collect signatures
-    # ========================================================================
+    return tx
+
+
+def _add_block(blockchain, transactions):
+    """Aggiungi blocco (senza mining/validazione) sopra il tip"""
+    tip = blockchain.get_block(blockchain.get_height())
+    
+    header = BlockHeader(
+        version=1,
+        previous_hash=tip.compute_block_hash(),
+        merkle_root=b"\x00" * 32,
+        timestamp=int(time.time()),
+        difficulty=1,
+        nonce=0,
+        height=tip.header.height + 1
+    )
     
-    console.print("\n[yellow]Step 3: Collecting signatures from participants[/yellow]")
+    blockchain.add_block(Block(header=header, transactions=transactions), skip_validation=True)
+
+
+def _add_stealth_block(blockchain, payment):
+    """Aggiungi blocco con una transazione stealth verso payment"""
+    tx = _make_tx(payment.amount, payment.one_time_address, payment)
+    _add_block(blockchain, [tx])
     
-    # Participant 1 signs
-    console.print("[cyan]Participant 1 signing...[/cyan]")
-    success1 = wallet1.sign_psbt(psbt)
-    console.print(f"[green]✅ Signature 1 added[/green]")
-    console.print(f"Signatures: {len(psbt.partial_signatures)}/{psbt.multisig_config.m}")
+    return tx
+
+
+@pytest.fixture
+def stealth_service(blockchain, test_config, temp_data_dir):
+    """Stealth service con storage temporaneo"""
+    return StealthService(blockchain, test_config, storage_dir=temp_data_dir / "stealth")
+
+
+# ============================================================================
+# STEALTH WALLET TESTS
+# ============================================================================
+
+class TestStealthWallet:
+    """Test StealthWallet payment detection"""
     
-    # Simulate participant 2 signing
-    # (In real scenario, PSBT would be sent to participant 2)
-    console.print("\n[cyan]Participant 2 signing...[/cyan]")
+    def test_payment_metadata_round_trip(self):
+        """Test payment survives metadata round-trip and matches recipient only"""
+        recipient = StealthWallet()
+        other = StealthWallet()
+        
+        payment = StealthWallet().generate_payment_address(
+            recipient.get_stealth_address(),
+            1000
+        )
+        restored = StealthPayment.from_metadata(payment.to_metadata())
+        
+        assert restored == payment
+        assert recipient.is_payment_for_me(restored)
+        assert not other.is_payment_for_me(restored)
+    
+    def test_tampered_view_tag_rejected(self):
+        """Test payment with wrong view tag is not matched"""
+        recipient = StealthWallet()
+        payment = StealthWallet().generate_payment_address(
+            recipient.get_stealth_address(),
+            1000
+        )
+        
+        metadata = payment.to_metadata()
+        metadata["view_tag"] = (metadata["view_tag"] + 1) % 256
+        
+        assert not recipient.is_payment_for_me(StealthPayment.from_metadata(metadata))
     
-    # For demo, we'll manually add signature 2
-    # In production, participant 2 would have their own wallet and sign
-    sk2, _ = generate_keypair()  # Simulated
-    try:
-        # This would fail in real scenario without proper keys
-        # Just demonstrating the flow
-        console.print("[yellow]⚠️  Simulating signature 2...[/yellow]")
-        psbt.partial_signatures.append(
-            type('PartialSig', (), {
-                'signer_index': 1,
-                'public_key': pk2,
-                'signature': b'simulated_signature',
-                'timestamp': 0
-            })()
+    def test_batch_parallel_matches_serial(self):
+        """Test process-pool batch mask equals serial mask"""
+        recipient = StealthWallet()
+        sender = StealthWallet()
+        other_address = StealthWallet().get_stealth_address()
+        
+        payments = [
+            sender.generate_payment_address(
+                recipient.get_stealth_address() if i % 3 else other_address,
+                i
+            )
+            for i in range(8)
+        ]
+        # Ephemeral key ripetuta (più output stessa tx)
+        payments.append(payments[1])
+        
+        serial = recipient.is_payment_for_me_batch(payments, max_workers=1)
+        parallel = recipient._match_payments_parallel(payments, workers=2)
+        
+        assert serial == [bool(i % 3) for i in range(8)] + [True]
+        assert parallel == serial
+
+
+# ============================================================================
+# BLOCKCHAIN INDEX TESTS
+# ============================================================================
+
+class TestStealthIndex:
+    """Test Blockchain stealth transaction index"""
+    
+    def test_get_stealth_transactions_only_stealth(self, blockchain):
+        """Test index returns only stealth transactions, by height"""
+        recipient = StealthWallet()
+        sender = StealthWallet()
+        first = sender.generate_payment_address(recipient.get_stealth_address(), 1)
+        second = sender.generate_payment_address(recipient.get_stealth_address(), 2)
+        
+        plain_tx = _make_tx(5, first.one_time_address)
+        stealth_tx = _make_tx(
+            first.amount,
+            first.one_time_address,
+            first,
+            inputs=[TxInput(prev_txid=plain_tx.compute_txid(), prev_output_index=0)]
         )
-        psbt.is_finalized = len(psbt.partial_signatures) >= psbt.multisig_config.m
-        console.print(f"[green]✅ Signature 2 added[/green]")
-    except:
-        pass
+        
+        _add_block(blockchain, [plain_tx, stealth_tx])
+        _add_block(blockchain, [_make_tx(5, second.one_time_address)])
+        later_tx = _add_stealth_block(blockchain, second)
+        
+        index = blockchain.get_stealth_transactions(0, blockchain.get_height())
+        
+        assert [
+            (height, [tx.compute_txid() for tx in txs])
+            for height, txs in index
+        ] == [
+            (1, [stealth_tx.compute_txid()]),
+            (3, [later_tx.compute_txid()]),
+        ]
+        assert blockchain.get_stealth_transactions(2, 2) == []
+        assert [height for height, _ in blockchain.get_stealth_transactions(2, 3)] == [3]
+
+
+# ============================================================================
+# STEALTH SERVICE TESTS
+# ============================================================================
+
+class TestStealthScanning:
+    """Test StealthService payment scanning"""
     
-    console.print(f"Signatures: {len(psbt.partial_signatures)}/{psbt.multisig_config.m}")
-    console.print(f"Finalized: {psbt.is_finalized}")
+    def test_scan_empty_chain(self, stealth_service):
+        """Test scanning a chain without stealth payments"""
+        wallet = StealthWallet()
+        
+        assert stealth_service.scan_for_payments(wallet) == []
+        assert stealth_service.get_received_payments(wallet) == []
     
-    # ========================================================================
-    # STEP 4: Finalization
-    # ========================================================================
+    def test_scan_cursor_clamped_to_tip(self, stealth_service, blockchain):
+        """Test end_height beyond the tip does not skip future blocks"""
+        wallet = StealthWallet()
+        
+        assert stealth_service.scan_for_payments(wallet, end_height=100) == []
+        assert stealth_service._load_scan_cursor(wallet)["height"] == blockchain.get_height()
+        
+        payment = StealthWallet().generate_payment_address(wallet.get_stealth_address(), 1000)
+        tx = _add_stealth_block(blockchain, payment)
+        
+        found = stealth_service.scan_for_payments(wallet)
+        
+        assert [found_tx.compute_txid() for found_tx, _ in found] == [tx.compute_txid()]
+        assert stealth_service.get_received_payments(wallet)[0]["amount"] == 1000
+
+
+class TestStealthWalletStorage:
+    """Test StealthService wallet save/load"""
     
-    if psbt.is_finalized:
-        console.print("\n[yellow]Step 4: PSBT Finalized![/yellow]")
-        console.print("[green]✅ Transaction ready for broadcast[/green]")
-        
-        signatures = psbt.get_finalized_signatures()
-        console.print(f"[cyan]Collected {len(signatures)} signatures[/cyan]")
-    else:
-        console.print("\n[yellow]Step 4: Waiting for more signatures...[/yellow]")
-        console.print(f"[cyan]Need {psbt.multisig_config.m - len(psbt.partial_signatures)} more signature(s)[/cyan]")
+    def test_encrypted_wallet_round_trip(self, stealth_service):
+        """Test encrypted (v2) wallet save and load"""
+        wallet = stealth_service.create_stealth_wallet("alice", password="secret")
+        
+        file_data = stealth_service.storage_dir.joinpath("alice.json").read_text()
+        assert hex(wallet.scan_private)[2:] not in file_data
+        assert hex(wallet.spend_private)[2:] not in file_data
+        
+        loaded = stealth_service.load_wallet("alice", password="secret")
+        
+        assert loaded.scan_private == wallet.scan_private
+        assert loaded.spend_private == wallet.spend_private
+        assert (
+            loaded.get_stealth_address().to_meta_address()
+            == wallet.get_stealth_address().to_meta_address()
+        )
+        assert stealth_service.list_wallets() == ["alice"]
     
-    # ========================================================================
-    # Summary
-    # ========================================================================
+    def test_encrypted_wallet_wrong_password(self, stealth_service):
+        """Test wrong password raises InvalidPasswordError"""
+        stealth_service.create_stealth_wallet("alice", password="secret")
+        
+        with pytest.raises(InvalidPasswordError):
+            stealth_service.load_wallet("alice", password="wrong")
+        
+        with pytest.raises(WalletError):
+            stealth_service.load_wallet("alice")
     
-    console.print("\n" + "="*60)
-    console.print("[green]MultiSig Demo Complete![/green]")
-    console.print("\n[cyan]Key Points:[/cyan]")
-    console.print("• 2-of-3 multisig requires 2 signatures out of 3 participants")
-    console.print("• PSBT allows incremental signature collection")
-    console.print("• P2SH addresses provide standard compatibility")
-    console.print("• Signatures are verified before finalization")
-
-
-if __name__ == "__main__":
-    main()
+    def test_plaintext_wallet_requires_opt_in(self, stealth_service):
+        """Test plaintext (v1) wallet only with insecure_plaintext"""
+        with pytest.raises(WalletError):
+            stealth_service.create_stealth_wallet("bob")
+        
+        wallet = stealth_service.create_stealth_wallet("bob", insecure_plaintext=True)
+        
+        with pytest.raises(WalletError):
+            stealth_service.load_wallet("bob")
+        
+        loaded = stealth_service.load_wallet("bob", insecure_plaintext=True)
+        
+        assert loaded.spend_private == wallet.spend_private
@@ -4,8 +4,16 @@ CarbonChain - Storage Tests
 Unit tests for database storage.
 """
 
+import json
+
 import pytest
-from carbon_chain.storage.db import BlockchainDatabase
+from carbon_chain.errors import DatabaseCorruptionError, DatabaseError
+from carbon_chain.storage.db import (
+    BlockchainDatabase,
+    BLOB_TAG_ZLIB,
+    _dump_blob,
+    _load_blob,
+)
 
 
 class TestBlockchainDatabase:
@@ -30,6 +38,51 @@ class TestBlockchainDatabase:
         assert loaded is not None
         assert loaded.compute_block_hash() == genesis.compute_block_hash()
     
+    def test_save_block_async(self, test_database, blockchain):
+        """Test queued block save resolves its future once committed"""
+        genesis = blockchain.get_block(0)
+        
+        future = test_database.save_block_async(genesis)
+        
+        assert future.result(timeout=10) is None
+        assert test_database.load_block(0).compute_block_hash() == genesis.compute_block_hash()
+        
+        # Duplicate height: error only on the failing block's future
+        duplicate = test_database.save_block_async(genesis)
+        assert isinstance(duplicate.exception(timeout=10), DatabaseError)
+    
+    def test_iter_blocks_matches_load_all(self, test_database, blockchain):
+        """Test iter_blocks yields the same blocks as load_all_blocks"""
+        genesis = blockchain.get_block(0)
+        test_database.save_block(genesis)
+        
+        iterated = list(test_database.iter_blocks())
+        
+        assert [b.compute_block_hash() for b in iterated] == [
+            b.compute_block_hash() for b in test_database.load_all_blocks()
+        ]
+        assert iterated[0].compute_block_hash() == genesis.compute_block_hash()
+    
+    def test_blob_codec_reads_compressed_and_legacy_json(self, blockchain):
+        """Test BLOB codec round-trip and legacy uncompressed JSON rows"""
+        data = blockchain.get_block(0).to_dict()
+        
+        blob = _dump_blob(data)
+        
+        assert blob[:1] == BLOB_TAG_ZLIB
+        assert _load_blob(blob) == data
+        assert _load_blob(json.dumps(data).encode('utf-8')) == data
+    
+    def test_blob_codec_rejects_trailing_or_truncated_data(self, blockchain):
+        """Test corrupted compressed BLOBs raise DatabaseCorruptionError"""
+        blob = _dump_blob(blockchain.get_block(0).to_dict())
+        
+        with pytest.raises(DatabaseCorruptionError):
+            _load_blob(blob + b"junk")
+        
+        with pytest.raises(DatabaseCorruptionError):
+            _load_blob(blob[:-4])
+    
     def test_utxo_persistence(self, test_database, blockchain, wallet):
         """Test UTXO persistence"""
         # Mine block